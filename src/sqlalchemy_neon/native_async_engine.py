@@ -8,15 +8,29 @@ It compiles SQLAlchemy Core statements and executes them directly through
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
+import operator
 import re
-from typing import Any, Awaitable, Callable, Literal, Mapping, Sequence
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Literal,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
 
 import aiohttp
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine.interfaces import Compiled
 from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
 from sqlalchemy.inspection import inspect as sa_inspect
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql import ClauseElement
+from sqlalchemy.util import LRUCache
 
 from sqlalchemy_neon.neon_http_client import IsolationLevel
 
@@ -32,18 +46,36 @@ from .types import TypeConverter
 _PYFORMAT_TOKEN = re.compile(r"%\(([^)]+)\)s")
 _TYPE_CONVERTER = TypeConverter()
 _PgDialect = postgresql.psycopg.PGDialect_psycopg
+# Dialects are stateless for compilation purposes; build them once.
+_DIALECT = _PgDialect()
+_PYFORMAT_DIALECT = _PgDialect(paramstyle="pyformat")
 _NO_DEFAULT = object()
+_SERVER_DEFAULT = object()
+_PREPARER = _DIALECT.identifier_preparer
+# PostgreSQL caps a single statement at 65535 bind parameters.
+_MAX_BIND_PARAMS = 65535
+# relationship(lazy=...) values loaded up front; "immediate" has no batched
+# form of its own, so it is served like "selectin".
+_EAGER_LAZY = {"selectin": "selectin", "joined": "joined", "subquery": "subquery"}
+_EAGER_LAZY["immediate"] = "selectin"
+# Loader options that leave a relationship unloaded.
+_LAZY_OPT_OUT = frozenset({"select", "noload", "raise", "raise_on_sql"})
 
 
 def _coerce_param_mapping(
     compiled: Any,
     parameters: Mapping[str, Any] | Sequence[Any] | None,
+    extracted_parameters: Sequence[Any] | None = None,
 ) -> Mapping[str, Any]:
     if parameters is None:
-        return compiled.params
+        if extracted_parameters is None:
+            return compiled.params
+        return compiled.construct_params(extracted_parameters=extracted_parameters)
 
     if isinstance(parameters, Mapping):
-        return compiled.construct_params(parameters)
+        return compiled.construct_params(
+            parameters, extracted_parameters=extracted_parameters
+        )
 
     if compiled.positiontup is None:
         raise TypeError("Positional parameters require compiled.positiontup metadata")
@@ -56,49 +88,459 @@ def _coerce_param_mapping(
     return dict(zip(compiled.positiontup, parameters))
 
 
-def _pyformat_to_numeric(
-    sql: str,
-    values: Mapping[str, Any],
-) -> tuple[str, list[Any]]:
+def _pyformat_template(sql: str) -> tuple[str, list[str]]:
+    """Rewrite ``%(name)s`` binds to ``$n``; return the SQL and bind order."""
     bound: dict[str, int] = {}
-    ordered_values: list[Any] = []
 
     def replace(match: re.Match[str]) -> str:
         key = match.group(1)
-        if key not in values:
-            raise KeyError(f"Missing value for SQL bind parameter '{key}'")
-
         if key not in bound:
-            bound[key] = len(ordered_values) + 1
-            ordered_values.append(values[key])
-
+            bound[key] = len(bound) + 1
         return f"${bound[key]}"
 
     converted_sql = _PYFORMAT_TOKEN.sub(replace, sql)
-    return converted_sql, ordered_values
+    return converted_sql, list(bound)
+
+
+def _ordered_values(keys: Sequence[str], values: Mapping[str, Any]) -> list[Any]:
+    try:
+        return [values[key] for key in keys]
+    except KeyError as e:
+        raise KeyError(f"Missing value for SQL bind parameter '{e.args[0]}'") from None
+
+
+def _pyformat_to_numeric(
+    sql: str,
+    values: Mapping[str, Any],
+) -> tuple[str, list[Any]]:
+    converted_sql, keys = _pyformat_template(sql)
+    return converted_sql, _ordered_values(keys, values)
 
 
 def compile_sql(
     statement: str | ClauseElement,
     parameters: Mapping[str, Any] | Sequence[Any] | None = None,
+    *,
+    compiled_cache: MutableMapping[Any, Any] | None = None,
 ) -> tuple[str, list[Any]]:
-    """Compile a SQLAlchemy Core statement into Neon HTTP SQL + parameters."""
+    """Compile a SQLAlchemy Core statement into Neon HTTP SQL + parameters.
+
+    With ``compiled_cache``, statements are cached by SQLAlchemy cache key so
+    repeated shapes skip compilation and bind rewriting; only the bound
+    values are extracted per call. Statements with expanding (``IN``) binds
+    render differently per value count and are always compiled.
+    """
+    _, sql, params = _compile_statement(
+        statement, parameters, compiled_cache=compiled_cache
+    )
+    return sql, params
+
+
+def _compile_statement(
+    statement: str | ClauseElement,
+    parameters: Mapping[str, Any] | Sequence[Any] | None = None,
+    *,
+    compiled_cache: MutableMapping[Any, Any] | None = None,
+) -> tuple[Compiled | None, str, list[Any]]:
+    """:func:`compile_sql`, also returning the (possibly cached) ``Compiled``.
+
+    The ``Compiled`` is None for string SQL. Results use it for their column
+    types, so reading a result never compiles the statement a second time.
+    """
     if isinstance(statement, str):
         if parameters is None:
-            return statement, []
+            return None, statement, []
 
         if isinstance(parameters, Mapping):
             raise TypeError(
                 "String SQL requires positional parameters (list/tuple) with $1 binds"
             )
-        return statement, list(parameters)
+        return None, statement, list(parameters)
+
+    cache_key = None
+    if compiled_cache is not None:
+        cache_key = statement._generate_cache_key()
+        if cache_key is not None and any(
+            bind.expanding or bind.literal_execute for bind in cache_key.bindparams
+        ):
+            cache_key = None
+
+    entry = compiled_cache.get(cache_key.key) if cache_key is not None else None
+    if entry is None:
+        compiled = statement.compile(
+            dialect=_PYFORMAT_DIALECT,
+            cache_key=cache_key,
+            compile_kwargs={"render_postcompile": True},
+        )
+        entry = (compiled, *_pyformat_template(str(compiled)))
+        if cache_key is not None:
+            compiled_cache[cache_key.key] = entry
+
+    compiled, sql, keys = entry
+    mapping = _coerce_param_mapping(
+        compiled,
+        parameters,
+        cache_key.bindparams if cache_key is not None else None,
+    )
+    return compiled, sql, _ordered_values(keys, mapping)
+
+
+@functools.lru_cache(maxsize=256)
+def _bulk_insert_template(
+    table: sa.Table,
+    columns: tuple[sa.Column[Any], ...],
+    returning: tuple[sa.Column[Any], ...] | None = None,
+) -> tuple[str, str]:
+    """The parts of a bulk ``INSERT`` around its ``VALUES`` rows.
+
+    Keyed on the statement shape alone, not the row count, so the cache
+    holds one short entry per shape however many rows a batch carries.
+    """
+    width = len(columns)
+    aliases = "".join(f"p{i}, " for i in range(width))
+    # A table whose every column takes its default inserts zero columns.
+    target = select = ""
+    if columns:
+        target = " (" + ", ".join(_PREPARER.quote(col.name) for col in columns) + ")"
+        select = " " + ", ".join(
+            f"p{i}::{col.type.compile(dialect=_DIALECT)}"
+            for i, col in enumerate(columns)
+        )
+    returning_list = ", ".join(
+        _PREPARER.format_column(col) for col in returning or table.columns
+    )
+    head = f"INSERT INTO {_PREPARER.format_table(table)}{target} SELECT{select} "
+    tail = f") AS sentinel({aliases}sen_counter) ORDER BY sen_counter "
+    return head + "FROM (VALUES ", tail + f"RETURNING {returning_list}"
+
+
+def _render_bulk_insert(
+    table: sa.Table,
+    columns: tuple[sa.Column[Any], ...],
+    n_rows: int,
+    returning: tuple[sa.Column[Any], ...] | None = None,
+) -> str:
+    """Render a multi-row ``INSERT ... SELECT ... RETURNING`` with ``$n`` binds.
+
+    The rows are a ``VALUES`` list numbered by a sentinel counter and
+    inserted ``ORDER BY`` that counter, so generated keys follow the input
+    order (see :func:`_returning_order`). Parameters are numbered row-major
+    and cast to each column's type, as the ``VALUES`` list leaves them
+    untyped. ``returning`` defaults to every column of ``table``.
+    Only the text around the rows is cached; the rows themselves are
+    rendered per call, as their length grows with the batch.
+    """
+    head, tail = _bulk_insert_template(table, columns, returning)
+    width = len(columns)
+    placeholders = itertools.count(1)
+    values = ", ".join(
+        "(" + "".join(f"${next(placeholders)}, " for _ in range(width)) + f"{n})"
+        for n in range(n_rows)
+    )
+    return head + values + tail
+
 
-    compiled = statement.compile(
-        dialect=_PgDialect(paramstyle="pyformat"),
-        compile_kwargs={"render_postcompile": True},
+def _default_caller(default: Any) -> Callable[[], Any] | None:
+    """Return a zero-argument callable producing a column's Python default.
+
+    SQLAlchemy normalizes callable defaults to accept an execution context
+    when the column is defined, so the call shape is known up front.
+    """
+    if default is None:
+        return None
+
+    if getattr(default, "is_scalar", False):
+        value = default.arg
+        return lambda: value
+
+    if getattr(default, "is_callable", False):
+        return functools.partial(default.arg, None)
+
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _insert_columns(
+    table: sa.Table,
+) -> tuple[
+    Callable[[Any], tuple[Any, ...]],
+    tuple[sa.Column[Any], ...],
+    tuple[Callable[[], Any] | None, ...],
+]:
+    """Return the columns ``add_all`` may bind for ``table``.
+
+    Alongside the columns come a getter reading every such attribute from an
+    instance in one ``operator.attrgetter`` call (always returning a tuple)
+    and each column's Python default caller, if any.
+    """
+    columns = tuple(
+        column
+        for column in table.columns
+        if not (column.primary_key and column.autoincrement)
     )
-    mapping = _coerce_param_mapping(compiled, parameters)
-    return _pyformat_to_numeric(str(compiled), mapping)
+    default_callers = tuple(_default_caller(column.default) for column in columns)
+    keys = [column.key for column in columns]
+    if len(keys) == 1:
+        single = operator.attrgetter(keys[0])
+        return (lambda instance: (single(instance),)), columns, default_callers
+    if not keys:
+        return (lambda instance: ()), columns, default_callers
+    return operator.attrgetter(*keys), columns, default_callers
+
+
+@functools.lru_cache(maxsize=256)
+def _returning_columns(mapper: Any) -> tuple[sa.Column[Any], ...]:
+    """Columns ``add_all`` reads back for instances of ``mapper``.
+
+    Every column, so server defaults land on the instance, unless the mapper
+    opts out with ``eager_defaults=False``; then only the primary key comes
+    back, as with the ORM's unit of work. Python defaults for columns left
+    out here are written onto the instance when the INSERT is built.
+    """
+    table = mapper.local_table
+    if mapper.eager_defaults is False:
+        return tuple(table.primary_key.columns)
+    return tuple(table.columns)
+
+
+@functools.lru_cache(maxsize=256)
+def _delete_by_primary_key(table: Any) -> tuple[ClauseElement, tuple[str, ...]]:
+    """Prebuilt ``DELETE`` by primary key for ``table``.
+
+    A single-column key is matched with ``<pk> = ANY(:pks)``, so one
+    statement deletes any number of rows and its SQL does not depend on how
+    many. Composite keys are matched with ``<pk> = :pk_<key>`` per column,
+    one row per statement. Built once per table so ``delete_all`` skips
+    statement construction and every call shares one compiled-cache entry.
+
+    Raises:
+        ValueError: If the table has no primary key.
+    """
+    pk_cols = list(table.primary_key)
+    if not pk_cols:
+        raise ValueError("Cannot delete instance without primary key columns")
+    if len(pk_cols) == 1:
+        pk_col = pk_cols[0]
+        pks = sa.bindparam("pks", type_=postgresql.ARRAY(pk_col.type))
+        return sa.delete(table).where(pk_col == sa.any_(pks)), (pk_col.key,)
+    criteria = [pk_col == sa.bindparam(f"pk_{pk_col.key}") for pk_col in pk_cols]
+    return (
+        sa.delete(table).where(sa.and_(*criteria)),
+        tuple(pk_col.key for pk_col in pk_cols),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _returning_keys(
+    returning: tuple[sa.Column[Any], ...],
+) -> tuple[tuple[str, ...], tuple[tuple[str, tuple[str, ...]], ...]]:
+    """Attribute keys for ``RETURNING`` rows of the ``returning`` columns.
+
+    Returns the keys in column order, for positional rows, and each key with
+    the names it may come back under, for mapping rows.
+    """
+    keys = tuple(column.key for column in returning)
+    candidates = tuple(
+        (
+            column.key,
+            (column.key, column.name, f"{column.table.name}_{column.name}"),
+        )
+        for column in returning
+    )
+    return keys, candidates
+
+
+@functools.lru_cache(maxsize=256)
+def _returning_processors(
+    returning: tuple[sa.Column[Any], ...],
+) -> tuple[Callable[[Any], Any] | None, ...]:
+    """Result processor per ``returning`` column, resolved once per tuple.
+
+    ``RETURNING`` rows skip SQLAlchemy's result handling, so Enum,
+    TypeDecorator and similar values are converted with these instead.
+    """
+    return tuple(column.type.result_processor(_DIALECT, None) for column in returning)
+
+
+def _process_returned(processor: Callable[[Any], Any] | None, value: Any) -> Any:
+    if processor is None or value is None:
+        return value
+    try:
+        return processor(value)
+    except Exception:
+        # Rows may already be converted by the HTTP layer.
+        return value
+
+
+def _returned_value(
+    row: Sequence[Any] | Mapping[str, Any],
+    returning: tuple[sa.Column[Any], ...],
+    index: int,
+) -> Any:
+    """Processed value of ``returning[index]`` in a ``RETURNING`` row."""
+    if isinstance(row, Mapping):
+        for candidate in _returning_keys(returning)[1][index][1]:
+            if candidate in row:
+                value = row[candidate]
+                break
+        else:
+            return None
+    else:
+        value = row[index]
+    return _process_returned(_returning_processors(returning)[index], value)
+
+
+@functools.lru_cache(maxsize=256)
+def _returning_order(
+    table: sa.Table, returning: tuple[sa.Column[Any], ...]
+) -> int | None:
+    """Position in ``returning`` of ``table``'s generated integer key.
+
+    A bulk insert draws that key from its sequence in sentinel order, so
+    sorting the ``RETURNING`` rows by it lines them up with the input rows
+    whatever order the server sends them in. None if there is no such key.
+    """
+    column = table.autoincrement_column
+    for index, candidate in enumerate(returning):
+        if candidate is column:
+            return index
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _returning_key(
+    table: sa.Table, returning: tuple[sa.Column[Any], ...]
+) -> tuple[tuple[int, ...], tuple[int, ...]] | None:
+    """Positions of a client-bound primary key for matching ``RETURNING`` rows.
+
+    Returns the key's positions among ``_insert_columns(table)`` and in
+    ``returning``, or None unless every key column is in both.
+    """
+    _, columns, _ = _insert_columns(table)
+    bound: list[int] = []
+    returned: list[int] = []
+    for pk_col in table.primary_key:
+        positions = [
+            next((i for i, col in enumerate(cols) if col is pk_col), None)
+            for cols in (columns, returning)
+        ]
+        if None in positions:
+            return None
+        bound.append(positions[0])
+        returned.append(positions[1])
+    return (tuple(bound), tuple(returned)) if bound else None
+
+
+def _align_returning_rows(
+    table: sa.Table,
+    returning: tuple[sa.Column[Any], ...],
+    keys: Sequence[tuple[Any, ...]] | None,
+    rows: Sequence[Any],
+) -> Sequence[Any]:
+    """Order a bulk insert's ``RETURNING`` rows like its input rows.
+
+    Rows are sorted by a generated integer key, or matched on the primary
+    key values in ``keys`` when the client bound them. Otherwise they are
+    taken in the order received, which the sentinel ``ORDER BY`` makes the
+    insert order but PostgreSQL does not promise for ``RETURNING``.
+    """
+    order = _returning_order(table, returning)
+    if order is not None:
+        return sorted(rows, key=lambda row: _returned_value(row, returning, order))
+
+    key_positions = _returning_key(table, returning)
+    if keys is None or key_positions is None:
+        return rows
+    returned = key_positions[1]
+    by_key = {
+        tuple(_returned_value(row, returning, i) for i in returned): row
+        for row in rows
+    }
+    try:
+        return [by_key[key] for key in keys]
+    except (KeyError, TypeError):
+        # The driver returned the key in another representation.
+        return rows
+
+
+@functools.lru_cache(maxsize=256)
+def _default_eager_chains(
+    mapper: Any,
+    seen: tuple[Any, ...] = (),
+) -> tuple[tuple[Any, ...], ...]:
+    """Relationship chains a mapper loads eagerly by default.
+
+    Follows ``lazy="selectin"`` (and other eager) relationships outwards,
+    stopping before any mapper already on the path, the way SQLAlchemy ends
+    eager chains without an explicit ``join_depth``.
+    """
+    seen = seen or (mapper,)
+    chains: list[tuple[Any, ...]] = []
+    for rel in mapper.relationships:
+        if rel.lazy not in _EAGER_LAZY or rel.mapper in seen:
+            continue
+        deeper = _default_eager_chains(rel.mapper, (*seen, rel.mapper))
+        chains.extend((rel, *chain) for chain in deeper)
+        if not deeper:
+            chains.append((rel,))
+    return tuple(chains)
+
+
+def _option_relationships(load_opt: Any) -> list[Any]:
+    path = getattr(load_opt, "path", None)
+    if path is None:
+        return []
+    return [token for token in list(path) if hasattr(token, "direction")]
+
+
+def _option_strategies(load_opt: Any, n_relationships: int) -> list[str]:
+    strategies: list[str] = []
+    for ctx in getattr(load_opt, "context", ()):
+        lazy_strategy = "selectin"
+        for key, value in getattr(ctx, "strategy", None) or ():
+            if key == "lazy":
+                lazy_strategy = value
+                break
+        strategies.append(lazy_strategy)
+
+    while len(strategies) < n_relationships:
+        strategies.append("selectin")
+    return strategies
+
+
+def _contains_eager_depth(load_opt: Any) -> int | None:
+    """Number of leading ``contains_eager()`` hops in a loader option.
+
+    Returns None when a hop targets an alias, whose columns can't be told
+    apart from the plain table's by the result column sources.
+    """
+    depth = 0
+    for ctx in getattr(load_opt, "context", ()):
+        local_opts = getattr(ctx, "local_opts", None) or {}
+        if "eager_from_alias" not in local_opts:
+            break
+        if local_opts["eager_from_alias"] is not None:
+            return None
+        depth += 1
+    return depth
+
+
+def _result_column_sources(
+    statement: ClauseElement, compiled: Compiled | None = None
+) -> list[Any]:
+    """The table column behind each result column of ``statement``, if any.
+
+    Reads ``compiled`` when given, so a cached compilation is not redone.
+    """
+    if compiled is None:
+        compiled = statement.compile(
+            dialect=_PYFORMAT_DIALECT,
+            compile_kwargs={"render_postcompile": True},
+        )
+    return [
+        next((obj for obj in entry.objects if isinstance(obj, sa.Column)), None)
+        for entry in getattr(compiled, "_result_columns", ())
+    ]
 
 
 class NativeAsyncResult:
@@ -113,6 +555,7 @@ class NativeAsyncResult:
         statement: str | ClauseElement | None = None,
         entity_rows: list[tuple[Any, ...]] | None = None,
         entity_keys: list[str] | None = None,
+        compiled: Compiled | None = None,
     ) -> None:
         self.raw = raw
         self._result = _build_sa_result(
@@ -120,6 +563,7 @@ class NativeAsyncResult:
             statement=statement,
             entity_rows=entity_rows,
             entity_keys=entity_keys,
+            compiled=compiled,
         )
 
     def all(self) -> Sequence[sa.Row]:
@@ -228,13 +672,16 @@ def _extract_single_entity(statement: ClauseElement | None) -> tuple[str, Any] |
     return desc.get("name") or entity.__name__, mapper
 
 
-def _row_to_entity(
-    mapper: Any,
-    row: Mapping[str, Any],
-    *,
-    dialect: Any,
-) -> Any:
-    values: dict[str, Any] = {}
+@functools.lru_cache(maxsize=256)
+def _entity_columns(
+    mapper: Any, dialect: Any
+) -> tuple[tuple[str, tuple[str, ...], Callable[[Any], Any] | None], ...]:
+    """Attribute key, candidate row keys and result processor per column.
+
+    Resolved once per mapper so loading N rows does not look up N result
+    processors per column.
+    """
+    entries = []
     for attr in mapper.column_attrs:
         column = attr.columns[0]
         candidates = (
@@ -244,16 +691,29 @@ def _row_to_entity(
             f"{column.table.name}_{column.name}",
             f"{mapper.local_table.name}_{column.name}",
         )
+        entries.append(
+            (attr.key, candidates, column.type.result_processor(dialect, None))
+        )
+    return tuple(entries)
+
+
+def _row_to_entity(
+    mapper: Any,
+    row: Mapping[str, Any],
+    *,
+    dialect: Any,
+) -> Any:
+    values: dict[str, Any] = {}
+    for attr_key, candidates, processor in _entity_columns(mapper, dialect):
         for key in candidates:
             if key in row:
                 value = row[key]
-                processor = column.type.result_processor(dialect, None)
                 if processor is not None and value is not None:
                     try:
                         value = processor(value)
                     except Exception:
                         pass
-                values[attr.key] = value
+                values[attr_key] = value
                 break
 
     return mapper.class_(**values)
@@ -263,19 +723,21 @@ def _apply_type_processors(
     statement: ClauseElement | None,
     keys: list[str],
     rows: list[tuple[Any, ...]],
+    compiled: Compiled | None = None,
 ) -> list[tuple[Any, ...]]:
     if statement is None:
         return rows
 
-    compiled = statement.compile(
-        dialect=_PgDialect(paramstyle="pyformat"),
-        compile_kwargs={"render_postcompile": True},
-    )
+    if compiled is None:
+        compiled = statement.compile(
+            dialect=_PYFORMAT_DIALECT,
+            compile_kwargs={"render_postcompile": True},
+        )
     result_columns = getattr(compiled, "_result_columns", None)
     if not result_columns or len(result_columns) != len(keys):
         return rows
 
-    dialect = _PgDialect()
+    dialect = _DIALECT
     processors = []
     for entry in result_columns:
         processor = entry.type.result_processor(dialect, None)
@@ -309,6 +771,7 @@ def _build_sa_result(
     statement: str | ClauseElement | None = None,
     entity_rows: list[tuple[Any, ...]] | None = None,
     entity_keys: list[str] | None = None,
+    compiled: Compiled | None = None,
 ) -> IteratorResult[Any]:
     if entity_rows is not None:
         keys = entity_keys if entity_keys is not None else ["entity"]
@@ -321,7 +784,7 @@ def _build_sa_result(
     )
     if entity_info is not None:
         entity_label, mapper = entity_info
-        dialect = _PgDialect()
+        dialect = _DIALECT
         row_maps = [dict(zip(keys, row)) for row in rows]
         entity_rows = [
             (_row_to_entity(mapper, row_map, dialect=dialect),) for row_map in row_maps
@@ -329,7 +792,7 @@ def _build_sa_result(
         return IteratorResult(SimpleResultMetaData([entity_label]), iter(entity_rows))
 
     if isinstance(statement, ClauseElement):
-        rows = _apply_type_processors(statement, keys, rows)
+        rows = _apply_type_processors(statement, keys, rows, compiled)
 
     return IteratorResult(SimpleResultMetaData(keys), iter(rows))
 
@@ -355,7 +818,12 @@ class NeonNativeAsyncEngine:
         ws_proxy: str | Callable[[str, int], str] | None = None,
         use_secure_websocket: bool = True,
         websocket_heartbeat: float | None = 30.0,
+        query_cache_size: int = 500,
     ) -> None:
+        # Compiled SQL keyed by SQLAlchemy statement cache key; 0 disables.
+        self._compiled_cache: LRUCache[Any, Any] | None = (
+            LRUCache(query_cache_size) if query_cache_size > 0 else None
+        )
         # http_client type check
         if http_client is not None and not isinstance(
             http_client, aiohttp.ClientSession
@@ -396,27 +864,47 @@ class NeonNativeAsyncEngine:
         *,
         options: QueryOptions | None = None,
     ) -> NativeAsyncResult:
-        sql, params = compile_sql(statement, parameters)
+        compiled, sql, params = _compile_statement(
+            statement, parameters, compiled_cache=self._compiled_cache
+        )
         raw = await self._client.query(sql, params, options=options)
 
         entity_info = _extract_single_entity(
             statement if isinstance(statement, ClauseElement) else None
         )
         if entity_info is None:
-            return NativeAsyncResult(raw, statement=statement)
+            return NativeAsyncResult(raw, statement=statement, compiled=compiled)
 
         entity_label, mapper = entity_info
         keys, rows = _normalize_raw_rows(raw)
-        row_maps = [dict(zip(keys, row)) for row in rows]
-        dialect = _PgDialect()
-        entities = [
-            _row_to_entity(mapper, row_map, dialect=dialect) for row_map in row_maps
-        ]
+        dialect = _DIALECT
+        joined_load = self._entities_from_joined_rows(
+            mapper, statement, rows, compiled
+        )
+        if joined_load is None:
+            row_maps = [dict(zip(keys, row)) for row in rows]
+            entities = [
+                _row_to_entity(mapper, row_map, dialect=dialect)
+                for row_map in row_maps
+            ]
+            joined: frozenset[Any] = frozenset()
+        else:
+            entities, joined, tails = joined_load
+            await asyncio.gather(
+                *(
+                    self._hydrate_plan_level(
+                        parents, plans, options=options, path=path
+                    )
+                    for parents, plans, path in tails
+                )
+            )
 
         if isinstance(statement, ClauseElement):
             await self._hydrate_loader_options(
                 entities,
                 statement=statement,
+                mapper=mapper,
+                joined=joined,
                 options=options,
             )
 
@@ -436,7 +924,11 @@ class NeonNativeAsyncEngine:
         *,
         options: TransactionOptions | None = None,
     ) -> list[NativeAsyncResult]:
-        queries = [compile_sql(statement, params) for statement, params in statements]
+        compiled_queries = [
+            _compile_statement(statement, params, compiled_cache=self._compiled_cache)
+            for statement, params in statements
+        ]
+        queries = [(sql, params) for _, sql, params in compiled_queries]
 
         options = (
             options
@@ -449,80 +941,276 @@ class NeonNativeAsyncEngine:
         )
         raw_results = await self._client.transaction(queries, options=options)
         return [
-            NativeAsyncResult(item, statement=statement)
-            for (statement, _), item in zip(statements, raw_results)
+            NativeAsyncResult(item, statement=statement, compiled=compiled)
+            for (statement, _), (compiled, _, _), item in zip(
+                statements, compiled_queries, raw_results
+            )
         ]
 
     async def add(self, instance: Any) -> None:
         """Add an instance to the database."""
         await self.add_all([instance])
 
-    async def add_all(self, instances: Sequence[Any]) -> None:
-        """Add multiple instances in one transaction."""
+    async def add_all(
+        self,
+        instances: Sequence[Any],
+        *,
+        sync_defaults: bool = False,
+        independent: bool = False,
+    ) -> None:
+        """Add multiple instances in one transaction.
+
+        Consecutive instances of the same table are written with a single
+        multi-row ``INSERT``; the order of statements follows the order of
+        ``instances``. Columns left to a server default are left out of the
+        statement, so a run is split wherever that set of columns changes.
+        ``RETURNING`` rows are matched to instances by a generated integer key
+        or a client-bound primary key rather than by position.
+
+        Args:
+            instances: Mapped instances to insert.
+            sync_defaults: Write generated Python defaults onto the instances
+                before the INSERT is sent. Otherwise a default is written
+                then only if its column is not read back; returned columns
+                arrive with the ``RETURNING`` row.
+            independent: The tables involved have no foreign keys between
+                the given instances. Each table is then written in its own
+                transaction and the transactions run concurrently. A failure
+                in one table no longer rolls back the others.
+        """
         if not instances:
             return
 
         statements: list[
             tuple[str | ClauseElement, Mapping[str, Any] | Sequence[Any] | None]
         ] = []
-        tables: list[Any] = []
+        batches: list[
+            tuple[Any, tuple[Any, ...], list[Any], list[tuple[Any, ...]] | None]
+        ] = []
+
+        run: list[tuple[Any, tuple[Any, ...]]] = []
+        run_table: Any = None
+        run_returning: tuple[Any, ...] = ()
+
+        def flush_run() -> None:
+            if not run:
+                return
+            _, columns, _ = _insert_columns(run_table)
+            key_positions = _returning_key(run_table, run_returning)
+            # One statement binds the same columns in every row, so split the
+            # run wherever the set of server-defaulted cells changes.
+            for _, group in itertools.groupby(
+                run,
+                lambda item: tuple(value is _SERVER_DEFAULT for value in item[1]),
+            ):
+                rows = list(group)
+                width = sum(value is not _SERVER_DEFAULT for value in rows[0][1])
+                rows_per_statement = _MAX_BIND_PARAMS // max(1, width)
+                for start in range(0, len(rows), rows_per_statement):
+                    chunk = rows[start : start + rows_per_statement]
+                    keys = None
+                    if key_positions is not None:
+                        keys = [
+                            tuple(values[i] for i in key_positions[0])
+                            for _, values in chunk
+                        ]
+                    statements.append(
+                        self._bulk_insert_query(
+                            run_table, columns, chunk, run_returning
+                        )
+                    )
+                    batches.append(
+                        (
+                            run_table,
+                            run_returning,
+                            [instance for instance, _ in chunk],
+                            keys,
+                        )
+                    )
+            run.clear()
+
         for instance in instances:
-            insert_stmt, params, table = self._build_insert_statement(instance)
-            statements.append((insert_stmt, params))
-            tables.append(table)
+            prepared = self._prepare_insert_row(instance, sync_defaults)
+            if prepared is None:
+                flush_run()
+                insert_stmt, params, table = self._build_insert_statement(
+                    instance, sync_defaults
+                )
+                statements.append((insert_stmt, params))
+                batches.append(
+                    (
+                        table,
+                        _returning_columns(sa_inspect(instance).mapper),
+                        [instance],
+                        None,
+                    )
+                )
+                continue
 
-        results = await self.transaction(
-            statements,
-            options=TransactionOptions(read_only=False),
-        )
+            table, values = prepared
+            if table is not run_table:
+                flush_run()
+                run_table = table
+                run_returning = _returning_columns(sa_inspect(instance).mapper)
+            run.append((instance, values))
+        flush_run()
+
+        # The RETURNING rows are only copied onto the instances, so skip
+        # wrapping them in SQLAlchemy results and read the converted rows.
+        queries = [
+            compile_sql(statement, params, compiled_cache=self._compiled_cache)
+            for statement, params in statements
+        ]
+        # Array mode: RETURNING rows come back as positional lists aligned
+        # with table.columns instead of one dict per row.
+        options = TransactionOptions(read_only=False, array_mode=True)
+        raw_results: Sequence[QueryResult]
+        if independent:
+            positions_by_table: dict[Any, list[int]] = {}
+            for position, (table, *_) in enumerate(batches):
+                positions_by_table.setdefault(table, []).append(position)
+            table_results = await asyncio.gather(
+                *(
+                    self._client.transaction(
+                        [queries[position] for position in positions],
+                        options=options,
+                    )
+                    for positions in positions_by_table.values()
+                )
+            )
+            by_position: dict[int, QueryResult] = {}
+            for positions, results in zip(positions_by_table.values(), table_results):
+                by_position.update(zip(positions, results))
+            raw_results = [by_position[position] for position in range(len(queries))]
+        else:
+            raw_results = await self._client.transaction(queries, options=options)
 
-        for instance, table, result in zip(instances, tables, results):
-            self._apply_returning_values(instance, table, result)
+        for (table, returning, batch, keys), raw in zip(batches, raw_results):
+            rows = _align_returning_rows(table, returning, keys, raw.rows)
+            for instance, row in zip(batch, rows):
+                self._apply_returning_row(instance, returning, row)
 
     async def delete(self, instance: Any) -> None:
         """Delete a persisted instance."""
         await self.delete_all([instance])
 
     async def delete_all(self, instances: Sequence[Any]) -> None:
-        """Delete multiple persisted instances in one transaction."""
+        """Delete multiple persisted instances in one transaction.
+
+        Consecutive instances of the same single-column-key table are
+        deleted with one ``DELETE ... WHERE <pk> = ANY(...)``; statements
+        follow the order of ``instances``.
+        """
         if not instances:
             return
 
         statements: list[
             tuple[str | ClauseElement, Mapping[str, Any] | Sequence[Any] | None]
         ] = []
+        run_stmt: ClauseElement | None = None
+        run_ids: list[Any] = []
+
         for instance in instances:
-            mapper = sa_inspect(instance).mapper
-            table = mapper.local_table
-            pk_cols = list(table.primary_key)
-            if not pk_cols:
-                raise ValueError("Cannot delete instance without primary key columns")
-
-            params: dict[str, Any] = {}
-            criteria = []
-            for pk_col in pk_cols:
-                value = getattr(instance, pk_col.key, None)
+            delete_stmt, pk_keys = _delete_by_primary_key(
+                sa_inspect(instance).mapper.local_table
+            )
+
+            values: list[Any] = []
+            for key in pk_keys:
+                value = getattr(instance, key, None)
                 if value is None:
                     raise ValueError(
-                        f"Cannot delete instance with unset primary key '{pk_col.key}'"
+                        f"Cannot delete instance with unset primary key '{key}'"
                     )
-                bind_name = f"pk_{pk_col.key}"
-                criteria.append(pk_col == sa.bindparam(bind_name))
-                params[bind_name] = value
+                values.append(value)
+
+            if len(values) == 1:
+                if delete_stmt is not run_stmt:
+                    if run_ids:
+                        statements.append((run_stmt, {"pks": run_ids}))
+                    run_stmt, run_ids = delete_stmt, []
+                run_ids.append(values[0])
+                continue
 
-            delete_stmt = sa.delete(table).where(sa.and_(*criteria))
+            if run_ids:
+                statements.append((run_stmt, {"pks": run_ids}))
+            run_stmt, run_ids = None, []
+            params = {f"pk_{key}": value for key, value in zip(pk_keys, values)}
             statements.append((delete_stmt, params))
 
+        if run_ids:
+            statements.append((run_stmt, {"pks": run_ids}))
+
         await self.transaction(
             statements,
             options=TransactionOptions(read_only=False),
         )
 
+    def _prepare_insert_row(
+        self, instance: Any, sync_defaults: bool = False
+    ) -> tuple[Any, tuple[Any, ...]] | None:
+        """Resolve the insert values for ``instance``.
+
+        Values line up with ``_insert_columns(table)``; cells that should take
+        the column's server default are ``_SERVER_DEFAULT``. Returns None when
+        the row cannot be expressed with plain binds (SQL expression defaults,
+        or no columns at all) and needs :meth:`_build_insert_statement`.
+        """
+        mapper = sa_inspect(instance).mapper
+        table = mapper.local_table
+        getter, columns, default_callers = _insert_columns(table)
+        if not columns:
+            return None
+        values = list(getter(instance))
+        returned = _returning_keys(_returning_columns(mapper))[0]
+
+        for i, column in enumerate(columns):
+            if values[i] is not None:
+                continue
+
+            # If value is unset, prefer Python defaults, then server defaults.
+            default_caller = default_callers[i]
+            if default_caller is not None:
+                values[i] = default_caller()
+                # RETURNING will not bring this value back, so keep it now.
+                if sync_defaults or column.key not in returned:
+                    set_committed_value(instance, column.key, values[i])
+            elif column.server_default is not None:
+                values[i] = _SERVER_DEFAULT
+            elif column.default is not None and getattr(
+                column.default, "is_clause_element", False
+            ):
+                return None
+
+        return table, tuple(values)
+
+    def _bulk_insert_query(
+        self,
+        table: Any,
+        columns: tuple[Any, ...],
+        rows: Sequence[tuple[Any, tuple[Any, ...]]],
+        returning: tuple[Any, ...] | None = None,
+    ) -> tuple[str, list[Any]]:
+        """Build the SQL and flat parameters for one multi-row ``INSERT``.
+
+        Every row must leave the same cells to the server default; those
+        columns are left out of the statement.
+        """
+        kept = [
+            i for i, value in enumerate(rows[0][1]) if value is not _SERVER_DEFAULT
+        ]
+        params = [values[i] for _, values in rows for i in kept]
+        sql = _render_bulk_insert(
+            table, tuple(columns[i] for i in kept), len(rows), returning
+        )
+        return sql, params
+
     def _build_insert_statement(
-        self, instance: Any
+        self, instance: Any, sync_defaults: bool = False
     ) -> tuple[ClauseElement, dict[str, Any], Any]:
         mapper = sa_inspect(instance).mapper
         table = mapper.local_table
+        returned = _returning_keys(_returning_columns(mapper))[0]
         insert_values: dict[str, Any] = {}
         params: dict[str, Any] = {}
 
@@ -537,7 +1225,8 @@ class NeonNativeAsyncEngine:
                 resolved_default = self._resolve_python_default(column.default)
                 if resolved_default is not _NO_DEFAULT:
                     value = resolved_default
-                    setattr(instance, column.key, value)
+                    if sync_defaults or column.key not in returned:
+                        set_committed_value(instance, column.key, value)
                 elif column.server_default is not None:
                     # Omit column so the database applies its server-side default.
                     continue
@@ -551,57 +1240,201 @@ class NeonNativeAsyncEngine:
             insert_values[column.key] = sa.bindparam(column.key)
             params[column.key] = value
 
-        insert_stmt = sa.insert(table).values(insert_values).returning(table)
+        insert_stmt = (
+            sa.insert(table)
+            .values(insert_values)
+            .returning(*_returning_columns(mapper))
+        )
         return insert_stmt, params, table
 
     def _resolve_python_default(self, default: Any) -> Any:
-        if default is None:
+        default_caller = _default_caller(default)
+        if default_caller is None:
             return _NO_DEFAULT
+        return default_caller()
 
-        if getattr(default, "is_scalar", False):
-            return default.arg
-
-        if getattr(default, "is_callable", False):
-            fn = default.arg
-            try:
-                return fn(None)
-            except TypeError:
-                return fn()
-
-        return _NO_DEFAULT
-
-    def _apply_returning_values(
-        self, instance: Any, table: Any, result: NativeAsyncResult
+    def _apply_returning_row(
+        self,
+        instance: Any,
+        returning: tuple[Any, ...],
+        row: Sequence[Any] | Mapping[str, Any],
     ) -> None:
-        row = result.mappings().first()
-        if row is None:
+        # Values come straight from the database, so store them as committed
+        # state rather than as pending changes.
+        keys, key_candidates = _returning_keys(returning)
+        processors = _returning_processors(returning)
+        if not isinstance(row, Mapping):
+            for key, processor, value in zip(keys, processors, row):
+                set_committed_value(
+                    instance, key, _process_returned(processor, value)
+                )
             return
 
-        for col in table.columns:
-            if col.key in row:
-                setattr(instance, col.key, row[col.key])
+        for (key, candidates), processor in zip(key_candidates, processors):
+            for candidate in candidates:
+                if candidate in row:
+                    set_committed_value(
+                        instance, key, _process_returned(processor, row[candidate])
+                    )
+                    break
+
+    def _entities_from_joined_rows(
+        self,
+        mapper: Any,
+        statement: ClauseElement,
+        rows: list[tuple[Any, ...]],
+        compiled: Compiled | None = None,
+    ) -> (
+        tuple[
+            list[Any],
+            frozenset[Any],
+            list[tuple[list[Any], list[tuple[dict[str, Any], int]], tuple[Any, ...]]],
+        ]
+        | None
+    ):
+        """Build entities and their ``contains_eager()`` relationships from rows.
+
+        The statement's own joins already carry the related rows, so they are
+        split by source table and deduplicated by identity rather than
+        fetched again. Returns the distinct root entities, the root
+        relationships filled this way and, per joined hop, the entities
+        loaded there with the plans still to load for them and their mapper
+        path: the rest of an option that continues past the joined hops, and
+        the mapper's eager defaults for relationships no chain joins next.
+        Returns None when the statement has no usable ``contains_eager()``
+        option. ``compiled`` is the statement's compiled form, if at hand.
+        """
+        chains: list[tuple[list[Any], dict[str, Any]]] = []
+        for load_opt in getattr(statement, "_with_options", ()):
+            depth = _contains_eager_depth(load_opt)
+            if depth is None:
+                return None
+            relationships = _option_relationships(load_opt)
+            if not depth or not relationships:
                 continue
-            if col.name in row:
-                setattr(instance, col.key, row[col.name])
+            strategies = _option_strategies(load_opt, len(relationships))
+            chains.append(
+                (
+                    relationships[:depth],
+                    {
+                        "relationships": relationships[depth:],
+                        "strategies": strategies[depth:],
+                    },
+                )
+            )
+        if not chains:
+            return None
+
+        sources = _result_column_sources(statement, compiled)
+        columns: dict[Any, list[tuple[int, Any]]] = {}
+        pk_positions: dict[Any, list[int]] = {}
+        for target in (mapper, *(rel.mapper for rels, _ in chains for rel in rels)):
+            if target in columns:
                 continue
+            table = target.local_table
+            columns[target] = [
+                (idx, col)
+                for idx, col in enumerate(sources)
+                if col is not None and col.table is table
+            ]
+            position = {col: idx for idx, col in columns[target]}
+            if any(col not in position for col in target.primary_key):
+                return None
+            pk_positions[target] = [position[col] for col in target.primary_key]
+
+        dialect = _DIALECT
+        identity_map: dict[tuple[Any, ...], Any] = {}
+
+        def entity_for(target: Any, row: tuple[Any, ...]) -> Any | None:
+            identity = tuple(row[idx] for idx in pk_positions[target])
+            if all(value is None for value in identity):
+                return None  # no match on the outer side of a join
+            entity = identity_map.get((target, identity))
+            if entity is None:
+                row_map = {col.key: row[idx] for idx, col in columns[target]}
+                entity = _row_to_entity(target, row_map, dialect=dialect)
+                identity_map[(target, identity)] = entity
+            return entity
+
+        # Keyed by id() of entities already deduplicated through identity_map.
+        roots: dict[int, Any] = {}
+        parents_by_rel: dict[Any, dict[int, Any]] = {}
+        children: dict[tuple[Any, int], dict[int, Any]] = {}
+        # Entities loaded at each hop, keyed by the relationships leading there.
+        hops: dict[tuple[Any, ...], dict[int, Any]] = {}
+        chain_hops = [
+            [(rel, tuple(rels[: i + 1])) for i, rel in enumerate(rels)]
+            for rels, _ in chains
+        ]
 
-            prefixed_key = f"{table.name}_{col.name}"
-            if prefixed_key in row:
-                setattr(instance, col.key, row[prefixed_key])
+        for row in rows:
+            root = entity_for(mapper, row)
+            if root is None:
+                continue
+            roots.setdefault(id(root), root)
+            for steps in chain_hops:
+                parent = root
+                for rel, hop in steps:
+                    parents_by_rel.setdefault(rel, {})[id(parent)] = parent
+                    child = entity_for(rel.mapper, row)
+                    if child is None:
+                        break
+                    children.setdefault((rel, id(parent)), {})[id(child)] = child
+                    hops.setdefault(hop, {})[id(child)] = child
+                    parent = child
 
-    def _extract_load_plans(self, statement: ClauseElement) -> list[dict[str, Any]]:
+        for rel, parents in parents_by_rel.items():
+            for parent_id, parent in parents.items():
+                loaded = list(children.get((rel, parent_id), {}).values())
+                if rel.uselist:
+                    setattr(parent, rel.key, loaded)
+                else:
+                    setattr(parent, rel.key, loaded[0] if loaded else None)
+
+        # What each hop loads next: the following joined hop of any chain, or
+        # the rest of an option once its joined hops end.
+        following: dict[tuple[Any, ...], set[Any]] = {}
+        plans_at: dict[tuple[Any, ...], list[tuple[dict[str, Any], int]]] = {}
+        for rels, plan in chains:
+            for i in range(1, len(rels)):
+                following.setdefault(tuple(rels[:i]), set()).add(rels[i])
+            if plan["relationships"]:
+                following.setdefault(tuple(rels), set()).add(plan["relationships"][0])
+                plans_at.setdefault(tuple(rels), []).append((plan, 0))
+
+        tails = []
+        for hop, entities in hops.items():
+            path = (mapper, *(rel.mapper for rel in hop))
+            plans = list(plans_at.get(hop, ()))
+            planned = following.get(hop, set())
+            for chain in _default_eager_chains(hop[-1].mapper, path):
+                if chain[0] in planned:
+                    continue
+                default_plan = {
+                    "relationships": list(chain),
+                    "strategies": [_EAGER_LAZY[chain_rel.lazy] for chain_rel in chain],
+                }
+                plans.append((default_plan, 0))
+            if plans:
+                tails.append((list(entities.values()), plans, path))
+        joined = frozenset(rels[0] for rels, _ in chains)
+        return list(roots.values()), joined, tails
+
+    def _extract_load_plans(
+        self,
+        statement: ClauseElement,
+        mapper: Any | None = None,
+        joined: frozenset[Any] = frozenset(),
+    ) -> list[dict[str, Any]]:
         plans: list[dict[str, Any]] = []
         with_options = getattr(statement, "_with_options", ())
         seen: set[tuple[str, ...]] = set()
+        # Root relationships named by any option, which override their mapper
+        # defaults (e.g. lazyload() on a lazy="selectin" relationship).
+        optioned: set[Any] = set()
 
         for load_opt in with_options:
-            path = getattr(load_opt, "path", None)
-            if path is None:
-                continue
-
-            relationships = [
-                token for token in list(path) if hasattr(token, "direction")
-            ]
+            relationships = _option_relationships(load_opt)
             if not relationships:
                 continue
 
@@ -612,20 +1445,27 @@ class NeonNativeAsyncEngine:
                 continue
             seen.add(signature)
 
-            strategies: list[str] = []
-            for ctx in getattr(load_opt, "context", ()):
-                lazy_strategy = "selectin"
-                for key, value in getattr(ctx, "strategy", ()):
-                    if key == "lazy":
-                        lazy_strategy = value
-                        break
-                strategies.append(lazy_strategy)
-
-            while len(strategies) < len(relationships):
-                strategies.append("selectin")
-
+            optioned.add(relationships[0])
+            # contains_eager() chains in ``joined`` were filled from the
+            # statement's own rows; loading them again would duplicate work.
+            if relationships[0] in joined and _contains_eager_depth(load_opt):
+                continue
+            strategies = _option_strategies(load_opt, len(relationships))
+            if strategies[0] in _LAZY_OPT_OUT:
+                continue
             plans.append({"relationships": relationships, "strategies": strategies})
 
+        if mapper is not None:
+            for chain in _default_eager_chains(mapper):
+                if chain[0] in optioned:
+                    continue
+                plans.append(
+                    {
+                        "relationships": list(chain),
+                        "strategies": [_EAGER_LAZY[rel.lazy] for rel in chain],
+                    }
+                )
+
         return plans
 
     def _select_strategy(self, strategies: Sequence[str]) -> str:
@@ -652,13 +1492,10 @@ class NeonNativeAsyncEngine:
         target_cols = [c for c in target_mapper.columns]
         target_pk_cols = list(target_mapper.primary_key)
 
-        parent_ids: list[Any] = []
-        seen_parent_ids: set[Any] = set()
-        for parent in parents:
-            pid = getattr(parent, parent_pk_col.key)
-            if pid not in seen_parent_ids:
-                seen_parent_ids.add(pid)
-                parent_ids.append(pid)
+        # dict.fromkeys dedupes while keeping first-seen order.
+        parent_ids: list[Any] = list(
+            dict.fromkeys(map(operator.attrgetter(parent_pk_col.key), parents))
+        )
 
         if not parent_ids:
             return {}, []
@@ -685,15 +1522,16 @@ class NeonNativeAsyncEngine:
                 .where(parent_pk_col.in_(parent_ids))
             )
 
-        sql, params = compile_sql(stmt)
+        sql, params = compile_sql(stmt, compiled_cache=self._compiled_cache)
         raw = await self._client.query(sql, params, options=options)
         keys, rows = _normalize_raw_rows(raw)
         row_maps = [dict(zip(keys, row)) for row in rows]
-        dialect = _PgDialect()
+        dialect = _DIALECT
 
-        by_parent: dict[Any, list[Any]] = {pid: [] for pid in parent_ids}
-        per_parent_seen: dict[Any, set[tuple[Any, ...]]] = {
-            pid: set() for pid in parent_ids
+        # Children per parent keyed by identity: one lookup both dedupes and
+        # keeps the first-seen order.
+        children_by_parent: dict[Any, dict[tuple[Any, ...], Any]] = {
+            pid: {} for pid in parent_ids
         }
 
         for row_map in row_maps:
@@ -702,14 +1540,15 @@ class NeonNativeAsyncEngine:
                 continue
             entity = _row_to_entity(target_mapper, row_map, dialect=dialect)
             child_identity = tuple(getattr(entity, c.key) for c in target_pk_cols)
-            if child_identity in per_parent_seen[pid]:
-                continue
-            per_parent_seen[pid].add(child_identity)
-            by_parent[pid].append(entity)
+            children_by_parent[pid].setdefault(child_identity, entity)
 
-        loaded_children: list[Any] = []
-        for children in by_parent.values():
-            loaded_children.extend(children)
+        by_parent = {
+            pid: list(children.values())
+            for pid, children in children_by_parent.items()
+        }
+        loaded_children: list[Any] = [
+            child for children in by_parent.values() for child in children
+        ]
 
         return by_parent, loaded_children
 
@@ -719,7 +1558,14 @@ class NeonNativeAsyncEngine:
         active_plans: list[tuple[dict[str, Any], int]],
         *,
         options: QueryOptions | None = None,
+        path: tuple[Any, ...] = (),
     ) -> None:
+        """Load one relationship level for ``parents``, then the next.
+
+        ``path`` holds the mappers loaded so far. Children also get their
+        own mapper's eager defaults for relationships no plan names at the
+        next level, stopping before a mapper already on the path.
+        """
         if not parents or not active_plans:
             return
 
@@ -758,11 +1604,23 @@ class NeonNativeAsyncEngine:
                 if idx + 1 < len(plan["relationships"]):
                     next_entries.append((plan, idx + 1))
 
+            child_path = (*(path or (rel.parent,)), rel.mapper)
+            planned = {plan["relationships"][idx] for plan, idx in next_entries}
+            for chain in _default_eager_chains(rel.mapper, child_path):
+                if chain[0] in planned:
+                    continue
+                default_plan = {
+                    "relationships": list(chain),
+                    "strategies": [_EAGER_LAZY[chain_rel.lazy] for chain_rel in chain],
+                }
+                next_entries.append((default_plan, 0))
+
             if next_entries and loaded_children:
                 await self._hydrate_plan_level(
                     loaded_children,
                     next_entries,
                     options=options,
+                    path=child_path,
                 )
 
         await asyncio.gather(
@@ -774,12 +1632,14 @@ class NeonNativeAsyncEngine:
         root_entities: list[Any],
         *,
         statement: ClauseElement,
+        mapper: Any | None = None,
+        joined: frozenset[Any] = frozenset(),
         options: QueryOptions | None = None,
     ) -> None:
         if not root_entities:
             return
 
-        plans = self._extract_load_plans(statement)
+        plans = self._extract_load_plans(statement, mapper, joined)
         if not plans:
             return
 
@@ -787,6 +1647,7 @@ class NeonNativeAsyncEngine:
             root_entities,
             [(plan, 0) for plan in plans],
             options=options,
+            path=(mapper,) if mapper is not None else (),
         )
 
     async def dispose(self) -> None:
@@ -819,6 +1680,7 @@ def create_neon_http_engine(
     fetch_function: (
         Callable[[str, str, dict[str, str]], Awaitable[tuple[int, str]]] | None
     ) = None,
+    query_cache_size: int = 500,
 ) -> NeonNativeAsyncEngine:
     """Create an async Neon engine using the HTTP transport."""
     return NeonNativeAsyncEngine(
@@ -829,6 +1691,7 @@ def create_neon_http_engine(
         fetch_endpoint=fetch_endpoint,
         fetch_function=fetch_function,
         transport="http",
+        query_cache_size=query_cache_size,
     )
 
 
@@ -842,6 +1705,7 @@ def create_neon_ws_engine(
     ws_proxy: str | Callable[[str, int], str] | None = None,
     use_secure_websocket: bool = True,
     heartbeat: float | None = 30.0,
+    query_cache_size: int = 500,
 ) -> NeonNativeAsyncEngine:
     """Create an async Neon engine using the WebSocket transport."""
     return NeonNativeAsyncEngine(
@@ -854,6 +1718,7 @@ def create_neon_ws_engine(
         ws_proxy=ws_proxy,
         use_secure_websocket=use_secure_websocket,
         websocket_heartbeat=heartbeat,
+        query_cache_size=query_cache_size,
     )
 
 
@@ -872,6 +1737,7 @@ def create_neon_native_async_engine(
     ws_proxy: str | Callable[[str, int], str] | None = None,
     use_secure_websocket: bool = True,
     websocket_heartbeat: float | None = 30.0,
+    query_cache_size: int = 500,
 ) -> NeonNativeAsyncEngine:
     """Create an async Neon engine. Prefer ``create_neon_http_engine`` or
     ``create_neon_ws_engine`` for clearer intent."""
@@ -887,4 +1753,5 @@ def create_neon_native_async_engine(
         ws_proxy=ws_proxy,
         use_secure_websocket=use_secure_websocket,
         websocket_heartbeat=websocket_heartbeat,
+        query_cache_size=query_cache_size,
     )
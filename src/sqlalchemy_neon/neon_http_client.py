@@ -12,7 +12,15 @@ import warnings
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import Enum
-from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Sequence,
+)
 
 import aiohttp
 
@@ -111,6 +119,16 @@ def _warn_ignored_websocket_auth_token(auth_token: str | None) -> None:
         )
 
 
+def _client_timeout(
+    timeout: float | aiohttp.ClientTimeout | None,
+) -> aiohttp.ClientTimeout | None:
+    if isinstance(timeout, aiohttp.ClientTimeout):
+        return timeout
+    if isinstance(timeout, (int, float)):
+        return aiohttp.ClientTimeout(total=timeout)
+    return None
+
+
 class AsyncNeonHTTPClient:
     """Async HTTP client for Neon serverless PostgreSQL API."""
 
@@ -134,7 +152,13 @@ class AsyncNeonHTTPClient:
         self._timeout = timeout
         self._fetch_endpoint = fetch_endpoint
         self._fetch_function = fetch_function
+        self._fetch_urls: dict[bool, str] = {}
         self._url = self._resolve_fetch_url(jwt_auth=bool(auth_token))
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "Neon-Connection-String": self._connection_string,
+            "Neon-Raw-Text-Output": "true",
+        }
         self._external_client: bool = (
             http_client is not None
             and not callable(http_client)
@@ -145,6 +169,8 @@ class AsyncNeonHTTPClient:
             | Callable[[], Awaitable[aiohttp.ClientSession]]
             | None
         ) = http_client
+        # Serializes session creation so concurrent first requests share one.
+        self._client_lock = asyncio.Lock()
         self._type_converter = TypeConverter()
 
     def _parse_connection_string(self, connection_string: str) -> "ParseResult":
@@ -199,7 +225,14 @@ class AsyncNeonHTTPClient:
             return endpoint(host, port, jwt_auth)
         if isinstance(endpoint, str):
             return endpoint
-        return self._default_fetch_endpoint(host, jwt_auth=jwt_auth)
+
+        # The default endpoint only depends on the host and auth mode.
+        url = self._fetch_urls.get(jwt_auth)
+        if url is None:
+            url = self._fetch_urls[jwt_auth] = self._default_fetch_endpoint(
+                host, jwt_auth=jwt_auth
+            )
+        return url
 
     def _build_headers(
         self,
@@ -207,12 +240,8 @@ class AsyncNeonHTTPClient:
         auth_token: str | None = None,
         transaction_options: TransactionOptions | None = None,
     ) -> dict[str, str]:
-        headers = {
-            "Content-Type": "application/json",
-            "Neon-Connection-String": self._connection_string,
-            "Neon-Raw-Text-Output": "true",
-            "Neon-Array-Mode": "true" if array_mode else "false",
-        }
+        headers = self._base_headers.copy()
+        headers["Neon-Array-Mode"] = "true" if array_mode else "false"
 
         token = auth_token or self._auth_token
         if token:
@@ -230,6 +259,13 @@ class AsyncNeonHTTPClient:
         return headers
 
     async def _ensure_client(self) -> aiohttp.ClientSession:
+        client = self._http_client
+        if isinstance(client, aiohttp.ClientSession) and not client.closed:
+            return client
+        async with self._client_lock:
+            return await self._resolve_client()
+
+    async def _resolve_client(self) -> aiohttp.ClientSession:
         if inspect.isawaitable(self._http_client):
             self._http_client = await self._http_client
 
@@ -240,13 +276,9 @@ class AsyncNeonHTTPClient:
             self._http_client = maybe_client
 
         if self._http_client is None:
-            if isinstance(self._timeout, aiohttp.ClientTimeout):
-                timeout = self._timeout
-            elif isinstance(self._timeout, (int, float)):
-                timeout = aiohttp.ClientTimeout(total=self._timeout)
-            else:
-                timeout = None
-            self._http_client = aiohttp.ClientSession(timeout=timeout)
+            self._http_client = aiohttp.ClientSession(
+                timeout=_client_timeout(self._timeout)
+            )
 
         if not isinstance(self._http_client, aiohttp.ClientSession):
             raise NeonConfigurationError(
@@ -331,9 +363,7 @@ class AsyncNeonHTTPClient:
         is_array = response.get("rowAsArray", array_mode)
 
         if rows and fields:
-            rows = [
-                self._type_converter.convert_row(row, fields, is_array) for row in rows
-            ]
+            rows = self._type_converter.convert_rows(rows, fields, is_array)
 
         return QueryResult(
             rows=rows,
@@ -605,20 +635,11 @@ class AsyncNeonWebSocketClient(AsyncNeonHTTPClient):
             except ValueError:
                 pass
 
-        if array_mode:
-            rows: list[Any] = [
-                [cell.decode() if cell is not None else None for cell in raw_row]
-                for raw_row in pg_result.rows
-            ]
-        else:
-            keys = [f["name"] for f in fields]
-            rows = [
-                {
-                    keys[i]: cell.decode() if cell is not None else None
-                    for i, cell in enumerate(raw_row)
-                }
-                for raw_row in pg_result.rows
-            ]
+        rows: list[Any] = list(pg_result.rows)
+        if rows and fields:
+            # Cells are still the raw text-format bytes from the wire; hand them
+            # to the loaders directly rather than decoding to str first.
+            rows = self._type_converter.convert_wire_rows(rows, fields, array_mode)
 
         result = QueryResult(
             rows=rows,
@@ -627,12 +648,6 @@ class AsyncNeonWebSocketClient(AsyncNeonHTTPClient):
             command=command,
             row_as_array=array_mode,
         )
-
-        if result.rows and result.fields:
-            result.rows = [
-                self._type_converter.convert_row(row, result.fields, array_mode)
-                for row in result.rows
-            ]
         return result
 
     def _begin_clause(self, options: TransactionOptions) -> str:
@@ -693,10 +708,7 @@ class AsyncNeonWebSocketClient(AsyncNeonHTTPClient):
 
         async with self._request_lock:
             try:
-                text_params = self._type_converter.convert_params(params)
-                byte_params: list[bytes | None] = [
-                    p.encode() if p is not None else None for p in text_params
-                ]
+                byte_params = self._type_converter.convert_params_bytes(params)
 
                 if self.is_reusable:
                     protocol = self._protocol
@@ -743,10 +755,7 @@ class AsyncNeonWebSocketClient(AsyncNeonHTTPClient):
                 assert protocol is not None
                 results: list[QueryResult] = []
                 for sql, params in queries:
-                    text_params = self._type_converter.convert_params(params)
-                    byte_params: list[bytes | None] = [
-                        p.encode() if p is not None else None for p in text_params
-                    ]
+                    byte_params = self._type_converter.convert_params_bytes(params)
                     pg_result = await protocol.extended_query(sql, byte_params)
                     results.append(
                         self._pg_result_to_query_result(
@@ -765,13 +774,46 @@ class AsyncNeonWebSocketClient(AsyncNeonHTTPClient):
                 await self._quarantine_connection()
                 raise
 
+    async def copy_from_stdin(
+        self,
+        sql: str,
+        data: Iterable[bytes],
+    ) -> QueryResult:
+        """Stream pre-encoded rows into a ``COPY ... FROM STDIN`` statement.
+
+        COPY needs the PostgreSQL wire protocol, so it is only available over
+        WebSocket; the HTTP endpoint has no equivalent.
+
+        Args:
+            sql: A ``COPY ... FROM STDIN`` statement.
+            data: Payload chunks already encoded in the statement's format.
+
+        Returns:
+            A result whose ``row_count`` is the number of copied rows.
+        """
+        async with self._request_lock:
+            try:
+                if self.is_reusable:
+                    protocol = self._protocol
+                    assert protocol is not None
+                else:
+                    await self._close_connection()
+                    protocol = await self._ensure_connection()
+                pg_result = await protocol.copy_from_stdin(sql, data)
+                return self._pg_result_to_query_result(pg_result, array_mode=False)
+            except BaseException:
+                await self._quarantine_connection()
+                raise
+
     async def close(self) -> None:
         await self._close_connection()
         await super().close()
 
     async def force_close(self) -> None:
         await self._close_connection()
-        await super().force_close()
+        # A shared session (e.g. the pool's) outlives any single connection.
+        if not self._external_client:
+            await super().force_close()
 
 
 class AsyncNeonWebSocketPool:
@@ -805,6 +847,10 @@ class AsyncNeonWebSocketPool:
         self._use_secure_websocket = use_secure_websocket
         self._heartbeat = heartbeat
 
+        # Session created by the pool when none is supplied, shared by all of
+        # its clients so they reuse one connector instead of one each.
+        self._owned_http_client: aiohttp.ClientSession | None = None
+
         self._create_lock = asyncio.Lock()
         self._available: asyncio.LifoQueue[AsyncNeonWebSocketClient] = (
             asyncio.LifoQueue()
@@ -813,10 +859,21 @@ class AsyncNeonWebSocketPool:
         self._leased: set[AsyncNeonWebSocketClient] = set()
         self._closed = False
 
+    def _shared_http_client(
+        self,
+    ) -> aiohttp.ClientSession | Callable[[], Awaitable[aiohttp.ClientSession]]:
+        if self._http_client is not None:
+            return self._http_client
+        if self._owned_http_client is None or self._owned_http_client.closed:
+            self._owned_http_client = aiohttp.ClientSession(
+                timeout=_client_timeout(self._timeout)
+            )
+        return self._owned_http_client
+
     async def _new_client(self) -> AsyncNeonWebSocketClient:
         client = AsyncNeonWebSocketClient(
             self._connection_string,
-            http_client=self._http_client,
+            http_client=self._shared_http_client(),
             auth_token=self._auth_token,
             timeout=self._timeout,
             ws_proxy=self._ws_proxy,
@@ -903,6 +960,14 @@ class AsyncNeonWebSocketPool:
         async with self.connection() as client:
             return await client.transaction(queries=queries, options=options)
 
+    async def copy_from_stdin(
+        self,
+        sql: str,
+        data: Iterable[bytes],
+    ) -> QueryResult:
+        async with self.connection() as client:
+            return await client.copy_from_stdin(sql, data)
+
     async def _close_clients(self, *, force: bool) -> None:
         clients = list(self._clients)
         self._clients.clear()
@@ -919,6 +984,10 @@ class AsyncNeonWebSocketPool:
             return_exceptions=True,
         )
 
+        owned, self._owned_http_client = self._owned_http_client, None
+        if owned is not None:
+            await owned.close()
+
     async def close(self) -> None:
         self._closed = True
         await self._close_clients(force=False)
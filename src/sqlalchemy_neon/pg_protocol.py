@@ -2,7 +2,8 @@
 
 Transport-agnostic implementation that can be used over WebSocket or any other
 async byte transport. Supports startup, authentication (trust, cleartext, MD5,
-SCRAM-SHA-256), simple query protocol, and extended query protocol.
+SCRAM-SHA-256), simple query protocol, extended query protocol, and
+``COPY ... FROM STDIN``.
 """
 
 from __future__ import annotations
@@ -13,7 +14,7 @@ import hmac
 import secrets
 import struct
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Iterable
 from .errors import (
     NeonAuthenticationError,
     NeonConnectionError,
@@ -36,6 +37,11 @@ SYNC_MSG = ord("S")
 TERMINATE_MSG = ord("X")
 PASSWORD_MSG = ord("p")
 CLOSE_MSG = ord("C")
+COPY_DONE_MSG = ord("c")
+COPY_FAIL_MSG = ord("f")
+
+# Sent in both directions
+COPY_DATA_MSG = ord("d")
 
 # Backend (server -> client) message types
 AUTH_MSG = ord("R")
@@ -52,6 +58,7 @@ BIND_COMPLETE_MSG = ord("2")
 CLOSE_COMPLETE_MSG = ord("3")
 NO_DATA_MSG = ord("n")
 EMPTY_QUERY_MSG = ord("I")
+COPY_IN_RESPONSE_MSG = ord("G")
 
 # Authentication subtypes
 AUTH_OK = 0
@@ -249,6 +256,18 @@ def _build_sync_message() -> bytes:
     return _build_message(SYNC_MSG)
 
 
+def _build_copy_data_message(data: bytes) -> bytes:
+    return _build_message(COPY_DATA_MSG, data)
+
+
+def _build_copy_done_message() -> bytes:
+    return _build_message(COPY_DONE_MSG)
+
+
+def _build_copy_fail_message(reason: str) -> bytes:
+    return _build_message(COPY_FAIL_MSG, reason.encode() + b"\x00")
+
+
 def _build_terminate_message() -> bytes:
     return _build_message(TERMINATE_MSG)
 
@@ -803,6 +822,73 @@ class PGProtocol:
                     fields=fields, rows=rows, command_tag=command_tag
                 )
 
+    # ------------------------------------------------------------------
+    # COPY FROM STDIN
+    # ------------------------------------------------------------------
+
+    async def copy_from_stdin(
+        self,
+        sql: str,
+        data: Iterable[bytes],
+    ) -> PGQueryResult:
+        """Stream *data* into a ``COPY ... FROM STDIN`` statement.
+
+        Each chunk is sent as one CopyData message, so callers control the
+        frame size. The chunks are passed through untouched and must already
+        be encoded in the format named by the COPY statement.
+
+        Args:
+            sql: A ``COPY ... FROM STDIN`` statement.
+            data: Encoded COPY payload chunks, consumed lazily.
+
+        Returns:
+            The result carrying the ``COPY <n>`` command tag.
+
+        Raises:
+            NeonQueryError: If the server rejects the statement or the data,
+                or the statement does not start a copy-in.
+        """
+        await self._send(_build_query_message(sql))
+
+        while True:
+            msg_type, payload = await self._reader.read_message()
+
+            if msg_type == COPY_IN_RESPONSE_MSG:
+                break
+            elif msg_type == ERROR_RESPONSE_MSG:
+                await self._raise_query_error(payload)
+            elif msg_type == NOTICE_RESPONSE_MSG:
+                self._notices.append(_parse_error_fields(payload))
+            elif msg_type == READY_MSG:
+                self._txn_status = payload[0]
+                raise NeonQueryError(
+                    message="Statement did not start a COPY FROM STDIN"
+                )
+
+        try:
+            for chunk in data:
+                await self._send(_build_copy_data_message(chunk))
+        except BaseException as exc:
+            # Abort the copy so the server rolls it back and returns to idle.
+            await self._send(_build_copy_fail_message(repr(exc)))
+            await self._read_until_ready()
+            raise
+        await self._send(_build_copy_done_message())
+
+        command_tag = ""
+        while True:
+            msg_type, payload = await self._reader.read_message()
+
+            if msg_type == COMMAND_COMPLETE_MSG:
+                command_tag = payload[:-1].decode()
+            elif msg_type == ERROR_RESPONSE_MSG:
+                await self._raise_query_error(payload)
+            elif msg_type == NOTICE_RESPONSE_MSG:
+                self._notices.append(_parse_error_fields(payload))
+            elif msg_type == READY_MSG:
+                self._txn_status = payload[0]
+                return PGQueryResult(fields=[], rows=[], command_tag=command_tag)
+
     # ------------------------------------------------------------------
     # Terminate
     # ------------------------------------------------------------------
@@ -818,6 +904,17 @@ class PGProtocol:
     # Helpers
     # ------------------------------------------------------------------
 
+    async def _raise_query_error(self, payload: bytes) -> None:
+        """Resync after an ErrorResponse and raise it as a query error."""
+        ef = _parse_error_fields(payload)
+        await self._read_until_ready()
+        raise NeonQueryError(
+            message=ef.get("message", "Query error"),
+            code=ef.get("code"),
+            detail=ef.get("detail"),
+            hint=ef.get("hint"),
+        )
+
     async def _read_until_ready(self) -> None:
         """Consume messages until ReadyForQuery (resync after error)."""
         while True:
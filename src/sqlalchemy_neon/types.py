@@ -7,12 +7,18 @@ All values are transmitted as text over HTTP, with OIDs for type identification.
 
 from __future__ import annotations
 
-from typing import Any
-
-from psycopg.adapt import PyFormat, Transformer
+import binascii
+import datetime
+import functools
+import json
+from typing import Any, Callable, Sequence
+
+from psycopg import postgres
+from psycopg.abc import Dumper, Loader
+from psycopg.adapt import AdaptersMap, PyFormat, Transformer
 from psycopg.postgres import register_default_adapters, register_default_types, types
 from psycopg.pq import Format
-from psycopg.types.json import Jsonb
+from psycopg.types.json import Jsonb, set_json_dumps
 
 
 # Patch psycopg's interval style detection since we don't have a persistent connection
@@ -28,6 +34,55 @@ except (ImportError, AttributeError):
 from .errors import NeonTypeError
 
 
+def _dumps_with_stdlib_fallback(
+    encode: Callable[[Any], bytes | str], obj: Any
+) -> bytes | str:
+    try:
+        return encode(obj)
+    except TypeError:
+        # Values the fast encoder rejects (e.g. integers beyond 64 bits)
+        # keep the stdlib behaviour.
+        return json.dumps(obj)
+
+
+def _with_stdlib_fallback(
+    encode: Callable[[Any], bytes | str],
+) -> Callable[[Any], bytes | str]:
+    # A partial rather than a closure: psycopg caches JSON dumpers per dumps
+    # function but refuses (and logs a leak warning) for closures, which
+    # would build a new dumper class for every TypeConverter.
+    return functools.partial(_dumps_with_stdlib_fallback, encode)
+
+
+def _select_json_dumps() -> Callable[[Any], bytes | str] | None:
+    """Pick the fastest available JSON encoder: orjson, then msgspec.
+
+    Returns None when neither is installed and psycopg's stdlib default
+    should be kept. Only encoding is swapped: orjson silently turns integers
+    beyond 64 bits into floats when decoding, so loads stay on the stdlib.
+    """
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return _with_stdlib_fallback(
+            functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+        )
+
+    try:
+        import msgspec
+    except ImportError:
+        return None
+    return _with_stdlib_fallback(msgspec.json.encode)
+
+
+_JSON_DUMPS = _select_json_dumps()
+
+# Types whose psycopg dumper is chosen per value, never cached by type.
+_VALUE_DEPENDENT_DUMPERS = frozenset({list, datetime.datetime, datetime.time})
+
+
 class TypeConverter:
     """Handles type conversion between Python and PostgreSQL for Neon HTTP API.
 
@@ -38,8 +93,43 @@ class TypeConverter:
     def __init__(self) -> None:
         """Initialize the type converter with a psycopg Transformer."""
         register_default_types(types)
-        self._transformer = Transformer()
-        register_default_adapters(self._transformer)
+        # Private copy of the global adapters so customizations (e.g. the JSON
+        # encoder) don't leak into other psycopg users in the process.
+        self._adapters = AdaptersMap(postgres.adapters)
+        register_default_adapters(self._adapters)
+        if _JSON_DUMPS is not None:
+            set_json_dumps(_JSON_DUMPS, self._adapters)
+        self._transformer = Transformer(self._adapters)
+        # Resolved adapters keyed by Python type / OID; the set of types seen
+        # in a workload is tiny compared to the number of values converted.
+        self._dumper_cache: dict[type, Dumper] = {}
+        self._loader_cache: dict[int, Loader] = {}
+
+    def _get_dumper(self, value: Any) -> Dumper:
+        cls = type(value)
+        dumper = self._dumper_cache.get(cls)
+        if dumper is not None:
+            return dumper
+
+        dumper = self._transformer.get_dumper(value, PyFormat.TEXT)
+        # Only cache dumpers that don't depend on the value itself: lists dump
+        # per element type, and datetimes and times per tz-awareness even
+        # though their key is the bare type. Every int dumper renders the same
+        # decimal text, so ints are safe regardless of size.
+        if cls is int or (
+            cls not in _VALUE_DEPENDENT_DUMPERS
+            and dumper.get_key(value, PyFormat.TEXT) is cls
+        ):
+            self._dumper_cache[cls] = dumper
+        return dumper
+
+    def _get_loader(self, oid: int) -> Loader:
+        loader = self._loader_cache.get(oid)
+        if loader is None:
+            loader = self._loader_cache.setdefault(
+                oid, self._transformer.get_loader(oid, Format.TEXT)
+            )
+        return loader
 
     def python_to_pg(self, value: Any) -> str | None:
         """Convert a Python value to PostgreSQL text format.
@@ -50,6 +140,26 @@ class TypeConverter:
         Returns:
             String representation for PostgreSQL, or None for NULL.
 
+        Raises:
+            NeonTypeError: If the value cannot be converted.
+        """
+        result = self.python_to_pg_bytes(value)
+        if result is None:
+            return None
+        return result.decode("utf-8")
+
+    def python_to_pg_bytes(self, value: Any) -> bytes | bytearray | None:
+        """Convert a Python value to PostgreSQL text format as encoded bytes.
+
+        Wire-protocol transports send parameters as bytes, so this returns the
+        dumper output as-is instead of decoding it to ``str`` first.
+
+        Args:
+            value: Any Python value to convert.
+
+        Returns:
+            UTF-8 encoded text representation, or None for NULL.
+
         Raises:
             NeonTypeError: If the value cannot be converted.
         """
@@ -58,33 +168,31 @@ class TypeConverter:
         # Handle dict -> JSONB conversion
         if isinstance(value, dict):
             value = Jsonb(value)
-        # Handle bytes -> hex format with \\x prefix
+        # Handle bytes -> hex format with \\x prefix. This is already the final
+        # bytea text form, so emit it directly instead of building an
+        # intermediate str and passing it through the text dumper.
         if isinstance(value, bytes):
-            value = "\\x" + value.hex()
+            return b"\\x" + binascii.hexlify(value)
 
         try:
             # Use psycopg's dumper for text format
-            dumper = self._transformer.get_dumper(value, PyFormat.TEXT)
+            dumper = self._get_dumper(value)
             result = dumper.dump(value)
-
-            # Ensure we return a string
-            if isinstance(result, bytes):
-                result = result.decode("utf-8")
-            elif isinstance(result, bytearray):
-                result = result.decode("utf-8")
-            elif isinstance(result, memoryview):
-                result = bytes(result).decode("utf-8")
         except Exception as e:
             raise NeonTypeError(
                 f"Failed to convert Python value to PostgreSQL: {e}"
             ) from e
+
+        if isinstance(result, memoryview):
+            return result.tobytes()
         return result
 
-    def pg_to_python(self, value: str | None, oid: int) -> Any:
+    def pg_to_python(self, value: str | bytes | None, oid: int) -> Any:
         """Convert a PostgreSQL text value to Python using the OID.
 
         Args:
-            value: Text value from PostgreSQL response, or None for NULL.
+            value: Text value from PostgreSQL response (``str`` from the HTTP
+                API or raw ``bytes`` from the wire protocol), or None for NULL.
             oid: PostgreSQL OID (dataTypeID) for type identification.
 
         Returns:
@@ -98,9 +206,11 @@ class TypeConverter:
 
         try:
             # Get the loader for this OID
-            loader = self._transformer.get_loader(oid, Format.TEXT)
+            loader = self._get_loader(oid)
 
-            return loader.load(value.encode())
+            if isinstance(value, str):
+                value = value.encode()
+            return loader.load(value)
 
         except Exception as e:
             raise
@@ -122,7 +232,24 @@ class TypeConverter:
         if params is None:
             return []
 
-        return [self.python_to_pg(p) for p in params]
+        python_to_pg = self.python_to_pg
+        return [python_to_pg(p) for p in params]
+
+    def convert_params_bytes(
+        self, params: Sequence[Any] | tuple[Any, ...] | None
+    ) -> list[bytes | bytearray | None]:
+        """Convert a list of Python parameters to encoded PostgreSQL text.
+
+        Args:
+            params: List or tuple of Python values.
+
+        Returns:
+            List of byte values for the PostgreSQL wire protocol.
+        """
+        if params is None:
+            return []
+
+        return [self.python_to_pg_bytes(p) for p in params]
 
     def convert_row(
         self,
@@ -157,6 +284,95 @@ class TypeConverter:
                 converted[key] = self.pg_to_python(value, oid)
             return converted
 
+    def convert_wire_rows(
+        self,
+        rows: Sequence[Sequence[bytes | None]],
+        fields: Sequence[dict[str, Any]],
+        array_mode: bool = False,
+    ) -> list[tuple[Any, ...]] | list[dict[str, Any]]:
+        """Convert raw wire-protocol rows to Python types.
+
+        Cells are the undecoded text-format bytes from ``DataRow`` messages,
+        so they are passed to the loaders directly without a ``str`` detour.
+
+        Args:
+            rows: Rows of raw cell bytes (None for NULL), in field order.
+            fields: Field metadata with name and dataTypeID for each column.
+            array_mode: Whether to return tuples instead of dicts.
+
+        Returns:
+            List of converted tuples (array mode) or dicts (object mode).
+        """
+        names, loaders = self._prepare_decoders(fields)
+        if array_mode:
+            return [
+                tuple(
+                    None if cell is None else loader.load(cell)
+                    for cell, loader in zip(row, loaders)
+                )
+                for row in rows
+            ]
+
+        return [
+            {
+                name: None if cell is None else loader.load(cell)
+                for name, cell, loader in zip(names, row, loaders)
+            }
+            for row in rows
+        ]
+
+    def _prepare_decoders(
+        self, fields: Sequence[dict[str, Any]]
+    ) -> tuple[list[str], list[Loader]]:
+        """Resolve column names and loaders once for a whole result set."""
+        names = [f.get("name", "") for f in fields]
+        loaders = [
+            self._get_loader(f.get("dataTypeID", PostgresOID.TEXT)) for f in fields
+        ]
+        return names, loaders
+
+    def convert_rows(
+        self,
+        rows: Sequence[dict[str, Any] | Sequence[Any]],
+        fields: Sequence[dict[str, Any]],
+        array_mode: bool = False,
+    ) -> list[tuple[Any, ...]] | list[dict[str, Any]]:
+        """Convert all rows of a Neon result set to Python types.
+
+        Equivalent to calling :meth:`convert_row` per row, but field metadata
+        is resolved to loaders once per result set instead of once per row.
+
+        Args:
+            rows: Row data (dicts in object mode, lists in array mode).
+            fields: Field metadata with dataTypeID for each column.
+            array_mode: Whether the response is in array mode.
+
+        Returns:
+            List of converted tuples (array mode) or dicts (object mode).
+        """
+        names, loaders = self._prepare_decoders(fields)
+
+        if array_mode:
+            return [
+                tuple(
+                    None if value is None else loader.load(value.encode())
+                    for value, loader in zip(row, loaders)
+                )
+                for row in rows
+            ]
+
+        text_loader = self._get_loader(PostgresOID.TEXT)
+        loader_by_name = dict(zip(names, loaders))
+        return [
+            {
+                key: None
+                if value is None
+                else loader_by_name.get(key, text_loader).load(value.encode())
+                for key, value in row.items()
+            }
+            for row in rows
+        ]
+
 
 # Common PostgreSQL OIDs for reference
 class PostgresOID:
@@ -207,23 +423,27 @@ def build_cursor_description(fields: list[dict[str, Any]]) -> tuple[tuple, ...]
     if not fields:
         return None
 
-    description = []
-    for field in fields:
-        name = field.get("name", "")
-        type_code = field.get("dataTypeID", PostgresOID.TEXT)
-        internal_size = field.get("dataTypeSize", -1)
-
-        # PEP 249 requires 7-tuple
-        description.append(
+    return _cursor_description(
+        tuple(
             (
-                name,  # name
-                type_code,  # type_code (OID)
-                None,  # display_size (not provided)
-                internal_size,  # internal_size
-                None,  # precision (not provided)
-                None,  # scale (not provided)
-                None,  # null_ok (not provided)
+                field.get("name", ""),
+                field.get("dataTypeID", PostgresOID.TEXT),
+                field.get("dataTypeSize", -1),
             )
+            for field in fields
         )
-
-    return tuple(description)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _cursor_description(
+    signature: tuple[tuple[str, int, int], ...],
+) -> tuple[tuple, ...]:
+    # Result sets of the same statement repeat the same columns, so their
+    # descriptions are built once and shared.
+    return tuple(
+        # name, type_code (OID), display_size, internal_size, precision,
+        # scale, null_ok; Neon only provides name, OID and size.
+        (name, type_code, None, internal_size, None, None, None)
+        for name, type_code, internal_size in signature
+    )
@@ -1,5 +1,4 @@
 from datetime import date
-import re
 import pytest
 import pytest_asyncio
 import sqlalchemy as sa
@@ -10,12 +9,14 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
 
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
 import aiohttp
 from sqlalchemy_neon import create_neon_native_async_engine, NeonNativeAsyncEngine
 
 from testsupport.models import User, Base
+from testsupport.naming import unique_suffix
+from testsupport.queries import equals_any
 
 import logfire
 
@@ -67,24 +68,31 @@ async def neondb(
 
 @pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def asyncpg_engine(require_neon, object_propagator):
-    """Create an async engine connected to Neon.
+    """Create one asyncpg engine shared by the whole session.
 
-    Uses the neonhttp_async dialect which wraps the synchronous
-    geventhttpclient-based HTTP client with SQLAlchemy's greenlet
-    async adapter.
+    Connects to the direct (session-mode) endpoint rather than the
+    ``-pooler`` host: PgBouncer in transaction mode may hand each statement
+    to a different server connection, which breaks asyncpg's prepared
+    statements. Reusing the engine keeps its per-connection statement cache
+    warm, so repeated query shapes skip parse and plan on the server.
     """
-    neon_url = require_neon.replace("postgresql://", "postgresql+asyncpg://")
-    neon_url = neon_url.replace(".aws.neon.tech", "-pooler.aws.neon.tech")
-    neon_url = neon_url.rpartition("?")[0]
-    neon_url = re.sub(r"(\.[\w-]+\.aws\.neon\.tech)", "-pooler\\1", neon_url)
+    neon_url = sa.make_url(require_neon).set(
+        drivername="postgresql+asyncpg",
+        # asyncpg rejects libpq options such as ``sslmode``; SSL is set below.
+        query={"prepared_statement_cache_size": "256"},
+    )
     engine = create_async_engine(
         neon_url,
         echo=False,
-        future=True,
-        expire_on_commit=False,
-        # pool_pre_ping=True,
+        connect_args={
+            "ssl": "require",
+            "statement_cache_size": 1024,
+            # Test queries are short; JIT compilation only adds planning time.
+            "server_settings": {"jit": "off"},
+        },
         pool_recycle=300,
-        pool_size=20,
+        pool_size=10,
+        max_overflow=20,
     )
 
     yield engine
@@ -113,32 +121,71 @@ async def asyncpg_session(
         yield sess
 
 
+def sample_user_rows() -> list[dict[str, Any]]:
+    """Column values for the sample users, as fresh dicts on every call."""
+    return [
+        {
+            "username": "alice",
+            "email": "alice@example.com",
+            "full_name": "Alice Johnson",
+            "is_active": True,
+            "birth_date": date(1990, 5, 15),
+            "profile": {"role": "admin", "preferences": {"theme": "dark"}},
+        },
+        {
+            "username": "bob",
+            "email": "bob@example.com",
+            "full_name": "Bob Smith",
+            "is_active": True,
+            "birth_date": date(1985, 8, 22),
+            "profile": {"role": "user", "preferences": {"theme": "light"}},
+        },
+        {
+            "username": "charlie",
+            "email": "charlie@example.com",
+            "full_name": "Charlie Brown",
+            "is_active": False,
+            "birth_date": date(1995, 12, 1),
+            "profile": {"role": "user", "preferences": {"theme": "auto"}},
+        },
+    ]
+
+
 @pytest.fixture
 def sample_users() -> list[User]:
     """Provide sample user data for testing."""
-    return [
-        User(
-            username="alice",
-            email="alice@example.com",
-            full_name="Alice Johnson",
-            is_active=True,
-            birth_date=date(1990, 5, 15),
-            profile={"role": "admin", "preferences": {"theme": "dark"}},
-        ),
-        User(
-            username="bob",
-            email="bob@example.com",
-            full_name="Bob Smith",
-            is_active=True,
-            birth_date=date(1985, 8, 22),
-            profile={"role": "user", "preferences": {"theme": "light"}},
-        ),
-        User(
-            username="charlie",
-            email="charlie@example.com",
-            full_name="Charlie Brown",
-            is_active=False,
-            birth_date=date(1995, 12, 1),
-            profile={"role": "user", "preferences": {"theme": "auto"}},
-        ),
-    ]
+    return [User(**row) for row in sample_user_rows()]
+
+
+@pytest_asyncio.fixture(scope="class")
+async def seeded_users(
+    neondb: NeonNativeAsyncEngine,
+) -> AsyncGenerator[list[sa.Row[tuple[int, str]]], None]:
+    """Insert the sample users once for all read-only tests in a class.
+
+    Usernames and emails get a unique suffix; tests filter by them instead
+    of inserting and deleting their own copies. The users are written with
+    one Core ``INSERT ... RETURNING`` and yielded as ``(id, username)`` rows,
+    in sample order, since no test needs them as ORM instances.
+    """
+    rows = sample_user_rows()
+    suffix = unique_suffix()
+    for row in rows:
+        row["username"] = f"{row['username']}_{suffix}"
+        row["email"] = row["email"].replace("@", f"_{suffix}@")
+    result = await neondb.execute(
+        sa.insert(User).values(rows).returning(User.id, User.username)
+    )
+    users = result.all()
+    try:
+        yield users
+    finally:
+        await neondb.execute(
+            sa.delete(User).where(equals_any(User.id, (user.id for user in users)))
+        )
+
+
+@pytest.fixture(scope="class")
+def seeded_usernames(seeded_users: list[sa.Row[tuple[int, str]]]) -> frozenset[str]:
+    """Usernames of :func:`seeded_users`, built once per class."""
+    return frozenset(user.username for user in seeded_users)
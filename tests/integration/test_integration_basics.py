@@ -13,34 +13,68 @@ Tests cover:
 - Different SQLAlchemy ORM features
 - Type conversions for different PostgreSQL data types
 - Async dialect only (sync is disabled)
+
+Every engine call commits on its own, and tests do not delete the rows they
+write: names are unique per test and the session fixture recreates the schema
+on the next run, so cleanup would only add round trips. Only class-scoped
+seeds such as ``seeded_users`` clean up, since whole classes read them.
 """
 
 from __future__ import annotations
 
-import uuid
+import asyncio
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from uuid import UUID
 
 import pytest
+import pytest_asyncio
 import sqlalchemy as sa
-from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import contains_eager, selectinload
 from sqlalchemy_neon import NeonNativeAsyncEngine
 
-from testsupport.models import Base, Comment, Post, Product, Tag, User, post_tags
+from testsupport.models import Base, Comment, Post, Product, User
+from testsupport.naming import unique_suffix
+from testsupport.seeding import TagIdCache, attach_tags, copy_insert
+
+
+# Username filters bind the names as one array (``username = ANY(:names)``)
+# instead of an expanding IN, so the SQL is the same for any number of names:
+# each statement shape below compiles once and the server plans it once.
+_IN_NAMES = User.username == sa.any_(sa.bindparam("names", type_=ARRAY(sa.Text)))
+_USERS_BY_NAME = sa.select(User).where(_IN_NAMES)
+_USERNAMES_BY_NAME = sa.select(User.username).where(_IN_NAMES)
+_COUNT_BY_NAME = sa.select(sa.func.count()).select_from(User).where(_IN_NAMES)
+_USER_BY_ID = sa.select(User).where(User.id == sa.bindparam("id"))
+_PRODUCT_BY_ID = sa.select(Product).where(Product.id == sa.bindparam("id"))
+
+
+@pytest.fixture
+def unique_prefix(request: pytest.FixtureRequest) -> str:
+    """Name prefix unique to the running test, for the rows it creates."""
+    return f"{request.node.name}_{unique_suffix()}"
+
 
+@pytest_asyncio.fixture(scope="class")
+async def stored_product(neondb: NeonNativeAsyncEngine) -> Product:
+    """Insert one product shared by the numeric type tests of a class.
 
-def get_unique_name(name: str) -> str:
-    """Append a short unique suffix to a name."""
-    return f"{name}_{uuid.uuid4().hex[:8]}"
+    ``add()`` copies the ``RETURNING`` row, as stored, back onto it.
+    """
+    product = Product(
+        name=f"numeric_{unique_suffix()}", price=Decimal("123.45"), stock=999999
+    )
+    await neondb.add(product)
+    return product
 
 
 @pytest.fixture
-def unique_users(sample_users: list[User]) -> list[User]:
+def unique_users(sample_users: list[User], unique_prefix: str) -> list[User]:
     """Provide sample users with unique usernames."""
     for user in sample_users:
-        user.username = get_unique_name(user.username)
-        user.email = get_unique_name(user.email.split("@")[0]) + "@example.com"
+        user.username = f"{unique_prefix}_{user.username}"
+        user.email = f"{unique_prefix}_{user.email}"
     return sample_users
 
 
@@ -49,20 +83,20 @@ class TestAsyncBasicCRUD:
     """Test basic CRUD operations with async engine."""
 
     async def test_insert_single_user(
-        self, neondb: NeonNativeAsyncEngine, sample_users: list[User]
+        self,
+        neondb: NeonNativeAsyncEngine,
+        sample_users: list[User],
+        unique_prefix: str,
     ):
         """Test inserting a single user."""
         user = sample_users[0]
-        user.username = get_unique_name("alice")
+        user.username = f"{unique_prefix}_alice"
         await neondb.add(user)
 
         assert user.id is not None
         assert user.uuid is not None
         assert "alice" in user.username
 
-        q = sa.delete(User).where(User.id == user.id)
-        await neondb.execute(q)
-
     async def test_insert_multiple_users(
         self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
     ):
@@ -72,266 +106,171 @@ class TestAsyncBasicCRUD:
         for user in unique_users:
             assert user.id is not None
 
-        q = sa.delete(User).where(User.id.in_([u.id for u in unique_users]))
-        await neondb.execute(q)
-
     async def test_select_all_users(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+        self, neondb: NeonNativeAsyncEngine, seeded_usernames: frozenset[str]
     ):
         """Test selecting all users."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
         result = await neondb.execute(
-            sa.select(User).where(User.username.in_(usernames))
+            _USERS_BY_NAME, {"names": list(seeded_usernames)}
         )
         users = result.scalars().all()
 
         assert len(users) == 3
-        assert {u.username for u in users} == usernames
-
-        await neondb.delete_all(users)
+        assert frozenset(u.username for u in users) == seeded_usernames
 
     async def test_select_by_id(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+        self, neondb: NeonNativeAsyncEngine, seeded_users: list[sa.Row]
     ):
         """Test selecting a user by primary key."""
-        await neondb.add_all(unique_users)
-        user_id = unique_users[0].id
+        user_id = seeded_users[0].id
 
-        result = await neondb.execute(sa.select(User).where(User.id == user_id))
+        result = await neondb.execute(_USER_BY_ID, {"id": user_id})
         user = result.scalar_one_or_none()
         assert user is not None
-        assert user.username == unique_users[0].username
-
-        await neondb.delete_all(unique_users)
+        assert user.username == seeded_users[0].username
 
     async def test_update_user(
-        self, neondb: NeonNativeAsyncEngine, sample_users: list[User]
+        self,
+        neondb: NeonNativeAsyncEngine,
+        sample_users: list[User],
+        unique_prefix: str,
     ):
         """Test updating user attributes."""
         user = sample_users[0]
-        user.username = get_unique_name("update_user")
+        user.username = f"{unique_prefix}_update_user"
         await neondb.add(user)
 
-        await neondb.execute(
+        result = await neondb.execute(
             sa.update(User)
             .where(User.id == user.id)
             .values(full_name="Alice Wonder", is_active=False)
+            .returning(User.full_name, User.is_active)
         )
-
-        result = await neondb.execute(sa.select(User).where(User.id == user.id))
-        updated_user = result.scalar_one()
-        assert updated_user.full_name == "Alice Wonder"
-        assert updated_user.is_active is False
-
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
+        assert result.one() == ("Alice Wonder", False)
 
     async def test_delete_user(
-        self, neondb: NeonNativeAsyncEngine, sample_users: list[User]
+        self,
+        neondb: NeonNativeAsyncEngine,
+        sample_users: list[User],
+        unique_prefix: str,
     ):
         """Test deleting a user."""
         user = sample_users[0]
-        user.username = get_unique_name("delete_user")
+        user.username = f"{unique_prefix}_delete_user"
         await neondb.add(user)
         user_id = user.id
 
-        await neondb.execute(sa.delete(User).where(User.id == user_id))
-
-        result = await neondb.execute(sa.select(User).where(User.id == user_id))
-        deleted_user = result.scalar_one_or_none()
-        assert deleted_user is None
+        result = await neondb.execute(
+            sa.delete(User).where(User.id == user_id).returning(User.id)
+        )
+        # Exactly one row came back, so exactly one row was deleted.
+        assert result.scalar_one() == user_id
 
 
 @pytest.mark.asyncio
 class TestAsyncQueryPatterns:
     """Test various query patterns and filtering."""
 
-    async def test_filter_by_equality(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+    @pytest.mark.parametrize(
+        ("where", "expected"),
+        [
+            pytest.param(
+                lambda names: User.username == names["bob"], {"bob"}, id="equality"
+            ),
+            pytest.param(lambda names: User.is_active, {"alice", "bob"}, id="boolean"),
+            pytest.param(
+                lambda names: sa.and_(User.is_active, User.username.like("%alice%")),
+                {"alice"},
+                id="and",
+            ),
+            pytest.param(
+                lambda names: sa.or_(
+                    User.username == names["alice"], User.username == names["bob"]
+                ),
+                {"alice", "bob"},
+                id="or",
+            ),
+            pytest.param(
+                lambda names: User.username.in_([names["alice"], names["charlie"]]),
+                {"alice", "charlie"},
+                id="in",
+            ),
+            pytest.param(
+                lambda names: User.full_name.like("%Smith%"), {"bob"}, id="like"
+            ),
+        ],
+    )
+    async def test_filter(
+        self,
+        neondb: NeonNativeAsyncEngine,
+        seeded_usernames: frozenset[str],
+        where,
+        expected: set[str],
     ):
-        """Test filtering with equality conditions."""
-        await neondb.add_all(unique_users)
-
-        bob_username = next(u.username for u in unique_users if "bob" in u.username)
-        stmt = sa.select(User).where(User.username == bob_username)
-        result = await neondb.execute(stmt)
-        user = result.scalar_one()
-        assert "bob" in user.email
-
-        await neondb.delete_all(unique_users)
-
-    async def test_filter_by_inequality(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
-    ):
-        """Test filtering with inequality conditions."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
-        stmt = sa.select(User).where(
-            sa.and_(User.is_active, User.username.in_(usernames))
+        """Test WHERE clauses against the shared sample users."""
+        # Seeded usernames are "<sample name>_<suffix>".
+        names = {name.partition("_")[0]: name for name in seeded_usernames}
+        # The seed set is bound by value: the IN case renders its list at
+        # compile time, which needs every bind value up front.
+        seeded = sa.bindparam("names", list(seeded_usernames), type_=ARRAY(sa.Text))
+        stmt = sa.select(User.username).where(
+            User.username == sa.any_(seeded), where(names)
         )
         result = await neondb.execute(stmt)
-        active_users = result.scalars().all()
-        assert len(active_users) == 2
-        assert all(u.is_active for u in active_users)
-
-        await neondb.delete_all(unique_users)
+        found = result.scalars().all()
+        assert {username.partition("_")[0] for username in found} == expected
 
-    async def test_filter_with_and(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+    async def test_filter_with_null(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
     ):
-        """Test AND conditions."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
-        stmt = sa.select(User).where(
-            sa.and_(
-                User.is_active,
-                User.username.in_(usernames),
-                User.username.like("%alice%"),
-            )
-        )
-        result = await neondb.execute(stmt)
-        users = result.scalars().all()
-        assert len(users) == 1
-        assert "alice" in users[0].username
-
-        await neondb.delete_all(unique_users)
-
-    async def test_filter_with_or(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
-    ):
-        """Test OR conditions."""
-        await neondb.add_all(unique_users)
-
-        u1, u2 = unique_users[0].username, unique_users[1].username
-        stmt = sa.select(User).where(sa.or_(User.username == u1, User.username == u2))
-        result = await neondb.execute(stmt)
-        users = result.scalars().all()
-        found_usernames = {u.username for u in users}
-        assert u1 in found_usernames
-        assert u2 in found_usernames
-
-        await neondb.delete_all(unique_users)
-
-    async def test_filter_with_in(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
-    ):
-        """Test IN operator."""
-        await neondb.add_all(unique_users)
-
-        u1, u3 = unique_users[0].username, unique_users[2].username
-        stmt = sa.select(User).where(User.username.in_([u1, u3]))
-        result = await neondb.execute(stmt)
-        users = result.scalars().all()
-        found_usernames = {u.username for u in users}
-        assert u1 in found_usernames
-        assert u3 in found_usernames
-
-        await neondb.delete_all(unique_users)
-
-    async def test_filter_with_like(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
-    ):
-        """Test LIKE pattern matching."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
-        stmt = sa.select(User).where(
-            sa.and_(User.username.in_(usernames), User.full_name.like("%Smith%"))
-        )
-        result = await neondb.execute(stmt)
-        users = result.scalars().all()
-        assert len(users) == 1
-        assert "bob" in users[0].username
-
-        await neondb.delete_all(unique_users)
-
-    async def test_filter_with_null(self, neondb: NeonNativeAsyncEngine):
         """Test NULL checks."""
-        uname = get_unique_name("dave")
+        uname = f"{unique_prefix}_dave"
         user = User(username=uname, email=f"{uname}@example.com")
         await neondb.add(user)
 
         stmt = (
-            sa.select(User)
+            sa.select(User.username)
             .where(User.username == uname)
             .where(User.full_name.is_(None))
         )
         result = await neondb.execute(stmt)
-        found_user = result.scalar_one()
-        assert found_user.username == uname
-
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
+        assert result.scalar_one() == uname
 
     async def test_order_by_asc(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+        self, neondb: NeonNativeAsyncEngine, seeded_usernames: frozenset[str]
     ):
         """Test ORDER BY ascending."""
-        await neondb.add_all(unique_users)
-
-        usernames = sorted([u.username for u in unique_users])
-        stmt = (
-            sa.select(User)
-            .where(User.username.in_(usernames))
-            .order_by(sa.asc(User.username))
-        )
-        result = await neondb.execute(stmt)
-        users = result.scalars().all()
-        assert [u.username for u in users] == usernames
-
-        await neondb.delete_all(unique_users)
+        usernames = sorted(seeded_usernames)
+        stmt = _USERNAMES_BY_NAME.order_by(sa.asc(User.username))
+        result = await neondb.execute(stmt, {"names": usernames})
+        assert result.scalars().all() == usernames
 
     async def test_order_by_desc(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+        self, neondb: NeonNativeAsyncEngine, seeded_usernames: frozenset[str]
     ):
         """Test ORDER BY descending."""
-        await neondb.add_all(unique_users)
+        stmt = _USERNAMES_BY_NAME.order_by(sa.desc(User.created_at))
+        result = await neondb.execute(stmt, {"names": list(seeded_usernames)})
+        # One INSERT seeded the users, so their created_at values tie.
+        assert frozenset(result.scalars().all()) == seeded_usernames
 
-        usernames = {u.username for u in unique_users}
-        stmt = (
-            sa.select(User)
-            .where(User.username.in_(usernames))
-            .order_by(sa.desc(User.created_at))
-        )
-        result = await neondb.execute(stmt)
-        users = result.scalars().all()
-        assert len(users) == 3
-
-        await neondb.delete_all(unique_users)
-
-    async def test_limit(self, neondb: NeonNativeAsyncEngine, unique_users: list[User]):
+    async def test_limit(
+        self, neondb: NeonNativeAsyncEngine, seeded_usernames: frozenset[str]
+    ):
         """Test LIMIT clause."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
-        stmt = sa.select(User).where(User.username.in_(usernames)).limit(2)
-        result = await neondb.execute(stmt)
-        users = result.scalars().all()
-        assert len(users) == 2
-
-        await neondb.delete_all(unique_users)
+        limited = sa.select(User.id).where(_IN_NAMES).limit(2).subquery()
+        stmt = sa.select(sa.func.count()).select_from(limited)
+        result = await neondb.execute(stmt, {"names": list(seeded_usernames)})
+        assert result.scalar_one() == 2
 
     async def test_offset(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+        self, neondb: NeonNativeAsyncEngine, seeded_usernames: frozenset[str]
     ):
         """Test OFFSET clause."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
-        stmt = (
-            sa.select(User)
-            .where(User.username.in_(usernames))
-            .order_by(User.id)
-            .offset(1)
-            .limit(2)
-        )
-        result = await neondb.execute(stmt)
-        users = result.scalars().all()
-        assert len(users) == 2
-
-        await neondb.delete_all(unique_users)
+        page = sa.select(User.id).where(_IN_NAMES).order_by(User.id).offset(1).limit(2)
+        stmt = sa.select(sa.func.count()).select_from(page.subquery())
+        result = await neondb.execute(stmt, {"names": list(seeded_usernames)})
+        assert result.scalar_one() == 2
 
 
 @pytest.mark.asyncio
@@ -339,50 +278,39 @@ class TestAsyncAggregations:
     """Test aggregation functions."""
 
     async def test_count_all(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+        self, neondb: NeonNativeAsyncEngine, seeded_usernames: frozenset[str]
     ):
         """Test COUNT(*)."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
-        stmt = (
-            sa.select(sa.func.count())
-            .select_from(User)
-            .where(User.username.in_(usernames))
+        result = await neondb.execute(
+            _COUNT_BY_NAME, {"names": list(seeded_usernames)}
         )
-        result = await neondb.execute(stmt)
         count = result.scalar()
         assert count == 3
 
-        await neondb.delete_all(unique_users)
-
     async def test_count_with_filter(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+        self, neondb: NeonNativeAsyncEngine, seeded_usernames: frozenset[str]
     ):
         """Test COUNT with WHERE clause."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
-        stmt = (
-            sa.select(sa.func.count())
-            .select_from(User)
-            .where(sa.and_(User.is_active, User.username.in_(usernames)))
-        )
-        result = await neondb.execute(stmt)
+        stmt = _COUNT_BY_NAME.where(User.is_active)
+        result = await neondb.execute(stmt, {"names": list(seeded_usernames)})
         count = result.scalar()
         assert count == 2
 
-        await neondb.delete_all(unique_users)
-
-    async def test_sum_aggregation(self, neondb: NeonNativeAsyncEngine):
+    async def test_sum_aggregation(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
         """Test SUM aggregation."""
-        pname = get_unique_name("Widget Sum")
-        products = [
-            Product(name=f"{pname}_A", price=Decimal("10.50"), stock=100),
-            Product(name=f"{pname}_B", price=Decimal("25.00"), stock=50),
-            Product(name=f"{pname}_C", price=Decimal("5.25"), stock=200),
-        ]
-        await neondb.add_all(products)
+        pname = f"{unique_prefix}_widget_sum"
+        await copy_insert(
+            neondb,
+            Product.__table__,
+            ["name", "price_cents", "stock"],
+            [
+                (f"{pname}_A", 1050, 100),
+                (f"{pname}_B", 2500, 50),
+                (f"{pname}_C", 525, 200),
+            ],
+        )
 
         stmt = sa.select(sa.func.sum(Product.stock)).where(
             Product.name.like(f"{pname}%")
@@ -391,16 +319,17 @@ class TestAsyncAggregations:
         total_stock = result.scalar()
         assert total_stock == 350
 
-        await neondb.delete_all(products)
-
-    async def test_avg_aggregation(self, neondb: NeonNativeAsyncEngine):
+    async def test_avg_aggregation(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
         """Test AVG aggregation."""
-        pname = get_unique_name("Widget Avg")
-        products = [
-            Product(name=f"{pname}_A", price=Decimal("10.00"), stock=100),
-            Product(name=f"{pname}_B", price=Decimal("20.00"), stock=50),
-        ]
-        await neondb.add_all(products)
+        pname = f"{unique_prefix}_widget_avg"
+        await copy_insert(
+            neondb,
+            Product.__table__,
+            ["name", "price_cents", "stock"],
+            [(f"{pname}_A", 1000, 100), (f"{pname}_B", 2000, 50)],
+        )
 
         stmt = sa.select(sa.func.avg(Product.price)).where(
             Product.name.like(f"{pname}%")
@@ -409,17 +338,21 @@ class TestAsyncAggregations:
         avg_price = result.scalar()
         assert float(avg_price) == 15.0
 
-        await neondb.delete_all(products)
-
-    async def test_min_max_aggregation(self, neondb: NeonNativeAsyncEngine):
+    async def test_min_max_aggregation(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
         """Test MIN and MAX aggregations."""
-        pname = get_unique_name("Widget MM")
-        products = [
-            Product(name=f"{pname}_A", price=Decimal("10.50"), stock=100),
-            Product(name=f"{pname}_B", price=Decimal("25.00"), stock=50),
-            Product(name=f"{pname}_C", price=Decimal("5.25"), stock=200),
-        ]
-        await neondb.add_all(products)
+        pname = f"{unique_prefix}_widget_mm"
+        await copy_insert(
+            neondb,
+            Product.__table__,
+            ["name", "price_cents", "stock"],
+            [
+                (f"{pname}_A", 1050, 100),
+                (f"{pname}_B", 2500, 50),
+                (f"{pname}_C", 525, 200),
+            ],
+        )
 
         stmt = sa.select(sa.func.min(Product.price), sa.func.max(Product.price)).where(
             Product.name.like(f"{pname}%")
@@ -429,40 +362,36 @@ class TestAsyncAggregations:
         assert min_price == Decimal("5.25")
         assert max_price == Decimal("25.00")
 
-        await neondb.delete_all(products)
-
     async def test_group_by(
-        self, neondb: NeonNativeAsyncEngine, unique_users: list[User]
+        self, neondb: NeonNativeAsyncEngine, seeded_usernames: frozenset[str]
     ):
         """Test GROUP BY with COUNT."""
-        await neondb.add_all(unique_users)
-
-        usernames = {u.username for u in unique_users}
         stmt = (
             sa.select(User.is_active, sa.func.count(User.id))
-            .where(User.username.in_(usernames))
+            .where(_IN_NAMES)
             .group_by(User.is_active)
         )
-        result = await neondb.execute(stmt)
+        result = await neondb.execute(stmt, {"names": list(seeded_usernames)})
         rows = result.all()
         result_dict = {is_active: count for is_active, count in rows}
 
         assert result_dict[True] == 2
         assert result_dict[False] == 1
 
-        await neondb.delete_all(unique_users)
-
 
 @pytest.mark.asyncio
 class TestAsyncRelationships:
     """Test foreign key relationships and joins."""
 
     async def test_one_to_many_relationship(
-        self, neondb: NeonNativeAsyncEngine, sample_users: list[User]
+        self,
+        neondb: NeonNativeAsyncEngine,
+        sample_users: list[User],
+        unique_prefix: str,
     ):
         """Test one-to-many relationship (User -> Posts)."""
         user = sample_users[0]
-        user.username = get_unique_name("one_to_many")
+        user.username = f"{unique_prefix}_one_to_many"
         await neondb.add(user)
 
         post1 = Post(title="First Post", content="Hello World", author_id=user.id)
@@ -478,35 +407,41 @@ class TestAsyncRelationships:
         assert len(found_user.posts) == 2
         assert {p.title for p in found_user.posts} == {"First Post", "Second Post"}
 
-        await neondb.delete_all([user, post1, post2])
-
     async def test_many_to_one_relationship(
-        self, neondb: NeonNativeAsyncEngine, sample_users: list[User]
+        self,
+        neondb: NeonNativeAsyncEngine,
+        sample_users: list[User],
+        unique_prefix: str,
     ):
         """Test many-to-one relationship (Post -> User)."""
         user = sample_users[0]
-        user.username = get_unique_name("many_to_one")
+        user.username = f"{unique_prefix}_many_to_one"
         await neondb.add(user)
 
         post = Post(title="Test Post", content="Content", author_id=user.id)
         await neondb.add(post)
 
+        # The author comes back in the same row as the post, from one JOIN.
         stmt = (
-            sa.select(Post).options(selectinload(Post.author)).where(Post.id == post.id)
+            sa.select(Post)
+            .join(Post.author)
+            .options(contains_eager(Post.author))
+            .where(Post.id == post.id)
         )
         result = await neondb.execute(stmt)
         found_post = result.scalar_one()
 
         assert found_post.author.username == user.username
 
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
-
     async def test_join_query(
-        self, neondb: NeonNativeAsyncEngine, sample_users: list[User]
+        self,
+        neondb: NeonNativeAsyncEngine,
+        sample_users: list[User],
+        unique_prefix: str,
     ):
         """Test JOIN between tables."""
         user = sample_users[0]
-        user.username = get_unique_name("join_user")
+        user.username = f"{unique_prefix}_join_user"
         await neondb.add(user)
 
         post = Post(
@@ -529,19 +464,21 @@ class TestAsyncRelationships:
         assert found_title == "Alice's Post Unique"
         assert found_username == user.username
 
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
-
     async def test_many_to_many_relationship(
-        self, neondb: NeonNativeAsyncEngine, sample_users: list[User]
+        self,
+        neondb: NeonNativeAsyncEngine,
+        sample_users: list[User],
+        unique_prefix: str,
     ):
         """Test many-to-many relationship (Post <-> Tags)."""
         user = sample_users[0]
-        user.username = get_unique_name("m2m_user")
-        await neondb.add(user)
-
-        tag1 = Tag(name=get_unique_name("python"))
-        tag2 = Tag(name=get_unique_name("sqlalchemy"))
-        await neondb.add_all([tag1, tag2])
+        user.username = f"{unique_prefix}_m2m_user"
+        tag_names = {f"{unique_prefix}_python", f"{unique_prefix}_sqlalchemy"}
+        # The user and the tags don't reference each other, so write them
+        # concurrently; the tags with one get-or-create INSERT ... RETURNING.
+        _, tag_ids = await asyncio.gather(
+            neondb.add(user), TagIdCache().ensure_ids(neondb, tag_names)
+        )
 
         post = Post(
             title="SQLAlchemy Tutorial M2M",
@@ -550,14 +487,7 @@ class TestAsyncRelationships:
         )
         await neondb.add(post)
 
-        await neondb.execute(
-            sa.insert(post_tags).values(
-                [
-                    {"post_id": post.id, "tag_id": tag1.id},
-                    {"post_id": post.id, "tag_id": tag2.id},
-                ]
-            )
-        )
+        await attach_tags(neondb, post.id, tag_ids.values())
 
         stmt = (
             sa.select(Post).options(selectinload(Post.tags)).where(Post.id == post.id)
@@ -566,17 +496,18 @@ class TestAsyncRelationships:
         found_post = result.scalar_one()
 
         assert len(found_post.tags) == 2
-        assert {t.name for t in found_post.tags} == {tag1.name, tag2.name}
-
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
+        assert {t.name for t in found_post.tags} == tag_names
 
     async def test_nested_relationships(
-        self, neondb: NeonNativeAsyncEngine, sample_users: list[User]
+        self,
+        neondb: NeonNativeAsyncEngine,
+        sample_users: list[User],
+        unique_prefix: str,
     ):
         """Test nested relationships (User -> Post -> Comments)."""
         user1, user2 = sample_users[0], sample_users[1]
-        user1.username = get_unique_name("nested1")
-        user2.username = get_unique_name("nested2")
+        user1.username = f"{unique_prefix}_nested1"
+        user2.username = f"{unique_prefix}_nested2"
         await neondb.add_all([user1, user2])
 
         post = Post(title="Discussion Nested", content="Let's talk", author_id=user1.id)
@@ -586,13 +517,17 @@ class TestAsyncRelationships:
         comment2 = Comment(content="Thanks!", post_id=post.id, author_id=user1.id)
         await neondb.add_all([comment1, comment2])
 
+        # Comments and their authors are few, so join them in rather than
+        # loading each level with its own SELECT.
         stmt = (
             sa.select(Post)
-            .options(selectinload(Post.comments).selectinload(Comment.author))
+            .join(Post.comments)
+            .join(Comment.author)
+            .options(contains_eager(Post.comments).contains_eager(Comment.author))
             .where(Post.id == post.id)
         )
         result = await neondb.execute(stmt)
-        found_post = result.scalar_one()
+        found_post = result.unique().scalar_one()
 
         assert len(found_post.comments) == 2
         assert {c.author.username for c in found_post.comments} == {
@@ -600,34 +535,33 @@ class TestAsyncRelationships:
             user2.username,
         }
 
-        await neondb.execute(sa.delete(User).where(User.id.in_([user1.id, user2.id])))
-
 
 @pytest.mark.asyncio
 class TestAsyncTransactions:
     """Test transaction handling."""
 
-    async def test_commit_transaction(self, neondb: NeonNativeAsyncEngine):
+    async def test_commit_transaction(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
         """Test successful transaction commit."""
-        uname = get_unique_name("commit_test")
+        uname = f"{unique_prefix}_commit_test"
         user = User(username=uname, email=f"{uname}@example.com")
         await neondb.add(user)
 
-        stmt = sa.select(User).where(User.username == uname)
+        stmt = sa.select(User.email).where(User.username == uname)
         result = await neondb.execute(stmt)
-        found_user = result.scalar_one()
-        assert found_user.email == f"{uname}@example.com"
-
-        await neondb.delete_all([found_user])
+        assert result.scalar_one() == f"{uname}@example.com"
 
 
 @pytest.mark.asyncio
 class TestAsyncJSONBOperations:
     """Test JSONB column operations."""
 
-    async def test_insert_jsonb(self, neondb: NeonNativeAsyncEngine):
-        """Test inserting JSONB data."""
-        uname = get_unique_name("json_user")
+    async def test_insert_jsonb(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
+        """Test inserting JSONB data and reading it back with a fresh SELECT."""
+        uname = f"{unique_prefix}_json_user"
         user = User(
             username=uname,
             email=f"{uname}@example.com",
@@ -638,128 +572,142 @@ class TestAsyncJSONBOperations:
         )
         await neondb.add(user)
 
-        result = await neondb.execute(sa.select(User).where(User.id == user.id))
+        result = await neondb.execute(_USER_BY_ID, {"id": user.id})
         found_user = result.scalar_one()
         assert found_user.profile["role"] == "admin"
         assert found_user.profile["settings"]["theme"] == "dark"
 
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
-
-    async def test_update_jsonb(self, neondb: NeonNativeAsyncEngine):
+    async def test_update_jsonb(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
         """Test updating JSONB data."""
-        uname = get_unique_name("json_user_upd")
+        uname = f"{unique_prefix}_json_user_upd"
         user = User(
             username=uname, email=f"{uname}@example.com", profile={"role": "user"}
         )
         await neondb.add(user)
 
-        await neondb.execute(
+        result = await neondb.execute(
             sa.update(User)
             .where(User.id == user.id)
             .values(profile={"role": "admin", "level": 5})
+            .returning(User.profile)
         )
-
-        result = await neondb.execute(sa.select(User).where(User.id == user.id))
-        found_user = result.scalar_one()
-        assert found_user.profile["role"] == "admin"
-        assert found_user.profile["level"] == 5
-
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
+        profile = result.scalar_one()
+        assert profile["role"] == "admin"
+        assert profile["level"] == 5
 
 
 @pytest.mark.asyncio
 class TestAsyncNumericTypes:
     """Test numeric type handling."""
 
-    async def test_decimal_precision(self, neondb: NeonNativeAsyncEngine):
-        """Test Decimal type with precision."""
-        pname = get_unique_name("Decimal Prod")
-        product = Product(name=pname, price=Decimal("123.45"), stock=10)
-        await neondb.add(product)
-
-        result = await neondb.execute(
-            sa.select(Product).where(Product.id == product.id)
-        )
-        found_product = result.scalar_one()
-        assert found_product.price == Decimal("123.45")
-        assert isinstance(found_product.price, Decimal)
-
-        await neondb.execute(sa.delete(Product).where(Product.id == product.id))
-
-    async def test_integer_types(self, neondb: NeonNativeAsyncEngine):
-        """Test integer type handling."""
-        pname = get_unique_name("Integer Prod")
-        product = Product(name=pname, price=Decimal("10.00"), stock=999999)
-        await neondb.add(product)
-
-        result = await neondb.execute(
-            sa.select(Product).where(Product.id == product.id)
-        )
-        found_product = result.scalar_one()
-        assert found_product.stock == 999999
-        assert isinstance(found_product.stock, int)
-
-        await neondb.execute(sa.delete(Product).where(Product.id == product.id))
+    @pytest.mark.parametrize(
+        ("field", "expected", "pytype"),
+        [
+            pytest.param("price", Decimal("123.45"), Decimal, id="decimal"),
+            pytest.param("price_cents", 12345, int, id="cents"),
+            pytest.param("stock", 999999, int, id="integer"),
+        ],
+    )
+    async def test_numeric_column(
+        self, stored_product: Product, field: str, expected, pytype: type
+    ):
+        """Test Decimal and integer columns as stored."""
+        value = getattr(stored_product, field)
+        assert value == expected
+        assert isinstance(value, pytype)
 
 
 @pytest.mark.asyncio
 class TestAsyncDateTimeTypes:
     """Test date and datetime type handling."""
 
-    async def test_date_type(self, neondb: NeonNativeAsyncEngine):
+    async def test_date_type(self, neondb: NeonNativeAsyncEngine, unique_prefix: str):
         """Test Date type."""
-        uname = get_unique_name("date_user")
+        uname = f"{unique_prefix}_date_user"
         user = User(
             username=uname, email=f"{uname}@example.com", birth_date=date(1990, 1, 15)
         )
         await neondb.add(user)
 
-        result = await neondb.execute(sa.select(User).where(User.id == user.id))
-        found_user = result.scalar_one()
-        assert found_user.birth_date == date(1990, 1, 15)
-        assert isinstance(found_user.birth_date, date)
-
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
+        assert user.birth_date == date(1990, 1, 15)
+        assert isinstance(user.birth_date, date)
 
-    async def test_datetime_type(self, neondb: NeonNativeAsyncEngine):
+    async def test_datetime_type(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
         """Test DateTime type."""
         now = datetime.now(UTC).replace(microsecond=0, tzinfo=None)
-        uname = get_unique_name("datetime_user")
+        uname = f"{unique_prefix}_datetime_user"
         user = User(username=uname, email=f"{uname}@example.com", created_at=now)
         await neondb.add(user)
 
-        result = await neondb.execute(sa.select(User).where(User.id == user.id))
-        found_user = result.scalar_one()
-        assert abs((found_user.created_at - now).total_seconds()) < 1
-
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
+        assert abs((user.created_at - now).total_seconds()) < 1
 
 
 @pytest.mark.asyncio
 class TestAsyncUUIDType:
     """Test UUID type handling."""
 
-    async def test_uuid_generation(self, neondb: NeonNativeAsyncEngine):
+    async def test_uuid_generation(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
         """Test automatic UUID generation."""
-        uname = get_unique_name("uuid_user")
+        uname = f"{unique_prefix}_uuid_user"
         user = User(username=uname, email=f"{uname}@example.com")
         await neondb.add(user)
 
         assert user.uuid is not None
         assert isinstance(user.uuid, UUID)
 
-        await neondb.execute(sa.delete(User).where(User.id == user.id))
-
-    async def test_uuid_query(self, neondb: NeonNativeAsyncEngine):
+    async def test_uuid_query(self, neondb: NeonNativeAsyncEngine, unique_prefix: str):
         """Test querying by UUID."""
-        uname = get_unique_name("uuid_query")
+        uname = f"{unique_prefix}_uuid_query"
         user = User(username=uname, email=f"{uname}@example.com")
         await neondb.add(user)
         user_uuid = user.uuid
 
-        stmt = sa.select(User).where(User.uuid == user_uuid)
+        stmt = sa.select(User.username).where(User.uuid == user_uuid)
         result = await neondb.execute(stmt)
-        found_user = result.scalar_one()
-        assert found_user.username == uname
+        assert result.scalar_one() == uname
+
+
+@pytest.mark.asyncio
+class TestAsyncTypeRoundTrip:
+    """Read typed columns back with a fresh SELECT.
+
+    The per-type tests above assert on the values ``add()`` copies from the
+    ``RETURNING`` row; this test covers the SELECT decode path once for all
+    of them.
+    """
 
-        await neondb.delete(user)
+    async def test_typed_columns_round_trip(
+        self, neondb: NeonNativeAsyncEngine, unique_prefix: str
+    ):
+        """Test date, datetime, UUID, Decimal and integer columns re-read."""
+        now = datetime.now(UTC).replace(microsecond=0, tzinfo=None)
+        user = User(
+            username=f"{unique_prefix}_user",
+            email=f"{unique_prefix}@example.com",
+            birth_date=date(1990, 1, 15),
+            created_at=now,
+        )
+        product = Product(
+            name=f"{unique_prefix}_product", price=Decimal("123.45"), stock=999999
+        )
+        await neondb.add_all([user, product], independent=True)
+
+        user_result, product_result = await asyncio.gather(
+            neondb.execute(_USER_BY_ID, {"id": user.id}),
+            neondb.execute(_PRODUCT_BY_ID, {"id": product.id}),
+        )
+        found_user = user_result.scalar_one()
+        found_product = product_result.scalar_one()
+
+        assert found_user.birth_date == date(1990, 1, 15)
+        assert found_user.created_at == now
+        assert found_user.uuid == user.uuid
+        assert isinstance(found_user.uuid, UUID)
+        assert found_product.price == Decimal("123.45")
+        assert found_product.stock == 999999
@@ -6,83 +6,116 @@ Focuses on complex fetch patterns and parallel execution.
 from __future__ import annotations
 
 import asyncio
-import time
-import uuid
 
 import pytest
 import pytest_asyncio
 import sqlalchemy as sa
-from sqlalchemy.orm import joinedload, selectinload, subqueryload
-from sqlalchemy_neon import NeonNativeAsyncEngine
+from sqlalchemy.orm import InstrumentedAttribute, joinedload, selectinload, subqueryload
+from sqlalchemy_neon import NeonNativeAsyncEngine, TransactionOptions
 
 import logfire
 from testsupport.models import Comment, Post, Tag, User, post_tags
-
-
-def get_unique_suffix() -> str:
-    return uuid.uuid4().hex[:8]
+from testsupport.queries import equals_any, users_with_posts_and_comments
+from testsupport.naming import unique_suffix
+
+# Statements the parallel tests run once per task, built once at import.
+_USER_BY_ID = sa.select(User).where(User.id == sa.bindparam("id"))
+_POST_COUNT_BY_AUTHOR = sa.select(sa.func.count(Post.id)).where(
+    Post.author_id == sa.bindparam("author_id")
+)
+_POST_WITH_DETAILS = (
+    sa.select(Post)
+    .where(Post.id == sa.bindparam("id"))
+    .options(
+        joinedload(Post.author),
+        selectinload(Post.tags),
+        selectinload(Post.comments).selectinload(Comment.author),
+    )
+)
+
+
+def _id_of(column: InstrumentedAttribute[str], value: str) -> sa.ScalarSelect:
+    """Select the id of the row whose unique ``column`` equals ``value``."""
+    return sa.select(column.class_.id).where(column == value).scalar_subquery()
 
 
 @pytest.fixture(scope="module")
 def unique_prefix() -> str:
-    return f"hard_{get_unique_suffix()}"
+    return f"hard_{unique_suffix()}"
 
 
 @pytest_asyncio.fixture(scope="module")
 @logfire.instrument("Pytest: seeded_data", new_trace=True)
 async def seeded_data(neondb: NeonNativeAsyncEngine, unique_prefix: str):
-    """Seed the database once for all tests in this module."""
-    users = [
-        User(
-            username=f"{unique_prefix}_user_{i}",
-            email=f"{unique_prefix}_user_{i}@example.com",
-            full_name=f"Advanced User {i}",
-        )
-        for i in range(5)
-    ]
-    await neondb.add_all(users)
-
-    tags = [Tag(name=f"{unique_prefix}_tag_{i}") for i in range(5)]
-    await neondb.add_all(tags)
-
-    posts: list[Post] = []
-    post_tag_links: list[dict[str, int]] = []
-    for i in range(10):
-        author = users[i % 5]
-        post = Post(
-            title=f"{unique_prefix}_post_{i}",
-            content=f"Complex content for post {i}",
-            author_id=author.id,
-            published=True,
-        )
-        posts.append(post)
-    await neondb.add_all(posts)
-
-    for i, post in enumerate(posts):
-        tag_a = tags[i % 5]
-        tag_b = tags[(i + 1) % 5]
-        post_tag_links.append({"post_id": post.id, "tag_id": tag_a.id})
-        post_tag_links.append({"post_id": post.id, "tag_id": tag_b.id})
-
-    await neondb.execute(sa.insert(post_tags).values(post_tag_links))
-
-    comments = []
-    for i in range(25):
-        post = posts[i % 10]
-        commenter = users[(i + 2) % 5]
-        comment = Comment(
-            content=f"Detailed comment {i} on post {post.title}",
-            post_id=post.id,
-            author_id=commenter.id,
-        )
-        comments.append(comment)
-    await neondb.add_all(comments)
+    """Seed the database once for all tests in this module.
+
+    Every row goes out in one transaction, so seeding costs a single round
+    trip. Foreign keys are resolved server-side from the usernames,
+    tag names and post titles written earlier in the same transaction,
+    all of which carry the module's unique prefix.
+    """
+    usernames = [f"{unique_prefix}_user_{i}" for i in range(5)]
+    tag_names = [f"{unique_prefix}_tag_{i}" for i in range(5)]
+    titles = [f"{unique_prefix}_post_{i}" for i in range(10)]
+
+    users = sa.insert(User).values(
+        [
+            {
+                "username": username,
+                "email": f"{username}@example.com",
+                "full_name": f"Advanced User {i}",
+            }
+            for i, username in enumerate(usernames)
+        ]
+    )
+    tags = sa.insert(Tag).values([{"name": name} for name in tag_names])
+    posts = sa.insert(Post).values(
+        [
+            {
+                "title": title,
+                "content": f"Complex content for post {i}",
+                "author_id": _id_of(User.username, usernames[i % 5]),
+                "published": True,
+            }
+            for i, title in enumerate(titles)
+        ]
+    )
+    post_tag_links = sa.insert(post_tags).values(
+        [
+            {
+                "post_id": _id_of(Post.title, title),
+                "tag_id": _id_of(Tag.name, tag_names[(i + offset) % 5]),
+            }
+            for i, title in enumerate(titles)
+            for offset in (0, 1)
+        ]
+    )
+    comments = sa.insert(Comment).values(
+        [
+            {
+                "content": f"Detailed comment {i} on post {titles[i % 10]}",
+                "post_id": _id_of(Post.title, titles[i % 10]),
+                "author_id": _id_of(User.username, usernames[(i + 2) % 5]),
+            }
+            for i in range(25)
+        ]
+    )
+    user_ids, tag_ids, post_ids, _, _ = await neondb.transaction(
+        [
+            (users.returning(User.id), None),
+            (tags.returning(Tag.id), None),
+            (posts.returning(Post.id), None),
+            (post_tag_links, None),
+            (comments, None),
+        ],
+        options=TransactionOptions(read_only=False),
+    )
 
     try:
         yield {
-            "user_ids": [u.id for u in users],
-            "post_ids": [p.id for p in posts],
-            "tag_ids": [t.id for t in tags],
+            "user_ids": user_ids.scalars().all(),
+            "post_ids": post_ids.scalars().all(),
+            "tag_ids": tag_ids.scalars().all(),
         }
     finally:
         # !!!!!!!!!!!!!!!!!!!!!!!! deactivated cleanup for debugging !!!!!!!!!!!!!!!!!!!!!!!!!
@@ -110,7 +143,7 @@ class TestHardIntegration:
         user_ids = seeded_data["user_ids"]
         stmt = (
             sa.select(User)
-            .where(User.id.in_(user_ids))
+            .where(equals_any(User.id, user_ids))
             .options(
                 subqueryload(User.posts).options(
                     joinedload(Post.author),
@@ -127,51 +160,76 @@ class TestHardIntegration:
             assert f"{unique_prefix}_user" in user.username
             assert len(user.posts) > 0
 
+    @logfire.instrument("Pytest: test_contains_eager_fetch", new_trace=True)
+    async def test_contains_eager_fetch(
+        self,
+        neondb: NeonNativeAsyncEngine,
+        seeded_data,
+        unique_prefix,
+    ):
+        """Test nested collections filled from one joined query."""
+        stmt = users_with_posts_and_comments().where(
+            equals_any(User.id, seeded_data["user_ids"])
+        )
+        result = await neondb.execute(stmt)
+        users = result.unique().scalars().all()
+
+        assert 0 < len(users) <= 5
+        for user in users:
+            assert user.posts
+            for post in user.posts:
+                assert post.author_id == user.id
+                assert post.comments
+                assert all(c.post_id == post.id for c in post.comments)
+
     @logfire.instrument("Pytest: test_parallel_query_execution", new_trace=True)
     async def test_parallel_query_execution(
         self,
         neondb: NeonNativeAsyncEngine,
         seeded_data,
         unique_prefix,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """
         Test parallel execution using asyncio.gather.
-        Verifies genuine parallelism by measuring execution time with pg_sleep.
+        Verifies genuine parallelism by counting the requests the client has
+        in flight at once, which does not depend on network timing.
         """
         user_ids = seeded_data["user_ids"]
-        sleep_duration = 1.0
         num_tasks = 3
+        in_flight = 0
+        max_in_flight = 0
+        query = neondb._client.query
 
-        async def fetch_stats(user_id):
-            await neondb.execute(sa.select(sa.func.pg_sleep(sleep_duration)))
+        async def counting_query(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            try:
+                return await query(*args, **kwargs)
+            finally:
+                in_flight -= 1
 
-            u_stmt = sa.select(User).where(User.id == user_id)
-            u_res = await neondb.execute(u_stmt)
-            user: User = u_res.scalar_one()
+        monkeypatch.setattr(neondb._client, "query", counting_query)
 
-            p_stmt = sa.select(sa.func.count(Post.id)).where(Post.author_id == user_id)
-            p_res = await neondb.execute(p_stmt)
+        async def fetch_stats(user_id):
+            u_res, p_res = await asyncio.gather(
+                neondb.execute(_USER_BY_ID, {"id": user_id}),
+                neondb.execute(_POST_COUNT_BY_AUTHOR, {"author_id": user_id}),
+            )
+            user: User = u_res.scalar_one()
             post_count = p_res.scalar()
 
             return {"username": user.username, "posts": post_count}
 
-        start_time = time.perf_counter()
         tasks = [fetch_stats(uid) for uid in user_ids[:num_tasks]]
         results = await asyncio.gather(*tasks)
-        end_time = time.perf_counter()
-
-        total_duration = end_time - start_time
-        sequential_duration = sleep_duration * num_tasks
 
         assert len(results) == num_tasks
         for res in results:
             assert f"{unique_prefix}_user_" in res["username"]
 
-        assert total_duration < sequential_duration * 0.8, (
-            f"Genuine parallelism failed: total_duration={total_duration:.2f}s, "
-            f"sequential_duration={sequential_duration:.2f}s"
-        )
-        assert total_duration >= sleep_duration
+        assert max_in_flight >= 2, "requests were sent one at a time"
 
     @logfire.instrument("Pytest: test_complex_fetch_plus_parallel", new_trace=True)
     async def test_complex_fetch_plus_parallel(
@@ -184,16 +242,7 @@ class TestHardIntegration:
         post_ids = seeded_data["post_ids"]
 
         async def fetch_post_with_details(post_id):
-            stmt = (
-                sa.select(Post)
-                .where(Post.id == post_id)
-                .options(
-                    joinedload(Post.author),
-                    selectinload(Post.tags),
-                    selectinload(Post.comments).selectinload(Comment.author),
-                )
-            )
-            result = await neondb.execute(stmt)
+            result = await neondb.execute(_POST_WITH_DETAILS, {"id": post_id})
             return result.unique().scalar_one()
 
         tasks = [fetch_post_with_details(pid) for pid in post_ids[:4]]
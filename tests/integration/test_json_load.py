@@ -1,34 +1,88 @@
+import functools
 import pytest
+import pytest_asyncio
 import sqlalchemy as sa
 import json
 import random
 import string
 import uuid
 import os
-from sqlalchemy_neon import NeonNativeAsyncEngine
+from sqlalchemy_neon import NeonNativeAsyncEngine, create_neon_native_async_engine
 from testsupport.models import ComplexData
+from testsupport.naming import unique_suffix
+from testsupport.queries import equals_any
 
-def generate_complex_json(depth=5, items_per_level=3):
-    """Generate a deeply nested and complex JSON object."""
-    if depth <= 0:
-        return {
-            "id": str(uuid.uuid4()),
-            "value": random.random(),
-            "text": "".join(random.choices(string.printable, k=100)),
-            "active": random.choice([True, False, None]),
-            "weird_chars": "🚀 💫 漢字 日本語 한국어  ' \" \\ \b \f \n \r \t",
-            "escaped": "newline\nand \"quote\"",
-        }
-    
-    data = {}
-    for i in range(items_per_level):
-        key = f"key_{depth}_{i}_{''.join(random.choices(string.ascii_lowercase, k=5))}"
-        if random.random() > 0.3:
-            data[key] = generate_complex_json(depth - 1, items_per_level)
-        else:
-            data[key] = [generate_complex_json(depth - 1, 2) for _ in range(2)]
-    
-    return data
+# Parameter-count tests: one SELECT of 1000 binds, built once at import.
+_NUM_PARAMS = 1000
+_SELECT_PARAMS = sa.text("SELECT " + ", ".join(f":p_{i}" for i in range(_NUM_PARAMS)))
+_STR_PARAMS = {f"p_{i}": f"val_{i}" for i in range(_NUM_PARAMS)}
+_INT_PARAMS = {f"p_{i}": i for i in range(_NUM_PARAMS)}
+
+@pytest_asyncio.fixture(scope="module")
+async def ws_engine(require_neon):
+    """WebSocket-transport engine shared by the module's WebSocket tests."""
+    engine = create_neon_native_async_engine(require_neon, transport="websocket")
+    yield engine
+    await engine.dispose()
+
+@pytest.fixture(scope="module")
+def random_bytes():
+    """2MB of random bytes, drawn once per module."""
+    return os.urandom(2 * 1024 * 1024)
+
+@pytest.fixture(scope="module")
+def large_text():
+    """2MB of text, built once per module."""
+    return "lorem ipsum " * (2 * 1024 * 1024 // 12)
+
+def _json_leaf(rng):
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "value": rng.random(),
+        "text": "".join(rng.choices(string.printable, k=100)),
+        "active": rng.choice([True, False, None]),
+        "weird_chars": "🚀 💫 漢字 日本語 한국어  ' \" \\ \b \f \n \r \t",
+        "escaped": "newline\nand \"quote\"",
+    }
+
+def generate_complex_json(depth=5, items_per_level=3, rng=random):
+    """Generate a deeply nested and complex JSON object.
+
+    Built with an explicit stack of ``(container, slot, depth, items)``
+    entries rather than recursion; each entry fills one slot of an
+    already-attached parent.
+    """
+    root = [None]
+    stack = [(root, 0, depth, items_per_level)]
+    while stack:
+        container, slot, depth, items = stack.pop()
+        if depth <= 0:
+            container[slot] = _json_leaf(rng)
+            continue
+        data = container[slot] = {}
+        for i in range(items):
+            key = f"key_{depth}_{i}_{''.join(rng.choices(string.ascii_lowercase, k=5))}"
+            if rng.random() > 0.3:
+                data[key] = None  # reserves the key's position
+                stack.append((data, key, depth - 1, items))
+            else:
+                data[key] = pair = [None, None]
+                stack.append((pair, 0, depth - 1, 2))
+                stack.append((pair, 1, depth - 1, 2))
+    return root[0]
+
+@functools.lru_cache(maxsize=None)
+def _payload(depth, items_per_level, seed=0):
+    """Return a seeded ``generate_complex_json`` object and its JSON length.
+
+    Payloads are deterministic per shape and seed, so tests asking for the
+    same ones share one object, generated and measured once; pass distinct
+    seeds for distinct payloads of one shape. Callers must not mutate it.
+    """
+    obj = generate_complex_json(
+        depth, items_per_level, random.Random(f"{depth}x{items_per_level}x{seed}")
+    )
+    return obj, len(json.dumps(obj))
 
 @pytest.mark.asyncio
 async def test_large_complex_json_insertion(neondb: NeonNativeAsyncEngine):
@@ -41,11 +95,10 @@ async def test_large_complex_json_insertion(neondb: NeonNativeAsyncEngine):
     
     # Generate a really large payload
     # Depth 4, 4 items per level is around 70-100KB
-    complex_obj = generate_complex_json(depth=4, items_per_level=4)
-    payload_size = len(json.dumps(complex_obj))
+    complex_obj, payload_size = _payload(depth=4, items_per_level=4)
     print(f"\nGenerated complex JSON payload size: {payload_size / 1024:.2f} KB")
 
-    name_val = f"complex_test_{uuid.uuid4().hex[:8]}"
+    name_val = f"complex_test_{unique_suffix()}"
     
     # Create the instance
     entry = ComplexData(
@@ -79,92 +132,66 @@ async def test_large_complex_json_insertion(neondb: NeonNativeAsyncEngine):
         .values(metadata_jsonb=updated_metadata)
     )
     
+    # Verify the update and clean up in one round trip
     result = await neondb.execute(
-        sa.select(ComplexData).where(ComplexData.id == entry.id)
+        sa.delete(ComplexData)
+        .where(ComplexData.id == entry.id)
+        .returning(ComplexData.metadata_jsonb)
     )
-    fetched_updated = result.scalar_one()
-    assert fetched_updated.metadata_jsonb == updated_metadata
-    
-    # Cleanup
-    await neondb.execute(sa.delete(ComplexData).where(ComplexData.id == entry.id))
+    assert result.scalar_one() == updated_metadata
 
 @pytest.mark.asyncio
 async def test_very_large_json_payload(neondb: NeonNativeAsyncEngine):
     """Test a truly large payload to push limits (e.g. > 2MB)."""
     # Depth 7, 4 items per level should generate a large but manageable blob (~3MB)
-    large_obj = generate_complex_json(depth=7, items_per_level=4)
-    payload_size = len(json.dumps(large_obj))
+    large_obj, payload_size = _payload(depth=7, items_per_level=4)
     print(f"\nGenerated massive JSON payload size: {payload_size / 1024:.2f} KB")
     
-    name_val = f"massive_test_{uuid.uuid4().hex[:8]}"
+    name_val = f"massive_test_{unique_suffix()}"
     entry = ComplexData(name=name_val, data_jsonb=large_obj)
     
     await neondb.add(entry)
     
     result = await neondb.execute(
-        sa.select(ComplexData).where(ComplexData.id == entry.id)
+        sa.delete(ComplexData)
+        .where(ComplexData.id == entry.id)
+        .returning(ComplexData.data_jsonb)
     )
-    fetched = result.scalar_one()
-    assert len(json.dumps(fetched.data_jsonb)) == payload_size
-    
-    await neondb.execute(sa.delete(ComplexData).where(ComplexData.id == entry.id))
+    assert len(json.dumps(result.scalar_one())) == payload_size
 
 @pytest.mark.asyncio
 async def test_many_parameters(neondb: NeonNativeAsyncEngine):
     """Test a query with a large number of parameters."""
-    num_params = 1000
-    params = {f"p_{i}": f"val_{i}" for i in range(num_params)}
-    
-    # Construct a query using these params
     # This is a bit contrived but tests batch params
-    stmt = sa.text(f"SELECT " + ", ".join([f":p_{i}" for i in range(num_params)]))
-    
-    result = await neondb.execute(stmt, params)
+    result = await neondb.execute(_SELECT_PARAMS, _STR_PARAMS)
     row = result.first()
-    assert len(row) == num_params
+    assert len(row) == _NUM_PARAMS
 
 @pytest.mark.asyncio
 async def test_massive_parameters(neondb: NeonNativeAsyncEngine):
     """Test a query with a larger number of parameters (below 1664 target list limit)."""
-    num_params = 1000
-    params = {f"p_{i}": i for i in range(num_params)}
-    
-    # Simple SELECT of all params
-    stmt = sa.text(f"SELECT " + ", ".join([f":p_{i}" for i in range(num_params)]))
-    
-    result = await neondb.execute(stmt, params)
+    result = await neondb.execute(_SELECT_PARAMS, _INT_PARAMS)
     row = result.first()
-    assert len(row) == num_params
+    assert len(row) == _NUM_PARAMS
 
 @pytest.mark.asyncio
-async def test_large_json_websocket(require_neon):
+async def test_large_json_websocket(ws_engine: NeonNativeAsyncEngine):
     """Test large JSON payload over WebSocket transport."""
-    from sqlalchemy_neon import create_neon_native_async_engine
+    # Generate medium-large payload (say 1MB)
+    obj, payload_size = _payload(depth=6, items_per_level=5)
+    print(f"\nWebSocket payload size: {payload_size/1024:.2f} KB")
     
-    engine = create_neon_native_async_engine(
-        require_neon,
-        transport="websocket"
-    )
+    name_val = f"ws_test_{unique_suffix()}"
+    entry = ComplexData(name=name_val, data_jsonb=obj)
     
-    try:
-        # Generate medium-large payload (say 1MB)
-        obj = generate_complex_json(depth=6, items_per_level=5)
-        print(f"\nWebSocket payload size: {len(json.dumps(obj))/1024:.2f} KB")
-        
-        name_val = f"ws_test_{uuid.uuid4().hex[:8]}"
-        entry = ComplexData(name=name_val, data_jsonb=obj)
-        
-        await engine.add(entry)
-        
-        result = await engine.execute(
-            sa.select(ComplexData).where(ComplexData.id == entry.id)
-        )
-        fetched = result.scalar_one()
-        assert fetched.data_jsonb == obj
-        
-        await engine.execute(sa.delete(ComplexData).where(ComplexData.id == entry.id))
-    finally:
-        await engine.dispose()
+    await ws_engine.add(entry)
+    
+    result = await ws_engine.execute(
+        sa.delete(ComplexData)
+        .where(ComplexData.id == entry.id)
+        .returning(ComplexData.data_jsonb)
+    )
+    assert result.scalar_one() == obj
 
 @pytest.mark.asyncio
 async def test_orm_object_large_json(neondb: NeonNativeAsyncEngine):
@@ -174,11 +201,10 @@ async def test_orm_object_large_json(neondb: NeonNativeAsyncEngine):
     """
     # Generate ~20MB payload to really push limits
     # Depth 8, items 6 is massive. Let's aim for ~10MB first to avoid client timeout.
-    large_obj = generate_complex_json(depth=6, items_per_level=7)
-    payload_size = len(json.dumps(large_obj))
+    large_obj, payload_size = _payload(depth=6, items_per_level=7)
     print(f"\nORM object JSON payload size: {payload_size / 1024:.2f} KB")
     
-    name_val = f"orm_test_{uuid.uuid4().hex[:8]}"
+    name_val = f"orm_test_{unique_suffix()}"
     
     # Create the ORM instance
     entry = ComplexData(
@@ -193,29 +219,26 @@ async def test_orm_object_large_json(neondb: NeonNativeAsyncEngine):
     
     assert entry.id is not None
     
-    # Verify by fetching back
+    # Verify and clean up in one round trip
     result = await neondb.execute(
-        sa.select(ComplexData).where(ComplexData.id == entry.id)
+        sa.delete(ComplexData)
+        .where(ComplexData.id == entry.id)
+        .returning(ComplexData.name, ComplexData.data_jsonb)
     )
-    fetched = result.scalar_one()
-    
-    assert fetched.name == name_val
-    assert len(json.dumps(fetched.data_jsonb)) == payload_size
+    fetched_name, fetched_jsonb = result.one()
     
-    # Cleanup
-    await neondb.execute(sa.delete(ComplexData).where(ComplexData.id == entry.id))
+    assert fetched_name == name_val
+    assert len(json.dumps(fetched_jsonb)) == payload_size
 
 @pytest.mark.asyncio
-async def test_extreme_mixed_payload(neondb: NeonNativeAsyncEngine):
+async def test_extreme_mixed_payload(
+    neondb: NeonNativeAsyncEngine, random_bytes: bytes, large_text: str
+):
     """Test a mix of large JSON, large bytea, and large text."""
-    # 2MB of random bytes
-    random_bytes = os.urandom(2 * 1024 * 1024)
-    # 2MB of text
-    large_text = "lorem ipsum " * (2 * 1024 * 1024 // 12)
     # 2MB of JSON
-    large_json = generate_complex_json(depth=6, items_per_level=6)
+    large_json, json_size = _payload(depth=6, items_per_level=6)
     
-    name_val = f"extreme_test_{uuid.uuid4().hex[:8]}"
+    name_val = f"extreme_test_{unique_suffix()}"
     entry = ComplexData(
         name=name_val,
         data_jsonb=large_json,
@@ -223,21 +246,23 @@ async def test_extreme_mixed_payload(neondb: NeonNativeAsyncEngine):
         data_text=large_text
     )
     
-    print(f"\nExtreme mixed payload: 2MB bytea, 2MB text, ~{len(json.dumps(large_json))/1024:.2f}KB JSON")
+    print(f"\nExtreme mixed payload: 2MB bytea, 2MB text, ~{json_size/1024:.2f}KB JSON")
     
     await neondb.add(entry)
     assert entry.id is not None
     
     result = await neondb.execute(
-        sa.select(ComplexData).where(ComplexData.id == entry.id)
+        sa.delete(ComplexData)
+        .where(ComplexData.id == entry.id)
+        .returning(
+            ComplexData.data_bytea, ComplexData.data_text, ComplexData.data_jsonb
+        )
     )
-    fetched = result.scalar_one()
+    fetched_bytea, fetched_text, fetched_jsonb = result.one()
     
-    assert fetched.data_bytea == random_bytes
-    assert fetched.data_text == large_text
-    assert fetched.data_jsonb == large_json
-    
-    await neondb.execute(sa.delete(ComplexData).where(ComplexData.id == entry.id))
+    assert fetched_bytea == random_bytes
+    assert fetched_text == large_text
+    assert fetched_jsonb == large_json
 
 @pytest.mark.asyncio
 async def test_deep_json_payload(neondb: NeonNativeAsyncEngine):
@@ -247,19 +272,18 @@ async def test_deep_json_payload(neondb: NeonNativeAsyncEngine):
     for i in range(150):
         curr = {f"level_{i}": curr}
     
-    name_val = f"deep_test_{uuid.uuid4().hex[:8]}"
+    name_val = f"deep_test_{unique_suffix()}"
     entry = ComplexData(name=name_val, data_jsonb=curr)
     
     # This might fail with 400 if the proxy has depth limits
     await neondb.add(entry)
     
     result = await neondb.execute(
-        sa.select(ComplexData).where(ComplexData.id == entry.id)
+        sa.delete(ComplexData)
+        .where(ComplexData.id == entry.id)
+        .returning(ComplexData.data_jsonb)
     )
-    fetched = result.scalar_one()
-    assert fetched.data_jsonb == curr
-    
-    await neondb.execute(sa.delete(ComplexData).where(ComplexData.id == entry.id))
+    assert result.scalar_one() == curr
 
 @pytest.mark.asyncio
 async def test_orm_add_all_large_json(neondb: NeonNativeAsyncEngine):
@@ -272,9 +296,10 @@ async def test_orm_add_all_large_json(neondb: NeonNativeAsyncEngine):
     names = []
     payload_total = 0
     for i in range(3):
-        data = generate_complex_json(depth=6, items_per_level=5)
-        payload_total += len(json.dumps(data))
-        name = f"add_all_test_{i}_{uuid.uuid4().hex[:8]}"
+        # Distinct per row, so rows mixed up on the way back are caught.
+        data, size = _payload(depth=6, items_per_level=5, seed=i)
+        payload_total += size
+        name = f"add_all_test_{i}_{unique_suffix()}"
         names.append(name)
         objs.append(ComplexData(name=name, data_jsonb=data, data_json=data))
     
@@ -287,14 +312,14 @@ async def test_orm_add_all_large_json(neondb: NeonNativeAsyncEngine):
     for obj in objs:
         assert obj.id is not None
     
-    # Fetch and verify one randomly
+    # Fetch one back by the id RETURNING assigned it
     target_name = names[1]
     result = await neondb.execute(
-        sa.select(ComplexData).where(ComplexData.name == target_name)
+        sa.select(ComplexData).where(ComplexData.id == objs[1].id)
     )
     fetched = result.scalar_one()
     assert fetched.name == target_name
     assert fetched.data_jsonb == objs[1].data_jsonb
     
     # Cleanup
-    await neondb.execute(sa.delete(ComplexData).where(ComplexData.name.in_(names)))
+    await neondb.execute(sa.delete(ComplexData).where(equals_any(ComplexData.name, names)))
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from testsupport.naming import unique_suffix
+
+
+def test_unique_suffix_never_repeats_within_a_process():
+    suffixes = [unique_suffix() for _ in range(70_000)]
+
+    assert len(set(suffixes)) == len(suffixes)
+    assert suffixes[0][:6] == suffixes[-1][:6]
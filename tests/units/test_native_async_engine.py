@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import enum
 from datetime import date, datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import sqlalchemy as sa
 from sqlalchemy import orm
+from sqlalchemy.dialects import postgresql
 import pytest
 
 from sqlalchemy_neon.native_async_engine import (
     NeonNativeAsyncEngine,
     NativeAsyncResult,
+    _DIALECT,
+    _default_caller,
+    _entity_columns,
+    _bulk_insert_template,
     compile_sql,
     create_neon_native_async_engine,
     create_neon_ws_engine,
@@ -18,6 +24,7 @@ from sqlalchemy_neon.native_async_engine import (
 from sqlalchemy_neon.neon_http_client import QueryResult, TransactionOptions
 from sqlalchemy_neon.types import PostgresOID
 from testsupport.models import User, Post, Comment
+from testsupport.queries import post_summaries
 
 
 def test_compile_sql_string_with_positional_params():
@@ -44,6 +51,36 @@ def test_compile_sql_core_statement_reuses_named_bind():
     assert params == ["alice"]
 
 
+def test_compile_sql_cache_reuses_shape_with_new_values():
+    cache: dict = {}
+    users = User.__table__
+
+    sql_a, params_a = compile_sql(
+        sa.select(users.c.id).where(users.c.username == "alice"), compiled_cache=cache
+    )
+    sql_b, params_b = compile_sql(
+        sa.select(users.c.id).where(users.c.username == "bob"), compiled_cache=cache
+    )
+
+    assert len(cache) == 1
+    assert sql_a == sql_b
+    assert params_a == ["alice"]
+    assert params_b == ["bob"]
+
+
+def test_compile_sql_cache_skips_expanding_binds():
+    cache: dict = {}
+    users = User.__table__
+
+    sql, params = compile_sql(
+        sa.select(users.c.id).where(users.c.id.in_([1, 2, 3])), compiled_cache=cache
+    )
+
+    assert cache == {}
+    assert params == [1, 2, 3]
+    assert "$3" in sql
+
+
 @pytest.mark.asyncio
 async def test_native_engine_execute_forwards_to_client(mock_connection_string: str):
     class FakeClient:
@@ -72,6 +109,40 @@ async def test_native_engine_execute_forwards_to_client(mock_connection_string:
     assert fake.calls[0][1] == [1]
 
 
+@pytest.mark.asyncio
+async def test_native_engine_execute_compiles_cached_statement_once(
+    mock_connection_string: str, monkeypatch: pytest.MonkeyPatch
+):
+    class FakeClient:
+        async def query(self, sql, params, options=None):
+            return QueryResult(
+                rows=[{"username": "a"}],
+                fields=[{"name": "username"}],
+                row_count=1,
+                command="SELECT",
+            )
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    engine._client = FakeClient()
+
+    compiles = []
+    original = sa.sql.Select.compile
+
+    def counting_compile(self, *args, **kwargs):
+        compiles.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(sa.sql.Select, "compile", counting_compile)
+
+    for user_id in (1, 2):
+        result = await engine.execute(
+            sa.select(User.username).where(User.id == user_id)
+        )
+        assert result.scalar_one() == "a"
+
+    assert len(compiles) == 1
+
+
 def test_native_engine_rejects_unknown_transport(mock_connection_string: str):
     with pytest.raises(ValueError, match="Unsupported transport"):
         NeonNativeAsyncEngine(
@@ -211,15 +282,12 @@ async def test_native_engine_add_all_uses_single_transaction(
             self.transaction_calls.append((queries, options))
             return [
                 QueryResult(
-                    rows=[{"id": 11, "username": "alice"}],
-                    fields=[{"name": "id"}, {"name": "username"}],
-                    row_count=1,
-                    command="INSERT",
-                ),
-                QueryResult(
-                    rows=[{"id": 12, "username": "bob"}],
+                    rows=[
+                        {"id": 11, "username": "alice"},
+                        {"id": 12, "username": "bob"},
+                    ],
                     fields=[{"name": "id"}, {"name": "username"}],
-                    row_count=1,
+                    row_count=2,
                     command="INSERT",
                 ),
             ]
@@ -239,11 +307,391 @@ async def test_native_engine_add_all_uses_single_transaction(
 
     assert len(fake.transaction_calls) == 1
     queries, options = fake.transaction_calls[0]
-    assert len(queries) == 2
+    assert len(queries) == 1
+    sql, params = queries[0]
+    assert sql.startswith("INSERT INTO public.users (")
+    assert "VALUES ($1, " in sql and "RETURNING" in sql
+    assert params[0] == "alice"
+    assert len(params) % 2 == 0
     assert isinstance(options, TransactionOptions)
     assert options.read_only is False
     assert users[0].id == 11
     assert users[1].id == 12
+    # RETURNING values are loaded state, not pending changes.
+    assert "id" not in orm.attributes.instance_state(users[0]).committed_state
+
+
+@pytest.mark.asyncio
+async def test_native_engine_add_all_leaves_server_defaults_out(
+    mock_connection_string: str,
+):
+    class FakeClient:
+        def __init__(self):
+            self.queries = []
+
+        async def transaction(self, queries, options=None):
+            self.queries = queries
+            return [
+                QueryResult(
+                    rows=[{"id": 100}, {"id": 101}],
+                    fields=[{"name": "id"}],
+                    row_count=2,
+                    command="INSERT",
+                )
+                for _ in queries
+            ]
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    fake = FakeClient()
+    engine._client = fake
+
+    fixed_uuid = UUID("550e8400-e29b-41d4-a716-446655440000")
+    users = [
+        User(username="a", email="a@example.com"),
+        User(username="b", email="b@example.com"),
+        User(username="c", email="c@example.com", uuid=fixed_uuid),
+    ]
+    await engine.add_all(users)
+
+    # The run splits where the server-defaulted cells change, keeping order.
+    (sql, params), (uuid_sql, uuid_params) = fake.queries
+    assert "uuid" not in sql.split("RETURNING")[0]
+    assert "(VALUES ($1, $2, " in sql and ", 0), ($7, $8, " in sql
+    assert params[:2] == ["a", "a@example.com"]
+    assert params[6:8] == ["b", "b@example.com"]
+    assert "(uuid, username," in uuid_sql and "p0::UUID" in uuid_sql
+    assert uuid_params[0] == fixed_uuid
+    assert [u.id for u in users] == [100, 101, 100]
+
+    # Batches of one shape share a template whatever their values or length.
+    _bulk_insert_template.cache_clear()
+    await engine.add_all(
+        [User(username="e", email="e@x", uuid=fixed_uuid) for _ in range(2)]
+    )
+    await engine.add_all(
+        [User(username="f", email="f@x", uuid=fixed_uuid) for _ in range(5)]
+    )
+    assert _bulk_insert_template.cache_info().hits == 1
+    assert ", 4)) AS sentinel" in fake.queries[0][0]
+
+
+@pytest.mark.asyncio
+async def test_native_engine_add_all_sync_defaults(mock_connection_string: str):
+    seen_is_active = []
+
+    class FakeClient:
+        async def transaction(self, queries, options=None):
+            seen_is_active.append(user.is_active)
+            return [
+                QueryResult(
+                    rows=[{"id": 1}],
+                    fields=[{"name": "id"}],
+                    row_count=1,
+                    command="INSERT",
+                )
+            ]
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    engine._client = FakeClient()
+
+    user = User(username="a", email="a@example.com")
+    await engine.add_all([user])
+    assert seen_is_active == [None]
+
+    user = User(username="b", email="b@example.com")
+    await engine.add_all([user], sync_defaults=True)
+    assert seen_is_active[-1] is True
+    assert "is_active" not in orm.attributes.instance_state(user).committed_state
+
+
+@pytest.mark.asyncio
+async def test_native_engine_add_all_independent_tables_run_concurrently(
+    mock_connection_string: str,
+):
+    class FakeClient:
+        def __init__(self):
+            self.calls = []
+            self.active = 0
+            self.max_active = 0
+
+        async def transaction(self, queries, options=None):
+            self.calls.append(queries)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return [
+                QueryResult(
+                    rows=[{"id": len(params)}],
+                    fields=[{"name": "id"}],
+                    row_count=1,
+                    command="INSERT",
+                )
+                for _, params in queries
+            ]
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    fake = FakeClient()
+    engine._client = fake
+
+    user = User(username="a", email="a@example.com")
+    post = Post(title="t", content="c", author_id=7)
+    await engine.add_all([user, post], independent=True)
+
+    assert len(fake.calls) == 2
+    assert fake.max_active == 2
+    assert [len(queries) for queries in fake.calls] == [1, 1]
+    assert user.id is not None and post.id is not None
+
+
+@pytest.mark.asyncio
+async def test_native_engine_add_all_applies_positional_returning_rows(
+    mock_connection_string: str,
+):
+    columns = [c.key for c in User.__table__.columns]
+
+    class FakeClient:
+        async def transaction(self, queries, options=None):
+            assert options.array_mode is True
+            row = [None] * len(columns)
+            row[columns.index("id")] = 42
+            row[columns.index("username")] = "from-db"
+            return [
+                QueryResult(
+                    rows=[tuple(row)],
+                    fields=[{"name": c} for c in columns],
+                    row_count=1,
+                    command="INSERT",
+                    row_as_array=True,
+                )
+            ]
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    engine._client = FakeClient()
+
+    user = User(username="a", email="a@example.com")
+    await engine.add_all([user])
+
+    assert user.id == 42
+    assert user.username == "from-db"
+
+
+@pytest.mark.asyncio
+async def test_native_engine_add_all_honours_eager_defaults(
+    mock_connection_string: str,
+):
+    class FakeClient:
+        def __init__(self):
+            self.queries = []
+
+        async def transaction(self, queries, options=None):
+            self.queries.extend(queries)
+            return [
+                QueryResult(
+                    rows=[(7,)],
+                    fields=[{"name": "id"}],
+                    row_count=1,
+                    command="INSERT",
+                    row_as_array=True,
+                )
+            ]
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    fake = FakeClient()
+    engine._client = fake
+
+    # Comment sets eager_defaults=False: server defaults are not read back.
+    comment = Comment(content="hi", post_id=1, author_id=2)
+    await engine.add_all([comment])
+
+    sql, _ = fake.queries[0]
+    assert sql.endswith("RETURNING id")
+    assert comment.id == 7
+    assert "created_at" not in comment.__dict__
+
+
+class _LazyDefaultsBase(orm.DeclarativeBase):
+    metadata = sa.MetaData()
+
+
+class _LazyDefaults(_LazyDefaultsBase):
+    __tablename__ = "lazy_defaults"
+    __mapper_args__ = {"eager_defaults": False}
+
+    id: orm.Mapped[int] = orm.mapped_column(primary_key=True)
+    n: orm.Mapped[int] = orm.mapped_column(default=5)
+    token: orm.Mapped[str] = orm.mapped_column(default=lambda: uuid4().hex)
+
+
+@pytest.mark.asyncio
+async def test_native_engine_add_keeps_python_defaults_not_returned(
+    mock_connection_string: str,
+):
+    class FakeClient:
+        def __init__(self):
+            self.queries = []
+
+        async def transaction(self, queries, options=None):
+            self.queries.extend(queries)
+            return [
+                QueryResult(
+                    rows=[(3,)],
+                    fields=[{"name": "id"}],
+                    row_count=1,
+                    command="INSERT",
+                    row_as_array=True,
+                )
+            ]
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    fake = FakeClient()
+    engine._client = fake
+
+    item = _LazyDefaults()
+    await engine.add(item)
+
+    [(sql, params)] = fake.queries
+    assert sql.endswith("RETURNING id")
+    assert (item.id, item.n, item.token) == (3, *params)
+    assert item.n == 5 and len(item.token) == 32
+    assert not orm.attributes.instance_state(item).committed_state
+
+
+class _Status(enum.Enum):
+    draft = "draft"
+    live = "live"
+
+
+class _Upper(sa.types.TypeDecorator):
+    impl = sa.String
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        return value.upper()
+
+
+class _Ticket(_LazyDefaultsBase):
+    __tablename__ = "tickets"
+
+    id: orm.Mapped[int] = orm.mapped_column(primary_key=True)
+    status: orm.Mapped[_Status] = orm.mapped_column(
+        sa.Enum(_Status), server_default="draft"
+    )
+    code: orm.Mapped[str] = orm.mapped_column(_Upper(), server_default="t-1")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("row_as_array", [True, False])
+async def test_native_engine_add_runs_result_processors_on_returning(
+    mock_connection_string: str, row_as_array: bool
+):
+    class FakeClient:
+        async def transaction(self, queries, options=None):
+            row = (7, "draft", "t-1")
+            if not row_as_array:
+                row = dict(zip(("id", "status", "code"), row))
+            return [
+                QueryResult(
+                    rows=[row],
+                    fields=[{"name": "id"}, {"name": "status"}, {"name": "code"}],
+                    row_count=1,
+                    command="INSERT",
+                    row_as_array=row_as_array,
+                )
+            ]
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    engine._client = FakeClient()
+
+    ticket = _Ticket()
+    await engine.add(ticket)
+
+    assert (ticket.id, ticket.status, ticket.code) == (7, _Status.draft, "T-1")
+
+
+class _Code(_LazyDefaultsBase):
+    __tablename__ = "codes"
+
+    code: orm.Mapped[str] = orm.mapped_column(primary_key=True, autoincrement=False)
+    label: orm.Mapped[str] = orm.mapped_column(server_default="new")
+
+
+@pytest.mark.asyncio
+async def test_native_engine_add_all_matches_returning_rows_not_by_position(
+    mock_connection_string: str,
+):
+    columns = [c.key for c in User.__table__.columns]
+
+    def user_row(user_id, username):
+        row = [None] * len(columns)
+        row[columns.index("id")] = user_id
+        row[columns.index("username")] = username
+        return tuple(row)
+
+    class FakeClient:
+        async def transaction(self, queries, options=None):
+            (users_sql, _), _ = queries
+            assert "ORDER BY sen_counter RETURNING" in users_sql
+            # Send both batches back in reverse order.
+            return [
+                QueryResult(
+                    rows=[user_row(11, "u2"), user_row(10, "u1")],
+                    fields=[{"name": c} for c in columns],
+                    row_count=2,
+                    command="INSERT",
+                    row_as_array=True,
+                ),
+                QueryResult(
+                    rows=[("y", "label-y"), ("x", "label-x")],
+                    fields=[{"name": "code"}, {"name": "label"}],
+                    row_count=2,
+                    command="INSERT",
+                    row_as_array=True,
+                ),
+            ]
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    engine._client = FakeClient()
+
+    users = [
+        User(username="u1", email="1@example.com"),
+        User(username="u2", email="2@example.com"),
+    ]
+    codes = [_Code(code="x"), _Code(code="y")]
+    await engine.add_all([*users, *codes])
+
+    assert [(u.id, u.username) for u in users] == [(10, "u1"), (11, "u2")]
+    assert [(c.code, c.label) for c in codes] == [("x", "label-x"), ("y", "label-y")]
+
+
+def test_default_caller_resolves_call_shape_once():
+    calls = []
+
+    def no_context():
+        calls.append("no_context")
+        return 1
+
+    def with_context(context):
+        calls.append(context)
+        return 2
+
+    assert _default_caller(sa.Column("a", sa.Integer, default=no_context).default)() == 1
+    assert _default_caller(sa.Column("b", sa.Integer, default=with_context).default)() == 2
+    assert _default_caller(sa.Column("c", sa.Integer, default=3).default)() == 3
+    assert _default_caller(sa.Column("d", sa.Integer).default) is None
+    assert calls == ["no_context", None]
+
+
+def test_entity_columns_resolved_once_per_mapper():
+    mapper = sa.inspect(User)
+    columns = _entity_columns(mapper, _DIALECT)
+
+    assert _entity_columns(mapper, _DIALECT) is columns
+    by_key = {key: (candidates, processor) for key, candidates, processor in columns}
+    assert by_key["id"][0][:3] == ("id", "id", "id")
+    assert "users_id" in by_key["id"][0]
+    # psycopg already loads uuid cells as UUID objects.
+    assert by_key["uuid"][1] is None
 
 
 @pytest.mark.asyncio
@@ -279,10 +727,21 @@ async def test_native_engine_delete_all_uses_single_transaction(
 
     assert len(fake.transaction_calls) == 1
     queries, options = fake.transaction_calls[0]
-    assert len(queries) == 2
+    [(sql, params)] = queries
+    assert "= ANY (" in sql
+    assert params == [[21, 22]]
     assert isinstance(options, TransactionOptions)
     assert options.read_only is False
 
+    # Runs break on table changes, and one SQL string serves any run length.
+    await engine.delete_all(
+        [users[0], Post(id=5, title="t", content="c", author_id=21), users[1]]
+    )
+    queries, _ = fake.transaction_calls[1]
+    assert [params for _, params in queries] == [[[21]], [[5]], [[22]]]
+    assert queries[0][0] == sql
+    assert len(engine._compiled_cache) == 2
+
 
 def test_native_result_unique_and_scalars():
     raw = QueryResult(
@@ -646,3 +1105,180 @@ async def test_native_engine_loads_sibling_relationships_concurrently(
     assert post.author.username == "alice"
     assert [tag.name for tag in post.tags] == ["tag-a"]
     assert fake.max_active >= 2
+
+
+def test_native_engine_load_plans_follow_mapper_eager_defaults(
+    mock_connection_string: str,
+):
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    post_mapper = sa.inspect(Post)
+
+    def plan_keys(stmt):
+        return [
+            ([rel.key for rel in plan["relationships"]], plan["strategies"])
+            for plan in engine._extract_load_plans(stmt, post_mapper)
+        ]
+
+    # Post.tags is lazy="selectin"; Tag.posts points back at Post and stops.
+    assert plan_keys(sa.select(Post)) == [(["tags"], ["selectin"])]
+    assert plan_keys(sa.select(Post).options(orm.joinedload(Post.tags))) == [
+        (["tags"], ["joined"])
+    ]
+    assert plan_keys(sa.select(Post).options(orm.lazyload(Post.tags))) == []
+    nested = sa.select(Post).options(
+        orm.defaultload(Post.comments).selectinload(Comment.author)
+    )
+    assert plan_keys(nested) == [
+        (["comments", "author"], ["selectin", "selectin"]),
+        (["tags"], ["selectin"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_native_engine_option_children_get_mapper_eager_defaults(
+    mock_connection_string: str,
+):
+    int4, text = PostgresOID.INT4, PostgresOID.TEXT
+
+    def result(rows):
+        return QueryResult(
+            rows=rows,
+            fields=[
+                {"name": key, "dataTypeID": int4 if key != "name" else text}
+                for key in rows[0]
+            ],
+            row_count=len(rows),
+            command="SELECT",
+        )
+
+    class FakeClient:
+        def __init__(self):
+            self.statements = []
+
+        async def query(self, sql, params, options=None):
+            sql_l = " ".join(sql.lower().split())
+            self.statements.append(sql_l)
+            if "from public.users join public.posts" in sql_l:
+                return result([{"__parent_identity": 2, "id": 1, "author_id": 2}])
+            if "from public.posts join public.post_tags" in sql_l:
+                return result([{"__parent_identity": 1, "id": 7, "name": "tag-a"}])
+            if "from public.users" in sql_l and "join" not in sql_l:
+                return result([{"id": 2}])
+            raise AssertionError(f"Unexpected SQL: {sql}")
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    fake = FakeClient()
+    engine._client = fake
+
+    # Post.tags is lazy="selectin", so posts loaded through the option get
+    # their tags too; Tag.posts leads back to Post and is not followed.
+    stmt = sa.select(User).where(User.id == 2).options(orm.selectinload(User.posts))
+    user = (await engine.execute(stmt)).scalar_one()
+
+    [post] = user.posts
+    assert [tag.name for tag in post.tags] == ["tag-a"]
+    assert len(fake.statements) == 3
+
+
+@pytest.mark.asyncio
+async def test_native_engine_contains_eager_uses_joined_rows(
+    mock_connection_string: str, monkeypatch: pytest.MonkeyPatch
+):
+    stmt = (
+        sa.select(User)
+        .join(User.posts)
+        .options(orm.contains_eager(User.posts))
+        .order_by(User.id, Post.id)
+    )
+    labels = [
+        entry.keyname
+        for entry in stmt.compile(dialect=postgresql.dialect())._result_columns
+    ]
+
+    def joined_row(user_id: int, post_id: int) -> list:
+        values = {
+            "id": post_id,
+            "title": f"post {post_id}",
+            "author_id": user_id,
+            "id_1": user_id,
+            "username": f"user {user_id}",
+        }
+        return [values.get(label) for label in labels]
+
+    class FakeClient:
+        def __init__(self):
+            self.queries = []
+
+        async def query(self, sql, params, options=None):
+            self.queries.append(sql)
+            if "from public.posts join public.post_tags" in sql.lower():
+                return QueryResult(
+                    rows=[{"__parent_identity": 11, "id": 7, "name": "tag-a"}],
+                    fields=[
+                        {"name": "__parent_identity", "dataTypeID": PostgresOID.INT4},
+                        {"name": "id", "dataTypeID": PostgresOID.INT4},
+                        {"name": "name", "dataTypeID": PostgresOID.VARCHAR},
+                    ],
+                    row_count=1,
+                    command="SELECT",
+                )
+            return QueryResult(
+                rows=[joined_row(1, 10), joined_row(1, 11), joined_row(2, 12)],
+                fields=[{"name": label} for label in labels],
+                row_count=3,
+                command="SELECT",
+            )
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    fake = FakeClient()
+    engine._client = fake
+
+    compiles = []
+    original = sa.sql.Select.compile
+
+    def counting_compile(self, *args, **kwargs):
+        compiles.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(sa.sql.Select, "compile", counting_compile)
+
+    users = (await engine.execute(stmt)).scalars().all()
+
+    # The joined posts still get Post.tags, which loads with selectin by default.
+    assert len(fake.queries) == 2
+    # Result columns are read from the cached compilation, not a second one.
+    assert [c for c in compiles if c is stmt] == [stmt]
+    assert [(u.id, u.username) for u in users] == [(1, "user 1"), (2, "user 2")]
+    assert [p.id for p in users[0].posts] == [10, 11]
+    assert [p.title for p in users[1].posts] == ["post 12"]
+    assert [[t.name for t in p.tags] for p in users[0].posts] == [[], ["tag-a"]]
+    assert users[1].posts[0].tags == []
+
+
+@pytest.mark.asyncio
+async def test_native_engine_column_select_skips_entity_loading(
+    mock_connection_string: str,
+):
+    class FakeClient:
+        def __init__(self):
+            self.queries = []
+
+        async def query(self, sql, params, options=None):
+            self.queries.append(sql)
+            return QueryResult(
+                rows=[[10, "first", 1], [11, "second", 2]],
+                fields=[{"name": "id"}, {"name": "title"}, {"name": "author_id"}],
+                row_count=2,
+                command="SELECT",
+                row_as_array=True,
+            )
+
+    engine = NeonNativeAsyncEngine(mock_connection_string)
+    fake = FakeClient()
+    engine._client = fake
+
+    rows = (await engine.execute(post_summaries())).all()
+
+    # No follow-up query for Post.tags, which loads with selectin by default.
+    assert len(fake.queries) == 1
+    assert [tuple(row) for row in rows] == [(10, "first", 1), (11, "second", 2)]
@@ -24,6 +24,10 @@ from sqlalchemy_neon.pg_protocol import (
     AUTH_SASL_FINAL,
     BACKEND_KEY_MSG,
     COMMAND_COMPLETE_MSG,
+    COPY_DATA_MSG,
+    COPY_DONE_MSG,
+    COPY_FAIL_MSG,
+    COPY_IN_RESPONSE_MSG,
     DATA_ROW_MSG,
     EMPTY_QUERY_MSG,
     ERROR_RESPONSE_MSG,
@@ -144,6 +148,13 @@ def _empty_query() -> bytes:
     return _backend_msg(EMPTY_QUERY_MSG)
 
 
+def _copy_in_response(n_columns: int) -> bytes:
+    return _backend_msg(
+        COPY_IN_RESPONSE_MSG,
+        struct.pack("!bH", 1, n_columns) + struct.pack("!H", 1) * n_columns,
+    )
+
+
 def _startup_response_trust() -> bytes:
     """Full server response for trust auth startup."""
     return (
@@ -979,6 +990,76 @@ class TestPGProtocolExtendedQuery:
         assert result.rows[2] == [b"3"]
 
 
+class TestPGProtocolCopyFromStdin:
+    @pytest.mark.asyncio
+    async def test_copy_streams_chunks(self):
+        transport = MockTransport([_startup_response_trust()])
+        proto = PGProtocol(transport.send, transport.recv)
+        await proto.startup("u", "p", "db")
+
+        response = (
+            _copy_in_response(2) + _command_complete("COPY 2") + _ready_for_query()
+        )
+        transport._data.extend(response)
+        transport._pos = len(transport._data) - len(response)
+
+        sent_before = len(transport.sent)
+        result = await proto.copy_from_stdin(
+            "COPY t (a, b) FROM STDIN", [b"1\t2\n", b"3\t4\n"]
+        )
+
+        assert result.command_tag == "COPY 2"
+        sent = transport.sent[sent_before:]
+        assert [m[0] for m in sent] == [
+            ord("Q"),
+            COPY_DATA_MSG,
+            COPY_DATA_MSG,
+            COPY_DONE_MSG,
+        ]
+        assert sent[1][5:] == b"1\t2\n"
+        assert proto.transaction_status == "I"
+
+    @pytest.mark.asyncio
+    async def test_copy_statement_error_resyncs(self):
+        transport = MockTransport([_startup_response_trust()])
+        proto = PGProtocol(transport.send, transport.recv)
+        await proto.startup("u", "p", "db")
+
+        response = (
+            _error_response(code="42P01", message="relation does not exist")
+            + _ready_for_query()
+        )
+        transport._data.extend(response)
+        transport._pos = len(transport._data) - len(response)
+
+        with pytest.raises(NeonQueryError, match="relation does not exist"):
+            await proto.copy_from_stdin("COPY missing FROM STDIN", [b"x"])
+        assert proto.transaction_status == "I"
+
+    @pytest.mark.asyncio
+    async def test_copy_data_failure_aborts_copy(self):
+        transport = MockTransport([_startup_response_trust()])
+        proto = PGProtocol(transport.send, transport.recv)
+        await proto.startup("u", "p", "db")
+
+        response = (
+            _copy_in_response(1)
+            + _error_response(code="57014", message="COPY from stdin failed")
+            + _ready_for_query()
+        )
+        transport._data.extend(response)
+        transport._pos = len(transport._data) - len(response)
+
+        def chunks():
+            yield b"1\n"
+            raise ValueError("bad row")
+
+        with pytest.raises(ValueError, match="bad row"):
+            await proto.copy_from_stdin("COPY t FROM STDIN", chunks())
+        assert transport.sent[-1][0] == COPY_FAIL_MSG
+        assert proto.is_reusable
+
+
 class TestPGProtocolTerminate:
     @pytest.mark.asyncio
     async def test_terminate_sends_message(self):
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from sqlalchemy_neon import compile_sql
+from testsupport.models import User
+from testsupport.queries import equals_any
+
+
+def test_equals_any_binds_one_array_for_any_length():
+    cache: dict = {}
+
+    short = compile_sql(
+        sa.select(User.id).where(equals_any(User.id, [1, 2])), compiled_cache=cache
+    )
+    long = compile_sql(
+        sa.select(User.id).where(equals_any(User.id, range(5))), compiled_cache=cache
+    )
+
+    assert short[0] == long[0]
+    assert short[0].endswith("WHERE public.users.id = ANY ($1::INTEGER[])")
+    assert (short[1], long[1]) == ([[1, 2]], [[0, 1, 2, 3, 4]])
+    assert len(cache) == 1
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import Insert
+
+from sqlalchemy_neon import QueryResult
+from testsupport.models import Product
+from testsupport.seeding import (
+    COPY_MIN_ROWS,
+    TagIdCache,
+    _copy_text_chunks,
+    _post_tag_copy_chunks,
+    attach_tags,
+    copy_insert,
+    post_tag_inserts,
+)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class FakeTagEngine:
+    """Answers tag lookups from an in-memory ``name -> id`` table."""
+
+    def __init__(self, tags):
+        self.tags = tags
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        params = stmt.compile().params
+        if isinstance(stmt, Insert):
+            # ON CONFLICT DO NOTHING: only rows actually inserted come back.
+            created = []
+            for key, name in sorted(params.items()):
+                if name not in self.tags:
+                    self.tags[name] = len(self.tags) + 1
+                    created.append((name, self.tags[name]))
+            return FakeResult(created)
+        names = params["names"]
+        return FakeResult([(n, self.tags[n]) for n in names if n in self.tags])
+
+
+def test_post_tag_inserts_batch_rows_and_skip_conflicts():
+    statements = list(post_tag_inserts(((i, i) for i in range(5)), batch_size=2))
+
+    assert len(statements) == 3
+    sql = str(statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.endswith("ON CONFLICT DO NOTHING")
+    assert "post_id_m1" in sql
+
+
+@pytest.mark.asyncio
+async def test_attach_tags_writes_one_transaction():
+    class FakeEngine:
+        def __init__(self):
+            self.calls = []
+
+        async def transaction(self, statements, *, options=None):
+            self.calls.append((statements, options))
+            return []
+
+    engine = FakeEngine()
+    await attach_tags(engine, 7, [1, 2, 3])
+    await attach_tags(engine, 7, [])
+
+    assert len(engine.calls) == 1
+    statements, options = engine.calls[0]
+    assert options.read_only is False
+    [(stmt, params)] = statements
+    assert params is None
+    assert list(stmt.compile().params.values()) == [7, 1, 7, 2, 7, 3]
+
+
+def test_post_tag_copy_chunks_use_binary_copy_framing():
+    payload = b"".join(_post_tag_copy_chunks([(1, 2), (3, 4), (5, 6)], batch_size=2))
+
+    header = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+    rows = b"".join(
+        struct.pack("!hiiii", 2, 4, post_id, 4, tag_id)
+        for post_id, tag_id in [(1, 2), (3, 4), (5, 6)]
+    )
+    assert payload == header + rows + struct.pack("!h", -1)
+
+
+def test_copy_text_chunks_escape_cells():
+    rows = [(1, "a\tb\\c", None), (2, "x\ny", True)]
+
+    assert list(_copy_text_chunks(rows, batch_size=10)) == [
+        b"1\ta\\tb\\\\c\t\\N\n2\tx\\ny\tt\n"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_copy_insert_copies_only_large_batches():
+    class FakeEngine:
+        def __init__(self):
+            self.statements = []
+
+        async def transaction(self, statements, *, options=None):
+            self.statements.extend(stmt for stmt, _ in statements)
+            return []
+
+    class FakeCopyClient:
+        def __init__(self):
+            self.copies = []
+
+        async def copy_from_stdin(self, sql, data):
+            payload = b"".join(data)
+            self.copies.append((sql, payload))
+            return QueryResult(
+                rows=[], fields=[], row_count=payload.count(b"\n"), command="COPY"
+            )
+
+    engine, client = FakeEngine(), FakeCopyClient()
+    columns = ["name", "price_cents"]
+
+    few = [("a", 1), ("b", 2)]
+    written = await copy_insert(engine, Product.__table__, columns, few, client=client)
+    assert written == 2
+    assert len(engine.statements) == 1
+    assert client.copies == []
+
+    many = [(f"p{i}", i) for i in range(COPY_MIN_ROWS)]
+    assert await copy_insert(
+        engine, Product.__table__, columns, many, client=client
+    ) == COPY_MIN_ROWS
+    [(sql, _)] = client.copies
+    assert sql == "COPY public.products (name, price_cents) FROM STDIN"
+    assert len(engine.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_tag_id_cache_queries_only_misses():
+    engine = FakeTagEngine({"python": 1, "sql": 2})
+    cache = TagIdCache()
+
+    assert await cache.ids_for(engine, ["python", "python", "nope"]) == {"python": 1}
+    assert await cache.ids_for(engine, ["python", "sql"]) == {"python": 1, "sql": 2}
+    assert await cache.ids_for(engine, ["sql", "python"]) == {"sql": 2, "python": 1}
+
+    assert len(engine.statements) == 2
+    assert engine.statements[1].compile().params["names"] == ["sql"]
+
+
+@pytest.mark.asyncio
+async def test_tag_id_cache_ensure_ids_creates_missing_tags():
+    engine = FakeTagEngine({"python": 1})
+    cache = TagIdCache()
+
+    assert await cache.ensure_ids(engine, ["sql", "python", "sql"]) == {
+        "sql": 2,
+        "python": 1,
+    }
+    assert isinstance(engine.statements[0], Insert)
+    assert "ON CONFLICT (name) DO NOTHING RETURNING" in str(
+        engine.statements[0].compile(dialect=postgresql.dialect())
+    )
+    # "python" existed, so it came from the follow-up lookup.
+    assert engine.statements[1].compile().params["names"] == ["python"]
+
+    assert await cache.ensure_ids(engine, ["python", "sql"]) == {"python": 1, "sql": 2}
+    assert len(engine.statements) == 2
@@ -7,6 +7,8 @@ import uuid
 from decimal import Decimal
 
 import pytest
+from psycopg.adapt import PyFormat, Transformer
+from psycopg.types.json import Jsonb
 
 from sqlalchemy_neon.types import TypeConverter, PostgresOID, build_cursor_description
 
@@ -49,6 +51,10 @@ class TestTypeConverter:
         result = converter.python_to_pg(b"\xde\xad\xbe\xef")
         assert result == "\\xdeadbeef"
 
+    def test_python_to_pg_bytes_empty(self, converter: TypeConverter):
+        """Test empty bytes -> bare hex prefix."""
+        assert converter.python_to_pg(b"") == "\\x"
+
     def test_python_to_pg_date(self, converter: TypeConverter):
         """Test date conversion."""
         d = datetime.date(2024, 1, 15)
@@ -86,6 +92,27 @@ class TestTypeConverter:
         assert "key" in result
         assert "value" in result
 
+    def test_python_to_pg_dict_uses_orjson(self, converter: TypeConverter):
+        """Test JSON parameters are encoded with orjson when installed."""
+        pytest.importorskip("orjson")
+        assert converter.python_to_pg({"key": "value", "num": 42}) == (
+            '{"key":"value","num":42}'
+        )
+        assert converter.python_to_pg({"big": 2**70}) == '{"big": %d}' % 2**70
+
+    def test_json_encoder_not_installed_globally(self, converter: TypeConverter):
+        """Test the JSON encoder swap is scoped to the converter."""
+        value = Jsonb({"key": "value"})
+        dumper = Transformer().get_dumper(value, PyFormat.TEXT)
+        assert bytes(dumper.dump(value)) == b'{"key": "value"}'
+
+    def test_json_dumper_shared_across_converters(self, converter: TypeConverter):
+        """Test psycopg reuses one JSON dumper class for every converter."""
+        other = TypeConverter()
+        assert converter._adapters.get_dumper(
+            Jsonb, PyFormat.TEXT
+        ) is other._adapters.get_dumper(Jsonb, PyFormat.TEXT)
+
     def test_convert_params(self, converter: TypeConverter):
         """Test batch parameter conversion."""
         params = [1, "hello", True, None]
@@ -96,6 +123,12 @@ class TestTypeConverter:
         """Test None params returns empty list."""
         assert converter.convert_params(None) == []
 
+    def test_convert_params_bytes(self, converter: TypeConverter):
+        """Test batch parameter conversion to wire-protocol bytes."""
+        params = [1, "hello", b"\x01", None]
+        result = converter.convert_params_bytes(params)
+        assert result == [b"1", b"hello", b"\\x01", None]
+
     def test_pg_to_python_none(self, converter: TypeConverter):
         """Test NULL -> None conversion."""
         assert converter.pg_to_python(None, PostgresOID.TEXT) is None
@@ -116,6 +149,68 @@ class TestTypeConverter:
         result = converter.pg_to_python("hello", PostgresOID.TEXT)
         assert result == "hello"
 
+    def test_dumper_cached_by_type(self, converter: TypeConverter):
+        """Test dumpers are resolved once per Python type."""
+        assert converter.python_to_pg(1) == "1"
+        assert converter.python_to_pg(2**40) == str(2**40)
+        assert converter.python_to_pg("a") == "a"
+        assert set(converter._dumper_cache) == {int, str}
+
+    def test_value_dependent_dumpers_not_cached(self, converter: TypeConverter):
+        """Test naive/aware datetimes and lists keep per-value dumpers."""
+        naive = datetime.datetime(2024, 1, 15, 10, 30, 0)
+        aware = naive.replace(tzinfo=datetime.timezone.utc)
+        assert "+" not in converter.python_to_pg(naive)
+        assert "+00" in converter.python_to_pg(aware)
+        assert converter.python_to_pg([1, 2]) == "{1,2}"
+        assert converter.python_to_pg(["a", "b"]) == "{a,b}"
+        assert converter.python_to_pg(datetime.time(10, 30)) == "10:30:00"
+        cached = converter._dumper_cache
+        assert datetime.datetime not in cached
+        assert datetime.time not in cached
+        assert list not in cached
+
+    def test_loader_cached_by_oid(self, converter: TypeConverter):
+        """Test loaders are resolved once per OID."""
+        converter.pg_to_python("1", PostgresOID.INT4)
+        converter.pg_to_python("2", PostgresOID.INT4)
+        assert list(converter._loader_cache) == [PostgresOID.INT4]
+
+    def test_convert_rows_array_mode(self, converter: TypeConverter):
+        """Test whole-result-set conversion in array mode."""
+        fields = [
+            {"name": "id", "dataTypeID": PostgresOID.INT4},
+            {"name": "ok", "dataTypeID": PostgresOID.BOOL},
+        ]
+        rows = [["1", "t"], ["2", None]]
+        result = converter.convert_rows(rows, fields, array_mode=True)
+        assert result == [(1, True), (2, None)]
+        assert result == [converter.convert_row(r, fields, True) for r in rows]
+
+    def test_convert_rows_object_mode(self, converter: TypeConverter):
+        """Test whole-result-set conversion in object mode."""
+        fields = [{"name": "id", "dataTypeID": PostgresOID.INT4}]
+        rows = [{"id": "1", "extra": "x"}, {"id": None, "extra": None}]
+        result = converter.convert_rows(rows, fields)
+        assert result == [{"id": 1, "extra": "x"}, {"id": None, "extra": None}]
+        assert result == [converter.convert_row(r, fields) for r in rows]
+
+    def test_convert_wire_rows(self, converter: TypeConverter):
+        """Test raw wire-protocol cells are loaded without decoding."""
+        fields = [
+            {"name": "id", "dataTypeID": PostgresOID.INT4},
+            {"name": "name", "dataTypeID": PostgresOID.TEXT},
+        ]
+        rows = [[b"1", b"caf\xc3\xa9"], [b"2", None]]
+        assert converter.convert_wire_rows(rows, fields, array_mode=True) == [
+            (1, "caf\u00e9"),
+            (2, None),
+        ]
+        assert converter.convert_wire_rows(rows, fields) == [
+            {"id": 1, "name": "caf\u00e9"},
+            {"id": 2, "name": None},
+        ]
+
 
 class TestBuildCursorDescription:
     """Tests for build_cursor_description function."""
@@ -147,3 +242,11 @@ class TestBuildCursorDescription:
         assert len(result) == 2
         assert result[0][0] == "id"
         assert result[1][0] == "name"
+
+    def test_repeated_fields_share_description(self):
+        """Test identical field metadata reuses the built description."""
+        first = build_cursor_description([{"name": "id", "dataTypeID": 23}])
+        second = build_cursor_description([{"name": "id", "dataTypeID": 23}])
+
+        assert first is second
+        assert first == (("id", 23, None, -1, None, None, None),)
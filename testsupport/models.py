@@ -1,25 +1,29 @@
 import sqlalchemy as sa
 from sqlalchemy import (
+    BigInteger,
     Boolean,
+    CheckConstraint,
     Column,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     MetaData,
     Numeric,
-    String,
     Table,
     Text,
     text,
     UUID as SQLAlchemyUUID,
+    func,
 )
-from datetime import date, datetime, UTC
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
-from uuid import UUID, uuid4
+from typing import ClassVar, Optional
+from uuid import UUID
 
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import (
     DeclarativeBase,
     Mapped,
@@ -44,12 +48,30 @@ __all__ = (
 
 _meta = MetaData(schema="public")
 
+# Timestamps are stored as naive UTC (TIMESTAMP WITHOUT TIME ZONE) and generated
+# by the database instead of per row in Python.
+_NaiveDateTime = DateTime(timezone=False)
+_UTC_NOW = text("timezone('utc', now())")
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
 
     metadata = _meta
 
+    # Attributes shown by ``repr()``.
+    _repr_attrs: ClassVar[tuple[str, ...]] = ("id",)
+
+    def __repr__(self) -> str:
+        # Read loaded state only, so logging an instance never triggers a lazy
+        # load or an expired-attribute refresh; unloaded values show as ``?``.
+        loaded = self.__dict__
+        fields = ", ".join(
+            f"{key}={loaded[key]!r}" if key in loaded else f"{key}=?"
+            for key in self._repr_attrs
+        )
+        return f"<{type(self).__name__}({fields})>"
+
 
 # Many-to-many association table - defined before the models that use it
 post_tags = Table(
@@ -61,6 +83,8 @@ post_tags = Table(
     Column(
         "tag_id", Integer, ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
     ),
+    # The (post_id, tag_id) primary key can't serve lookups from the tag side.
+    Index("ix_post_tags_tag_id", "tag_id"),
 )
 
 
@@ -68,81 +92,139 @@ class User(Base):
     """User model with various column types."""
 
     __tablename__ = "users"
+    # jsonb_path_ops only serves containment, so match nested keys with
+    # ``profile @> '{"verified": true}'``, not ``profile['verified'] == ...``.
+    __table_args__ = (
+        Index(
+            "ix_users_profile_gin",
+            "profile",
+            postgresql_using="gin",
+            postgresql_ops={"profile": "jsonb_path_ops"},
+        ),
+        # Usernames only need to be unique among active accounts. Indexing
+        # just that hot set keeps the login lookup small, and the INCLUDE
+        # columns let it be answered with an index-only scan.
+        Index(
+            "ux_users_active_username",
+            "username",
+            unique=True,
+            postgresql_where=text("is_active"),
+            postgresql_include=["email", "full_name"],
+        ),
+        # Strings are unbounded TEXT and validated by the application; only
+        # the RFC 5321 address limit is kept in the database.
+        CheckConstraint("char_length(email) <= 255", name="ck_users_email_len"),
+    )
+    # Callers read the generated uuid back right after inserting.
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True)
+    # Generated by the server (built in since PostgreSQL 13, no pgcrypto) and
+    # read back through RETURNING, so no uuid4() runs per inserted row.
     uuid: Mapped[UUID] = mapped_column(
-        SQLAlchemyUUID(as_uuid=True), server_default=text("gen_random_uuid()"), unique=True
-    )  # For testing UUID column server default
-    username: Mapped[str] = mapped_column(String(50), nullable=False)
-    email: Mapped[str] = mapped_column(String(255), nullable=False)
-    full_name: Mapped[Optional[str]] = mapped_column(String(100))
+        SQLAlchemyUUID(as_uuid=True),
+        server_default=func.gen_random_uuid(),
+        unique=True,
+    )
+    username: Mapped[str] = mapped_column(Text, nullable=False)
+    email: Mapped[str] = mapped_column(Text, nullable=False)
+    full_name: Mapped[Optional[str]] = mapped_column(Text)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None)
+        _NaiveDateTime, server_default=_UTC_NOW
     )
     birth_date: Mapped[Optional[date]] = mapped_column(Date)
     profile: Mapped[Optional[dict]] = mapped_column(JSONB)
 
     # Relationships
+    # The foreign keys cascade in the database (ondelete="CASCADE"), so the
+    # ORM neither loads these collections nor deletes them row by row.
     posts: Mapped[list["Post"]] = relationship(
-        back_populates="author", cascade="all, delete-orphan"
+        back_populates="author", cascade="all, delete-orphan", passive_deletes=True
+    )
+    comments: Mapped[list["Comment"]] = relationship(
+        back_populates="author", passive_deletes=True
     )
-    comments: Mapped[list["Comment"]] = relationship(back_populates="author")
 
-    def __repr__(self) -> str:
-        return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
+    _repr_attrs = ("id", "username", "email")
 
 
 class Post(Base):
     """Post model with foreign key relationships."""
 
     __tablename__ = "posts"
+    # PostgreSQL doesn't index referencing columns; relationship loads and
+    # ON DELETE CASCADE probes would otherwise scan the table.
+    __table_args__ = (
+        Index("ix_posts_author_id", "author_id"),
+        # Covers "published posts by author" listings as an index-only scan
+        # while indexing only the published subset.
+        Index(
+            "ix_posts_author_published",
+            "author_id",
+            postgresql_where=text("published"),
+            postgresql_include=["title", "created_at"],
+        ),
+        # view_count and updated_at make posts update-heavy; page slack lets
+        # those updates stay HOT instead of moving rows and touching indexes.
+        {"postgresql_with": {"fillfactor": 80}},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
     content: Mapped[str] = mapped_column(Text)
     author_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     published: Mapped[bool] = mapped_column(Boolean, default=False)
     view_count: Mapped[int] = mapped_column(Integer, default=0)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None)
+        _NaiveDateTime, server_default=_UTC_NOW
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime, onupdate=lambda: datetime.now(UTC).replace(tzinfo=None)
+        _NaiveDateTime, onupdate=func.timezone("utc", func.now())
     )
 
     # Relationships
     author: Mapped["User"] = relationship(back_populates="posts")
     comments: Mapped[list["Comment"]] = relationship(
-        back_populates="post", cascade="all, delete-orphan"
+        back_populates="post", cascade="all, delete-orphan", passive_deletes=True
     )
+    # One IN (...) query per batch of posts instead of one per post; joined
+    # loading would multiply the post rows by their tag count.
     tags: Mapped[list["Tag"]] = relationship(
-        secondary=post_tags, back_populates="posts"
+        secondary=post_tags,
+        back_populates="posts",
+        lazy="selectin",
+        passive_deletes=True,
     )
 
-    def __repr__(self) -> str:
-        return f"<Post(id={self.id}, title='{self.title}', author_id={self.author_id})>"
+    _repr_attrs = ("id", "title", "author_id")
 
 
 class Comment(Base):
     """Comment model for testing nested relationships."""
 
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_post_id_created_at", "post_id", "created_at"),
+        Index("ix_comments_author_id", "author_id"),
+    )
+    # created_at is rarely read right after an insert; only the id is
+    # returned, and the timestamp loads with the next SELECT.
+    __mapper_args__ = {"eager_defaults": False}
 
     id: Mapped[int] = mapped_column(primary_key=True)
     content: Mapped[str] = mapped_column(Text, nullable=False)
     post_id: Mapped[int] = mapped_column(ForeignKey("posts.id", ondelete="CASCADE"))
     author_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None)
+        _NaiveDateTime, server_default=_UTC_NOW
     )
 
     # Relationships
     post: Mapped["Post"] = relationship(back_populates="comments")
     author: Mapped["User"] = relationship(back_populates="comments")
 
-    def __repr__(self) -> str:
-        return f"<Comment(id={self.id}, post_id={self.post_id}, author_id={self.author_id}, author='{self.author}')>"
+    _repr_attrs = ("id", "post_id", "author_id")
 
 
 class Tag(Base):
@@ -151,31 +233,55 @@ class Tag(Base):
     __tablename__ = "tags"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
+    name: Mapped[str] = mapped_column(Text, unique=True, nullable=False)
 
     # Relationships
     posts: Mapped[list["Post"]] = relationship(
-        secondary=post_tags, back_populates="tags"
+        secondary=post_tags,
+        back_populates="tags",
+        lazy="selectin",
+        passive_deletes=True,
     )
 
-    def __repr__(self) -> str:
-        return f"<Tag(id={self.id}, name='{self.name}')>"
+    _repr_attrs = ("id", "name")
 
 
 class Product(Base):
     """Product model for testing numeric types."""
 
     __tablename__ = "products"
+    __table_args__ = (
+        Index(
+            "ix_products_metadata_gin",
+            "metadata_",
+            postgresql_using="gin",
+            postgresql_ops={"metadata_": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(100), nullable=False)
-    price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    # Stored as integer cents so loading a row never builds a Decimal;
+    # ``price`` converts at the boundary and in SQL stays NUMERIC.
+    price_cents: Mapped[int] = mapped_column(BigInteger, nullable=False)
     stock: Mapped[int] = mapped_column(Integer, default=0)
     in_stock: Mapped[bool] = mapped_column(Boolean, default=True)
     metadata_: Mapped[Optional[dict]] = mapped_column(JSONB)
 
-    def __repr__(self) -> str:
-        return f"<Product(id={self.id}, name='{self.name}', price={self.price})>"
+    @hybrid_property
+    def price(self) -> Decimal:
+        return Decimal(self.price_cents).scaleb(-2)
+
+    @price.inplace.setter
+    def _price_setter(self, value: Decimal) -> None:
+        self.price_cents = int(Decimal(value).scaleb(2).to_integral_value())
+
+    @price.inplace.expression
+    @classmethod
+    def _price_expression(cls) -> sa.ColumnElement[Decimal]:
+        return sa.cast(cls.price_cents, Numeric(12, 2)) / 100
+
+    _repr_attrs = ("id", "name", "price_cents")
 
 
 class ComplexData(Base):
@@ -184,15 +290,14 @@ class ComplexData(Base):
     __tablename__ = "complex_data"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
     data_json: Mapped[Optional[dict]] = mapped_column(sa.JSON)
     data_jsonb: Mapped[Optional[dict]] = mapped_column(JSONB)
     metadata_jsonb: Mapped[Optional[dict]] = mapped_column(JSONB)
     data_bytea: Mapped[Optional[bytes]] = mapped_column(sa.LargeBinary)
     data_text: Mapped[Optional[str]] = mapped_column(sa.Text)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC).replace(tzinfo=None)
+        _NaiveDateTime, server_default=_UTC_NOW
     )
 
-    def __repr__(self) -> str:
-        return f"<ComplexData(id={self.id}, name='{self.name}')>"
+    _repr_attrs = ("id", "name")
@@ -0,0 +1,22 @@
+"""Unique names for rows created by tests."""
+
+from __future__ import annotations
+
+import itertools
+import secrets
+
+# One random seed per process keeps names distinct across runs and parallel
+# workers; the counter keeps them distinct within a run without drawing
+# fresh entropy for every name.
+_SESSION_SEED = secrets.token_hex(3)
+_COUNTER = itertools.count()
+
+
+def unique_suffix() -> str:
+    """Return a short suffix no test process has returned before.
+
+    Returns:
+        The per-process seed followed by a counter, as at least ten hex
+        characters.
+    """
+    return f"{_SESSION_SEED}{next(_COUNTER):04x}"
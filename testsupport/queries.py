@@ -0,0 +1,63 @@
+"""Reusable query shapes over the test models."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import contains_eager
+
+from testsupport.models import Post, User
+
+
+def equals_any(
+    column: sa.ColumnElement[Any], values: Iterable[Any]
+) -> sa.ColumnElement[bool]:
+    """Match ``column`` against a list bound as one array parameter.
+
+    Renders ``column = ANY(:param)`` instead of an expanding ``IN``, whose
+    SQL grows with the list: the statement compiles and caches once for any
+    number of values and the list travels as a single parameter.
+
+    Args:
+        column: Column to filter on; its type types the array elements.
+        values: Values to match.
+
+    Returns:
+        A boolean clause for ``.where()``.
+    """
+    return column == sa.any_(sa.bindparam(None, list(values), type_=ARRAY(column.type)))
+
+
+def users_with_posts_and_comments() -> sa.Select[tuple[User]]:
+    """Select users with their posts and comments from a single join.
+
+    ``contains_eager`` fills the collections from the joined rows. Adding
+    ``joinedload`` for a relationship the query already joins through would
+    join it a second time and multiply the rows again.
+
+    Returns:
+        A select of ``User``; call ``.unique()`` on the result, since each
+        user appears once per comment.
+    """
+    return (
+        sa.select(User)
+        .join(User.posts)
+        .join(Post.comments)
+        .options(contains_eager(User.posts).contains_eager(Post.comments))
+    )
+
+
+def post_summaries() -> sa.Select[tuple[int, str, int]]:
+    """Select the columns a post listing needs, as plain rows.
+
+    Selecting ``Post`` would build one entity per row and, because
+    ``Post.tags`` loads with ``selectin`` by default, send a second query for
+    the tags. Listings only show these columns, so read them as tuples.
+
+    Returns:
+        A select of ``(id, title, author_id)`` ordered by id.
+    """
+    return sa.select(Post.id, Post.title, Post.author_id).order_by(Post.id)
@@ -0,0 +1,297 @@
+"""Bulk seeding helpers for the test models."""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY, Insert, insert
+from sqlalchemy.util import LRUCache
+from sqlalchemy_neon import NeonNativeAsyncEngine, TransactionOptions, TypeConverter
+from sqlalchemy_neon.neon_http_client import (
+    AsyncNeonWebSocketClient,
+    AsyncNeonWebSocketPool,
+)
+
+from testsupport.models import Tag, post_tags
+
+SEED_BATCH_SIZE = 1000
+# Below this many rows COPY's extra setup outweighs skipping INSERT parsing.
+COPY_MIN_ROWS = 100
+
+# Binary COPY framing: signature, flags, header-extension length, then one
+# (field count, int4 length, int4, int4 length, int4) tuple per edge.
+_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_COPY_BINARY_TRAILER = struct.pack("!h", -1)
+_POST_TAG_ROW = struct.Struct("!hiiii")
+
+# Built once at import; ``.values()`` and friends derive new statements from
+# these without rebuilding the base construct on every call.
+_INSERT_POST_TAGS = insert(post_tags)
+_INSERT_TAG = insert(Tag)
+
+_PREPARER = postgresql.dialect().identifier_preparer
+_COPY_POST_TAGS = (
+    f"COPY {_PREPARER.format_table(post_tags)} (post_id, tag_id) "
+    "FROM STDIN WITH (FORMAT BINARY)"
+)
+_TYPE_CONVERTER = TypeConverter()
+# Text COPY format: backslash escapes for the delimiter, line breaks and the
+# escape character itself; NULL is ``\N``.
+_COPY_TEXT_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def post_tag_inserts(
+    links: Iterable[tuple[int, int]],
+    batch_size: int = SEED_BATCH_SIZE,
+) -> Iterator[Insert]:
+    """Yield multi-row ``post_tags`` inserts that skip existing links.
+
+    Args:
+        links: ``(post_id, tag_id)`` pairs, consumed lazily.
+        batch_size: Maximum number of rows per statement.
+
+    Returns:
+        An iterator of ``INSERT ... ON CONFLICT DO NOTHING`` statements.
+    """
+    links = iter(links)
+    while chunk := list(islice(links, batch_size)):
+        rows = [{"post_id": post_id, "tag_id": tag_id} for post_id, tag_id in chunk]
+        yield _INSERT_POST_TAGS.values(rows).on_conflict_do_nothing()
+
+
+async def attach_tag_links(
+    engine: NeonNativeAsyncEngine,
+    links: Iterable[tuple[int, int]],
+    batch_size: int = SEED_BATCH_SIZE,
+) -> None:
+    """Link posts to tags with multi-row inserts in one transaction.
+
+    Existing links are skipped, so re-attaching a tag is a no-op.
+
+    Args:
+        engine: Engine to write through.
+        links: ``(post_id, tag_id)`` pairs, e.g. the product of N posts and
+            M tags flattened into one list.
+        batch_size: Maximum number of rows per statement.
+    """
+    statements = [(stmt, None) for stmt in post_tag_inserts(links, batch_size)]
+    if statements:
+        await engine.transaction(
+            statements, options=TransactionOptions(read_only=False)
+        )
+
+
+async def attach_tags(
+    engine: NeonNativeAsyncEngine, post_id: int, tag_ids: Iterable[int]
+) -> None:
+    """Link one post to several tags in a single round trip.
+
+    Args:
+        engine: Engine to write through.
+        post_id: Post to tag.
+        tag_ids: Tags to attach; already attached ones are skipped.
+    """
+    await attach_tag_links(engine, ((post_id, tag_id) for tag_id in tag_ids))
+
+
+def _post_tag_copy_chunks(
+    links: Iterable[tuple[int, int]],
+    batch_size: int,
+) -> Iterator[bytes]:
+    links = iter(links)
+    pack = _POST_TAG_ROW.pack
+    chunk = bytearray(_COPY_BINARY_HEADER)
+    while rows := list(islice(links, batch_size)):
+        for post_id, tag_id in rows:
+            chunk += pack(2, 4, post_id, 4, tag_id)
+        yield bytes(chunk)
+        chunk.clear()
+    yield bytes(chunk) + _COPY_BINARY_TRAILER
+
+
+async def copy_post_tags(
+    client: AsyncNeonWebSocketClient | AsyncNeonWebSocketPool,
+    links: Iterable[tuple[int, int]],
+    batch_size: int = SEED_BATCH_SIZE,
+) -> int:
+    """Bulk-load ``post_tags`` edges with a binary ``COPY FROM STDIN``.
+
+    Faster than :func:`post_tag_inserts` for large edge lists, but unlike it
+    fails on duplicate links and needs a WebSocket connection.
+
+    Args:
+        client: WebSocket client or pool to copy through.
+        links: ``(post_id, tag_id)`` pairs, consumed lazily.
+        batch_size: Number of rows packed into each CopyData message.
+
+    Returns:
+        The number of rows copied.
+    """
+    result = await client.copy_from_stdin(
+        _COPY_POST_TAGS, _post_tag_copy_chunks(links, batch_size)
+    )
+    return result.row_count
+
+
+def _copy_text_chunks(
+    rows: Iterable[Sequence[Any]],
+    batch_size: int,
+) -> Iterator[bytes]:
+    rows = iter(rows)
+    to_pg = _TYPE_CONVERTER.python_to_pg
+    while chunk := list(islice(rows, batch_size)):
+        lines = []
+        for row in chunk:
+            cells = (to_pg(value) for value in row)
+            lines.append(
+                "\t".join(
+                    "\\N" if cell is None else cell.translate(_COPY_TEXT_ESCAPES)
+                    for cell in cells
+                )
+            )
+        lines.append("")
+        yield "\n".join(lines).encode()
+
+
+async def copy_insert(
+    engine: NeonNativeAsyncEngine,
+    table: sa.Table,
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    *,
+    client: AsyncNeonWebSocketClient | AsyncNeonWebSocketPool | None = None,
+    batch_size: int = SEED_BATCH_SIZE,
+) -> int:
+    """Insert plain rows, with ``COPY FROM STDIN`` when it pays off.
+
+    Rows go through COPY when a WebSocket ``client`` is given and there are
+    at least :data:`COPY_MIN_ROWS` of them; otherwise they are written with
+    multi-row ``INSERT`` statements in one transaction. Neither path reads
+    generated values back.
+
+    Args:
+        engine: Engine for the ``INSERT`` fallback.
+        table: Target table.
+        columns: Column names, in the order of the values in each row.
+        rows: Row values.
+        client: WebSocket client or pool to copy through, if any.
+        batch_size: Rows per CopyData message or ``INSERT`` statement.
+
+    Returns:
+        The number of rows written.
+    """
+    if not rows:
+        return 0
+    if client is not None and len(rows) >= COPY_MIN_ROWS:
+        sql = "COPY {} ({}) FROM STDIN".format(
+            _PREPARER.format_table(table),
+            ", ".join(_PREPARER.quote(column) for column in columns),
+        )
+        result = await client.copy_from_stdin(sql, _copy_text_chunks(rows, batch_size))
+        return result.row_count
+
+    statements = [
+        (
+            sa.insert(table).values(
+                [dict(zip(columns, row)) for row in rows[start : start + batch_size]]
+            ),
+            None,
+        )
+        for start in range(0, len(rows), batch_size)
+    ]
+    await engine.transaction(statements, options=TransactionOptions(read_only=False))
+    return len(rows)
+
+
+class TagIdCache:
+    """Process-local ``Tag.name -> Tag.id`` lookups.
+
+    Tags are a small, read-mostly table touched by every post-with-tags
+    insert, so resolved ids are kept in an LRU and misses are fetched in one
+    ``name = ANY(...)`` query. Only found tags are cached and tags are never
+    renamed, so new tags need no invalidation; call :meth:`clear` after
+    deleting tags.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        self._ids: LRUCache[str, int] = LRUCache(capacity)
+
+    def clear(self) -> None:
+        """Forget every cached id."""
+        self._ids.clear()
+
+    def _cached(self, names: Iterable[str]) -> tuple[dict[str, int], list[str]]:
+        found: dict[str, int] = {}
+        missing: list[str] = []
+        for name in dict.fromkeys(names):
+            tag_id = self._ids.get(name)
+            if tag_id is None:
+                missing.append(name)
+            else:
+                found[name] = tag_id
+        return found, missing
+
+    def _remember(self, found: dict[str, int], rows: Iterable[Any]) -> None:
+        for name, tag_id in rows:
+            self._ids[name] = tag_id
+            found[name] = tag_id
+
+    async def ids_for(
+        self, engine: NeonNativeAsyncEngine, names: Iterable[str]
+    ) -> dict[str, int]:
+        """Resolve tag names to ids, querying only the uncached ones.
+
+        Args:
+            engine: Engine used for the lookup query.
+            names: Tag names; duplicates are looked up once.
+
+        Returns:
+            A ``name -> id`` mapping; names with no tag are left out.
+        """
+        found, missing = self._cached(names)
+        if missing:
+            names_param = sa.bindparam("names", missing, type_=ARRAY(sa.Text))
+            result = await engine.execute(
+                sa.select(Tag.name, Tag.id).where(Tag.name == sa.any_(names_param))
+            )
+            self._remember(found, result.all())
+        return found
+
+    async def ensure_ids(
+        self, engine: NeonNativeAsyncEngine, names: Iterable[str]
+    ) -> dict[str, int]:
+        """Get-or-create tags by name in at most two round trips.
+
+        Uncached names are inserted in one ``ON CONFLICT (name) DO NOTHING
+        RETURNING`` statement; tags that already existed return no row there
+        and are fetched with one follow-up lookup.
+
+        Args:
+            engine: Engine used for the insert and lookup.
+            names: Tag names; duplicates are created once.
+
+        Returns:
+            A ``name -> id`` mapping covering every name.
+        """
+        found, missing = self._cached(names)
+        if not missing:
+            return found
+
+        # Sorted so concurrent callers take the unique-index locks in order.
+        result = await engine.execute(
+            _INSERT_TAG.values([{"name": name} for name in sorted(missing)])
+            .on_conflict_do_nothing(index_elements=[Tag.name])
+            .returning(Tag.name, Tag.id)
+        )
+        self._remember(found, result.all())
+        existing = [name for name in missing if name not in found]
+        if existing:
+            found.update(await self.ids_for(engine, existing))
+        return found